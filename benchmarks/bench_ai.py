@@ -0,0 +1,78 @@
+"""
+Mede o custo de atualizar a IA de muitos monstros espalhados por um mundo largo,
+com e sem o AIScheduler (nível de detalhe por distância ao jogador).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_ai --count 1000 --frames 300
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def _spawn(count: int, world_width: int) -> pygame.sprite.Group:
+    from characters.monster import Monster
+
+    rng = random.Random(0)
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        group.add(Monster(rng.randint(0, world_width), SCREEN_HEIGHT - 140))
+    return group
+
+
+def _measure(monsters: pygame.sprite.Group, scheduler, player_rect: pygame.Rect, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        scheduler.begin_frame()
+        for monster in monsters:
+            steps = scheduler.steps_for(monster, player_rect)
+            if steps:
+                monster.update(steps)
+    return 1000 * (time.perf_counter() - start) / frames
+
+
+def run(count: int = 1000, frames: int = 300, world_width: int = SCREEN_WIDTH * 40) -> dict:
+    """
+    Retorna o tempo médio por frame (ms) da IA dos monstros sem e com o escalonador,
+    e quantos monstros ficaram em cada faixa de distância no último frame.
+    """
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from world.ai_scheduler import AIScheduler
+
+    player_rect = pygame.Rect(world_width // 2, SCREEN_HEIGHT - 150, 50, 100)
+
+    full = AIScheduler(enabled=False)
+    full_ms = _measure(_spawn(count, world_width), full, player_rect, frames)
+
+    lod = AIScheduler()
+    lod_ms = _measure(_spawn(count, world_width), lod, player_rect, frames)
+
+    return {"count": count, "full_ms": full_ms, "lod_ms": lod_ms, "tiers": dict(lod.counts)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--world-width", type=int, default=SCREEN_WIDTH * 40)
+    args = parser.parse_args()
+
+    result = run(args.count, args.frames, args.world_width)
+    print(f"Monstros: {result['count']}")
+    print(f"IA completa: {result['full_ms']:.3f} ms/frame")
+    print(f"Com nível de detalhe: {result['lod_ms']:.3f} ms/frame")
+    tiers = result["tiers"]
+    print(f"Perto: {tiers['near']} | Longe: {tiers['far']} | Dormindo: {tiers['asleep']}")
+
+
+if __name__ == "__main__":
+    main()
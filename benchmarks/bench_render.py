@@ -0,0 +1,109 @@
+"""
+Mede o desenho de muitos sprites visíveis: Group.draw grupo a grupo (como era o
+Environment.draw) contra a RenderQueue, com e sem o agrupamento por textura,
+e a RenderQueue na metade da resolução, já contando o custo de esticar para a janela.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_render --count 2000 --frames 200
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# (imagem, tamanho, camada) de cada tipo de sprite do cenário
+_KINDS = (
+    ("assets/images/platform.png", (150, 30), 0),
+    ("assets/images/tree.png", (120, 180), 1),
+    ("assets/images/monster.png", (90, 90), 2),
+    ("assets/images/fireball.png", (40, 40), 3),
+    ("assets/images/coin.png", (40, 40), 4),
+)
+
+
+def _spawn(count: int) -> list[pygame.sprite.Group]:
+    from core.asset_manager import asset_manager
+
+    rng = random.Random(0)
+    groups = [pygame.sprite.Group() for _ in _KINDS]
+    for i in range(count):
+        kind = rng.randrange(len(_KINDS))
+        path, size, _ = _KINDS[kind]
+        sprite = pygame.sprite.Sprite()
+        sprite.image = asset_manager.get_image(path, size)
+        # Intercalados dentro do grupo, como ficam depois de drops e chunks carregados
+        sprite.rect = sprite.image.get_rect(topleft=(rng.randint(0, SCREEN_WIDTH - size[0]), rng.randint(0, SCREEN_HEIGHT - size[1])))
+        groups[kind].add(sprite)
+    return groups
+
+
+def _measure(draw, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return 1000 * (time.perf_counter() - start) / frames
+
+
+def run(count: int = 2000, frames: int = 200) -> dict:
+    """Tempo médio por frame (ms) de cada forma de desenhar `count` sprites visíveis."""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    from core.render_queue import RenderQueue
+    from core.render_scale import RenderScaler
+
+    groups = _spawn(count)
+    view_rect = screen.get_rect()
+
+    def group_draw() -> None:
+        for group in groups:
+            group.draw(screen)
+
+    def queue_draw(queue: RenderQueue, target: pygame.Surface = screen) -> None:
+        scale = target.get_width() / screen.get_width()
+        queue.begin(view_rect, scale)
+        for group, (_, _, layer) in zip(groups, _KINDS):
+            queue.add_sprites(group, layer)
+        queue.flush(target)
+
+    scaler = RenderScaler(screen.get_size(), scale=0.5)
+    def half_scale_draw() -> None:
+        queue_draw(unsorted_queue, scaler.surface())
+        scaler.present(screen)
+
+    sorted_queue = RenderQueue(sort_textures=True)
+    unsorted_queue = RenderQueue(sort_textures=False)
+    group_draw() # Aquece conversões e caches fora da medição
+    half_scale_draw()
+    return {
+        "count": count,
+        "group_draw_ms": _measure(group_draw, frames),
+        "queue_ms": _measure(lambda: queue_draw(sorted_queue), frames),
+        "queue_unsorted_ms": _measure(lambda: queue_draw(unsorted_queue), frames),
+        "queue_half_scale_ms": _measure(half_scale_draw, frames),
+        "batches": sorted_queue.batches
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    result = run(args.count, args.frames)
+    print(f"Sprites visíveis: {result['count']}")
+    print(f"Group.draw por grupo: {result['group_draw_ms']:.3f} ms/frame")
+    print(f"RenderQueue: {result['queue_ms']:.3f} ms/frame ({result['batches']} chamadas blits)")
+    print(f"RenderQueue sem agrupar texturas: {result['queue_unsorted_ms']:.3f} ms/frame")
+    print(f"RenderQueue com escala 0.5: {result['queue_half_scale_ms']:.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
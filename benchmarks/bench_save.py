@@ -0,0 +1,100 @@
+"""
+Mede o custo, na thread principal, de uma chamada de salvamento com milhares de elementos.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_save --entities 5000 --repeat 20
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def _build_environment(entities: int):
+    from world.environment import Environment
+    from world.coin import Coin
+    from world.tree import Tree
+    from characters.monster import Monster
+
+    environment = Environment()
+    rng = random.Random(0)
+    for i in range(entities):
+        x = rng.randint(0, SCREEN_WIDTH - 40)
+        y = rng.randint(0, SCREEN_HEIGHT - 90)
+        kind = i % 3
+        if kind == 0:
+            environment.coins.add(Coin(x, y))
+        elif kind == 1:
+            environment.monsters.add(Monster(x, y))
+        else:
+            environment.trees.add(Tree(x, y))
+    return environment
+
+
+def run(entities: int = 5000, repeat: int = 20) -> dict:
+    """
+    Retorna os tempos médios (ms) na thread principal para:
+    snapshot (to_dict), salvamento síncrono e salvamento assíncrono (snapshot + enfileirar).
+    """
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    from characters.player import Player
+    from save_system.save_load import SaveLoad
+
+    player = Player(100, 100)
+    environment = _build_environment(entities)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        save_load = SaveLoad()
+        save_load.save_file_path = os.path.join(temp_dir, "bench_save.json")
+
+        snapshot_total = sync_total = async_total = 0.0
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            snapshot = {"player": player.to_dict(), "environment": environment.to_dict()}
+            t1 = time.perf_counter()
+            save_load.save_game(snapshot)
+            t2 = time.perf_counter()
+            snapshot = {"player": player.to_dict(), "environment": environment.to_dict()}
+            save_load.save_game_async(snapshot)
+            t3 = time.perf_counter()
+            save_load.wait_until_idle()
+
+            snapshot_total += t1 - t0
+            sync_total += t2 - t1
+            async_total += t3 - t2
+        save_load.shutdown()
+    environment.release_resources()
+
+    return {
+        "entities": entities,
+        "snapshot_ms": 1000 * snapshot_total / repeat,
+        "save_sync_ms": 1000 * (snapshot_total + sync_total) / repeat,
+        "save_async_main_thread_ms": 1000 * async_total / repeat
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    result = run(args.entities, args.repeat)
+    print(f"Elementos: {result['entities']}")
+    print(f"Snapshot (to_dict): {result['snapshot_ms']:.2f} ms")
+    print(f"Salvamento síncrono: {result['save_sync_ms']:.2f} ms")
+    print(f"Salvamento assíncrono (thread principal): {result['save_async_main_thread_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Roda os cenários de benchmark, grava os resultados em JSON e compara com uma baseline.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.runner --output bench_results.json
+    python -m benchmarks.runner --save-baseline              # grava a baseline desta máquina
+    python -m benchmarks.runner --quick --only sword_update collision_storm
+
+Com uma baseline, cada métrica "_ms" mais lenta que baseline * (1 + threshold)
+é marcada como regressão e o processo termina com código 1.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.scenarios import SCENARIOS
+from world.worldgen import shutdown_pool
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.20 # 20% mais lento que a baseline conta como regressão
+
+
+def _environment_info() -> dict:
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy_version,
+        "platform": platform.platform()
+    }
+
+
+def run_scenarios(names: list[str], quick: bool = False, verbose: bool = False) -> dict:
+    """
+    Roda os cenários indicados e retorna {"meta": ..., "results": {cenário: métricas}}.
+    A saída dos prints do jogo é descartada, salvo com `verbose`.
+    """
+    pygame.init()
+    results = {}
+    for name in names:
+        print(f"- {name}...", flush=True)
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        random.seed(0) # Mesmo mundo gerado (semente, posições) em todas as execuções
+        with output:
+            results[name] = SCENARIOS[name](quick)
+    return {"meta": dict(_environment_info(), quick=quick), "results": results}
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    Compara as métricas de tempo ("_ms") presentes nos dois resultados.
+    Returns:
+        list[dict]: Uma entrada por métrica, com baseline, atual, razão e se é regressão.
+    """
+    rows = []
+    for scenario, metrics in current["results"].items():
+        base_metrics = baseline.get("results", {}).get(scenario, {})
+        for metric, value in metrics.items():
+            base_value = base_metrics.get(metric)
+            if not metric.endswith("_ms") or base_value is None or base_value <= 0:
+                continue
+            ratio = value / base_value
+            rows.append({
+                "scenario": scenario,
+                "metric": metric,
+                "baseline": base_value,
+                "current": value,
+                "ratio": ratio,
+                "regression": ratio > 1.0 + threshold
+            })
+    return rows
+
+
+def _write_json(path: str, data: dict) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="Roda só estes cenários.")
+    parser.add_argument("--quick", action="store_true", help="Tamanhos e repetições menores (checagem rápida).")
+    parser.add_argument("--output", default="bench_results.json", help="Arquivo JSON com os resultados.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline usada na comparação.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Fração de lentidão aceita antes de acusar regressão (0.2 = 20%%).")
+    parser.add_argument("--save-baseline", action="store_true", help="Grava os resultados também como baseline.")
+    parser.add_argument("--verbose", action="store_true", help="Mostra os prints do jogo durante os cenários.")
+    args = parser.parse_args(argv)
+
+    current = run_scenarios(args.only or list(SCENARIOS), args.quick, args.verbose)
+    shutdown_pool()
+    _write_json(args.output, current)
+    print(f"Resultados gravados em {args.output}")
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("quick") != current["meta"]["quick"]:
+            print("Aviso: a baseline foi gravada com outro modo (--quick); a comparação não é confiável.")
+        rows = compare(current, baseline, args.threshold)
+        for row in rows:
+            mark = "REGRESSÃO" if row["regression"] else "ok"
+            print(f"{row['scenario']}.{row['metric']}: {row['baseline']:.3f} -> {row['current']:.3f} ms "
+                  f"({row['ratio']:.2f}x) {mark}")
+        regressions = [row for row in rows if row["regression"]]
+        print(f"{len(regressions)} regressão(ões) acima de {args.threshold:.0%}." if regressions else "Sem regressões.")
+    else:
+        print(f"Nenhuma baseline em {args.baseline}; use --save-baseline para gravar uma.")
+
+    if args.save_baseline:
+        _write_json(args.baseline, current)
+        print(f"Baseline gravada em {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+Cenários do conjunto de benchmarks (ver benchmarks.runner).
+
+Cada cenário usa as classes reais do jogo e retorna um dicionário de métricas.
+Métricas terminadas em "_ms" são tempos (menor é melhor) e entram na comparação
+com a baseline; as demais são só informativas (contagens, tamanhos).
+"""
+import gc
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, COINS_FOR_SWORD_LEVEL_UP
+
+
+def _median_ms(action: Callable[[], None], repeat: int, setup: Callable[[], None] | None = None) -> float:
+    """
+    Mediana, em ms, do tempo de `action` em `repeat` execuções (`setup` roda fora da medição).
+    Como no timeit, o coletor de lixo fica desligado durante as medições.
+    """
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            action()
+            samples.append(1000 * (time.perf_counter() - start))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return statistics.median(samples)
+
+
+def _new_jogo():
+    from jogo import Jogo
+    return Jogo(headless=True)
+
+
+def environment_update(quick: bool = False) -> dict:
+    """Environment.update com muitos monstros e dragões no mesmo chunk do jogador."""
+    from world.environment import Environment
+    from characters.monster import Monster
+    from characters.dragon import Dragon
+
+    monsters, dragons = (100, 10) if quick else (400, 40)
+    rng = random.Random(0)
+    environment = Environment(world_seed=0)
+    for _ in range(monsters):
+        environment.monsters.add(Monster(rng.randint(0, SCREEN_WIDTH - 90), SCREEN_HEIGHT - 140))
+    for _ in range(dragons):
+        environment.monsters.add(Dragon(rng.randint(0, SCREEN_WIDTH - 250), rng.randint(50, 250)))
+
+    player_rect = pygame.Rect(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 160, 80, 110)
+    view_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    environment.update(player_rect, view_rect) # Carrega os chunks vizinhos fora da medição
+    result = {
+        "monsters": monsters,
+        "dragons": dragons,
+        "update_ms": _median_ms(lambda: environment.update(player_rect, view_rect), 30 if quick else 120)
+    }
+    environment.release_resources()
+    return result
+
+
+def collision_storm(quick: bool = False) -> dict:
+    """CenaJogo._handle_collisions com uma chuva de projéteis sobre o jogador e os monstros."""
+    from cena_jogo import CenaJogo
+    from characters.dragon import Dragon
+    from world.projectile_pool import projectile_pool
+
+    count = 200 if quick else 800
+    jogo = _new_jogo()
+    cena = CenaJogo(jogo)
+    environment = cena.environment
+    player = cena.player
+    player._health = 10 ** 9 # Atributo interno: o setter imprimiria a cada ajuste
+    owner = next(m for m in environment.monsters if isinstance(m, Dragon))
+    for monster in environment.monsters:
+        monster._health = 10 ** 9
+    player.sword.start_swing(1)
+    player.update(environment.platform_index)
+    rng = random.Random(0)
+    targets = [player.rect] + [monster.rect for monster in environment.monsters]
+
+    def spawn() -> None:
+        for projectile in environment.projectiles():
+            projectile_pool.release(projectile)
+        for i in range(count):
+            target = targets[i % len(targets)]
+            x = target.centerx + rng.randint(-40, 40)
+            y = target.centery + rng.randint(-40, 40)
+            projectile = projectile_pool.acquire(x, y, (x + 1, y), speed=0, damage=1, owner=owner)
+            projectile.repelled = i % 2 == 0
+            projectile.repeller_damage = 0
+            owner.projectiles.add(projectile)
+        environment._sync_spatial_index()
+
+    result = {"projectiles": count, "collisions_ms": _median_ms(cena._handle_collisions, 30 if quick else 100, spawn)}
+    cena.encerrar()
+    return result
+
+
+def sword_update(quick: bool = False) -> dict:
+    """Sword.update durante golpes, com a espada em nível alto de crescimento."""
+    from characters.sword import Sword
+
+    level = 10 if quick else 30
+    sword = Sword()
+    sword._try_grow_by_coins(level * COINS_FOR_SWORD_LEVEL_UP)
+
+    def swing_once() -> None:
+        sword.start_swing(1)
+        while sword.swing_active:
+            sword.update((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), True)
+
+    cold_ms = _median_ms(swing_once, 1) # Primeiro golpe: quadros de rotação ainda sendo criados
+    frames = sword.swing_duration_frames
+    warm_ms = _median_ms(swing_once, 10 if quick else 50)
+    sword.rotation_cache.clear()
+    return {"growth_level": level, "swing_cold_ms": cold_ms, "update_ms": warm_ms / frames}
+
+
+def save_load_round_trip(quick: bool = False) -> dict:
+    """SaveLoad: snapshot, gravação e leitura do save, em alguns tamanhos de mundo."""
+    from benchmarks.bench_save import _build_environment
+    from characters.player import Player
+    from save_system.save_load import SaveLoad
+
+    sizes = (500, 2000) if quick else (500, 2000, 8000)
+    repeat = 3 if quick else 10
+    player = Player(100, 100)
+    result = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        save_load = SaveLoad()
+        save_load.save_file_path = os.path.join(temp_dir, "bench_round_trip.json")
+        for size in sizes:
+            environment = _build_environment(size)
+            save = lambda: save_load.save_game({"player": player.to_dict(), "environment": environment.to_dict()})
+            result[f"save_{size}_ms"] = _median_ms(save, repeat)
+            result[f"load_{size}_ms"] = _median_ms(save_load.load_game, repeat)
+            result[f"file_{size}_bytes"] = os.path.getsize(save_load.save_file_path)
+            environment.release_resources()
+        save_load.shutdown()
+    return result
+
+
+def scene_construction(quick: bool = False) -> dict:
+    """Tempo para criar uma CenaJogo nova (ambiente, chunks iniciais, jogador)."""
+    from cena_jogo import CenaJogo
+
+    jogo = _new_jogo()
+    cenas = []
+    def construct() -> None:
+        cenas.append(CenaJogo(jogo))
+    result = {"construct_ms": _median_ms(construct, 5 if quick else 20)}
+    for cena in cenas:
+        cena.encerrar()
+    return result
+
+
+def physics_batch(quick: bool = False) -> dict:
+    """Física de moedas e projéteis: sprite a sprite contra o PhysicsStore (bench_physics)."""
+    from benchmarks.bench_physics import run
+    result = run(2000 if quick else 10000, 30 if quick else 120)
+    return {key: value for key, value in result.items() if value is not None}
+
+
+def ai_lod(quick: bool = False) -> dict:
+    """IA de 1000 monstros espalhados pelo mundo, com e sem nível de detalhe (bench_ai)."""
+    from benchmarks.bench_ai import run
+    result = run(1000, 60 if quick else 300)
+    return {"count": result["count"], "full_ms": result["full_ms"], "lod_ms": result["lod_ms"]}
+
+
+def platform_landing(quick: bool = False) -> dict:
+    """Colisão do jogador com milhares de plataformas: spritecollide no grupo contra o PlatformIndex."""
+    from world.platform import Platform
+    from world.platform_index import PlatformIndex
+
+    count = 1000 if quick else 5000
+    rng = random.Random(0)
+    platforms = pygame.sprite.Group()
+    for i in range(count):
+        platforms.add(Platform(i * 150 + rng.randint(0, 40), rng.randint(150, 550), rng.randint(100, 250), 30))
+    index = PlatformIndex(platforms)
+    probe = pygame.sprite.Sprite()
+    probe.rect = pygame.Rect(count * 75, 300, 80, 110)
+    repeat = 200 if quick else 1000
+    return {
+        "platforms": count,
+        "spritecollide_ms": _median_ms(lambda: pygame.sprite.spritecollide(probe, platforms, False), repeat),
+        "index_query_ms": _median_ms(lambda: index.query(probe.rect), repeat),
+        "index_landing_ms": _median_ms(lambda: index.landing_y(probe.rect.left, probe.rect.right, probe.rect.bottom, SCREEN_HEIGHT - 50), repeat)
+    }
+
+
+def monster_chase(quick: bool = False) -> dict:
+    """Monstros perseguindo o jogador pelo grafo de navegação, com as rotas guardadas por vão de destino."""
+    from world.environment import Environment
+    from characters.monster import Monster
+
+    count = 100 if quick else 300
+    rng = random.Random(0)
+    environment = Environment(world_seed=0)
+    player_rect = pygame.Rect(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 160, 80, 110)
+    view_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    environment.update(player_rect, view_rect) # Carrega os chunks vizinhos e monta o grafo fora da medição
+    environment.monsters.empty()
+    for _ in range(count):
+        environment.monsters.add(Monster(player_rect.centerx + rng.randint(-450, 450), SCREEN_HEIGHT - 140))
+
+    navigation = environment.navigation
+    sources = [navigation.span_at(monster.rect) for monster in environment.monsters]
+    target = navigation.target_span
+    repeat = 30 if quick else 120
+    def uncached() -> None:
+        for _ in sources:
+            navigation._search(target)
+    result = {
+        "monsters": count,
+        "spans": len(navigation),
+        "update_ms": _median_ms(lambda: environment.update(player_rect, view_rect), repeat),
+        "uncached_routes_ms": _median_ms(uncached, repeat),
+        "cached_routes_ms": _median_ms(lambda: [navigation.next_link(source, target) for source in sources], repeat)
+    }
+    environment.release_resources()
+    return result
+
+
+def render_queue(quick: bool = False) -> dict:
+    """Desenho de 2000 sprites visíveis: Group.draw por grupo contra a RenderQueue (bench_render)."""
+    from benchmarks.bench_render import run
+    return run(2000, 20 if quick else 100)
+
+
+def save_async(quick: bool = False) -> dict:
+    """Custo do salvamento na thread principal, síncrono e assíncrono (bench_save)."""
+    from benchmarks.bench_save import run
+    return run(1000 if quick else 5000, 5 if quick else 20)
+
+
+# Ordem de execução e nomes usados nos resultados e na baseline
+SCENARIOS: dict[str, Callable[[bool], dict]] = {
+    "environment_update": environment_update,
+    "collision_storm": collision_storm,
+    "sword_update": sword_update,
+    "save_load_round_trip": save_load_round_trip,
+    "scene_construction": scene_construction,
+    "physics_batch": physics_batch,
+    "ai_lod": ai_lod,
+    "save_async": save_async,
+    "platform_landing": platform_landing,
+    "monster_chase": monster_chase,
+    "render_queue": render_queue,
+}
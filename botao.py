@@ -1,5 +1,6 @@
 import pygame
 from typing import Callable # Para tipagem de Callables
+from core.text_cache import text_cache
 
 class Botao:
     """
@@ -25,8 +26,7 @@ class Botao:
         self.acao = acao 
         self.cor_atual = cor_normal # Inicializa a cor atual
         
-        pygame.font.init() # Garante que o módulo de fontes do Pygame esteja inicializado
-        self.fonte = pygame.font.SysFont('Arial', 30) 
+        self.fonte = text_cache.get_font('Arial', 30) # Fonte compartilhada entre todos os botões
         self.clicado: bool = False # Flag para rastrear se foi clicado
 
     def atualizar(self, eventos: list) -> None:
@@ -61,6 +61,6 @@ class Botao:
         pygame.draw.rect(tela, (0, 0, 0), self.rect, 2)  # Borda preta
 
         # Desenha o texto
-        texto_surf = self.fonte.render(self.texto, True, (0, 0, 0)) # Texto preto
+        texto_surf = text_cache.render(self.texto, (0, 0, 0)) # Texto preto, renderizado uma vez só
         texto_rect = texto_surf.get_rect(center=self.rect.center)
         tela.blit(texto_surf, texto_rect)
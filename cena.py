@@ -3,6 +3,10 @@ from abc import ABC, abstractmethod
 
 class Cena(ABC):
     """Classe abstrata base para todas as cenas do jogo"""
+    # Cenas que sabem desenhar numa superfície de outro tamanho (ver core.render_scale);
+    # as demais são sempre desenhadas direto na janela
+    aceita_escala_render: bool = False
+
     @abstractmethod
     def atualizar(self, eventos: list) -> None:
         pass
@@ -10,3 +14,39 @@ class Cena(ABC):
     @abstractmethod
     def desenhar(self, tela: pygame.Surface) -> None:
         pass
+
+    def guardar_estado_anterior(self) -> None:
+        """Chamado antes de cada passo fixo de simulação; cenas com interpolação guardam as posições aqui."""
+        pass
+
+    def desenhar_regioes(self, tela: pygame.Surface) -> list[pygame.Rect] | None:
+        """
+        Desenha a cena e informa o que mudou, para o modo de dirty rects.
+        Retorna a lista de regiões a atualizar (vazia se nada mudou)
+        ou None quando a tela inteira precisa ser atualizada.
+        """
+        self.desenhar(tela)
+        return None
+
+    def desenhar_interface(self, tela: pygame.Surface) -> None:
+        """
+        Com resolução interna, chamado depois de a cena ser esticada para a janela:
+        desenha o que deve ficar na resolução da janela (HUD).
+        """
+        pass
+
+    def preparar_escala(self, escala: float) -> bool:
+        """
+        Chamado uma vez por frame antes de o modo adaptativo trocar a resolução interna,
+        para a cena criar aos poucos as cópias reescaladas que vai usar.
+        Retorna True quando a cena está pronta para a troca.
+        """
+        return True
+
+    def encerrar(self) -> None:
+        """Chamado quando a cena deixa de ser a atual, para liberar recursos compartilhados."""
+        pass
+
+    def invalidar_desenho(self) -> None:
+        """Faz o próximo desenho ser completo (ex.: depois de uma pausa ou de algo cobrir a tela)."""
+        pass
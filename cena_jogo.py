@@ -3,11 +3,21 @@ from cena import Cena
 from characters.player import Player 
 from characters.dragon import Dragon
 from world.environment import Environment 
+from world.camera import Camera
 from world.coin import Coin 
 from cena_menu import CenaMenu 
+from core.text_cache import text_cache
+from core.log import game_log
+from core.dirty_renderer import DirtyRectRenderer
+from core.render_queue import RenderQueue, LAYER_PLAYER, LAYER_SWORD, LAYER_HUD
+from core.sim_clock import sim_clock
+from core.asset_manager import asset_manager
+from core.settings import RENDER_INTERPOLATION, RENDER_SCALE_PREWARM_PER_FRAME
 
 
 class CenaJogo(Cena):
+    aceita_escala_render = True # desenhar() se ajusta ao tamanho da superfície recebida
+
     def __init__(self, jogo, initial_game_data: dict = None) -> None:
         self.jogo = jogo
         
@@ -18,6 +28,20 @@ class CenaJogo(Cena):
         self.monster_attack_cooldown_ms: int = 1000 
         self.monster_last_attack_time: int = 0 
 
+        # HUD: só é renderizado de novo quando moedas, espada ou vida mudam
+        self._hud_values: tuple | None = None
+        self._hud_surfaces: list[pygame.Surface] = []
+
+        # Posições no início do último passo de simulação, para interpolar ao desenhar
+        self._posicoes_anteriores: dict[pygame.sprite.Sprite, tuple[int, int]] = {}
+
+        # Renderização por dirty rects (opcional, ver Jogo.renderizacao_dirty_rects)
+        self._renderer: DirtyRectRenderer | None = None
+        self._camera_desenhada: int | None = None # Posição da câmera no último frame por dirty rects
+
+        self.camera: Camera = Camera(jogo.largura, jogo.altura)
+        self._fila_desenho: RenderQueue = RenderQueue() # Reaproveitada a cada frame
+
         if initial_game_data:
             # CORREÇÃO AQUI: Usar 'initial_game_data' que é o parâmetro de entrada
             player_data = initial_game_data.get("player") 
@@ -30,6 +54,7 @@ class CenaJogo(Cena):
             self.player = Player(jogo.largura // 2 - (80//2), player_y) 
             self.environment = Environment() 
             print("Iniciando novo jogo (sem save).")
+        self.camera.follow(self.player.rect)
 
     def atualizar(self, eventos: list) -> None:
         for evento in eventos:
@@ -41,64 +66,87 @@ class CenaJogo(Cena):
                 elif evento.key == pygame.K_x: 
                     self.player.coins += 10 
 
-        self.player.update(self.environment.platforms) 
-        self.environment.update(self.player.rect) 
+        profiler = self.jogo.profiler
+        with profiler.section("player"):
+            self.player.update(self.environment.platform_index) 
+        self.camera.follow(self.player.rect)
+        with profiler.section("environment"):
+            self.environment.update(self.player.rect, self.camera.view_rect) 
 
-        self._handle_collisions() 
+        with profiler.section("colisoes"):
+            self._handle_collisions() 
         self._check_game_over()   
 
+    def contagem_entidades(self) -> dict[str, int]:
+        """Quantidade de entidades por grupo, usada pelo overlay de desempenho."""
+        return {
+            "arvores": len(self.environment.trees),
+            "monstros": len(self.environment.monsters),
+            "moedas": len(self.environment.coins),
+            "projeteis": len(self.environment.spatial_index["projectiles"]),
+            "plataformas": len(self.environment.platforms),
+            "ia_dormindo": self.environment.ai_scheduler.counts["asleep"]
+        }
+
     def _handle_collisions(self) -> None: 
-        current_time = pygame.time.get_ticks() 
+        # Todas as consultas passam pela grade espacial do Environment,
+        # então cada teste só considera os elementos das células próximas.
+        current_time = sim_clock.ticks_ms() 
+        environment = self.environment
+        sword = self.player.sword
 
-        if self.player.sword.swing_active: 
-            player_sword_damage = self.player.sword.get_damage() 
+        if sword.swing_active: 
+            player_sword_damage = sword.get_damage() 
 
-            hit_trees = pygame.sprite.spritecollide(self.player.sword, self.environment.trees, False) 
-            for tree in hit_trees:
+            # A grade e os retângulos fazem o filtro barato; sword.hits confere os pixels da lâmina
+            for tree in environment.query("trees", sword.rect):
+                if not sword.hits(tree):
+                    continue
                 coins_gained = tree.take_hit(player_sword_damage) 
                 if coins_gained > 0:
                     self.player.coins += coins_gained 
 
-            hit_monsters = pygame.sprite.spritecollide(self.player.sword, self.environment.monsters, False) 
-            for monster in hit_monsters:
+            for monster in environment.query("monsters", sword.rect):
+                if not sword.hits(monster):
+                    continue
                 coins_gained = monster.take_damage(player_sword_damage) 
                 if coins_gained > 0:
                     self.player.coins += coins_gained 
         
-            for monster in self.environment.monsters:
-                if isinstance(monster, Dragon) and monster.is_alive: 
-                    colliding_projectiles = pygame.sprite.spritecollide(self.player.sword, monster.projectiles, False) 
-                    for projectile in colliding_projectiles:
-                        if not projectile.repelled: 
-                            self.player.sword.repel_projectile(projectile, self.player.facing_right) 
+            for projectile in environment.query("projectiles", sword.rect):
+                if not projectile.repelled and projectile.owner is not None and projectile.owner.is_alive and sword.hits(projectile): 
+                    sword.repel_projectile(projectile, self.player.facing_right) 
 
         if current_time - self.monster_last_attack_time > self.monster_attack_cooldown_ms:
-            colliding_monsters = pygame.sprite.spritecollide(self.player, self.environment.monsters, False)
-            for monster in colliding_monsters:
+            for monster in environment.query("monsters", self.player.rect):
                 if monster.is_alive:
                     self.player.health -= monster.damage 
                     self.monster_last_attack_time = current_time 
 
-        for monster_source in self.environment.monsters:
-            if isinstance(monster_source, Dragon):
-                hit_player_by_projectiles = pygame.sprite.spritecollide(self.player, monster_source.projectiles, True) 
-                for projectile in hit_player_by_projectiles:
-                    if not projectile.repelled: 
-                        self.player.health -= projectile.damage 
-                        print(f"Jogador atingido por projétil! Dano: {projectile.damage}")
-
-                for target_monster in self.environment.monsters:
-                    if target_monster.is_alive: 
-                        repelled_hit_target = pygame.sprite.spritecollide(target_monster, monster_source.projectiles, True) 
-                        for projectile in repelled_hit_target:
-                            if projectile.repelled and target_monster != self.player: 
-                                print(f"{target_monster.__class__.__name__} atingido por projétil repelido! Dano: {projectile.repeller_damage}")
-                                coins_gained = target_monster.take_damage(projectile.repeller_damage)
-                                if coins_gained > 0:
-                                    self.player.coins += coins_gained 
-
-        collected_coins = pygame.sprite.spritecollide(self.player, self.environment.coins, True) 
-        for coin in collected_coins:
+        for projectile in environment.query("projectiles", self.player.rect):
+            environment.discard("projectiles", projectile)
+            if not projectile.repelled: 
+                self.player.health -= projectile.damage 
+                game_log.debug("Jogador atingido por projétil! Dano: %d", projectile.damage)
+
+        for target_monster in list(environment.monsters):
+            if not target_monster.is_alive:
+                continue
+            for projectile in environment.query("projectiles", target_monster.rect):
+                if not projectile.repelled:
+                    # Só projéteis repelidos pela espada ferem monstros; os outros se desfazem ao
+                    # tocar um monstro, sem dano. O dono é ignorado: a bola de fogo nasce dentro dele.
+                    if projectile.owner is not target_monster:
+                        environment.discard("projectiles", projectile)
+                    continue
+                environment.discard("projectiles", projectile)
+                game_log.debug("%s atingido por projétil repelido! Dano: %d", target_monster.__class__.__name__, projectile.repeller_damage)
+                coins_gained = target_monster.take_damage(projectile.repeller_damage)
+                if coins_gained > 0:
+                    self.player.coins += coins_gained 
+
+        for coin in environment.query("coins", self.player.rect):
+            environment.discard("coins", coin)
             self.player.coins += coin.value 
 
     def _check_game_over(self) -> None: 
@@ -107,23 +155,129 @@ class CenaJogo(Cena):
             from cena_menu import CenaMenu 
             self.jogo.mudar_cena(CenaMenu(self.jogo)) 
 
+    def guardar_estado_anterior(self) -> None:
+        """
+        Chamado pelo Jogo antes de cada passo fixo de simulação: guarda as posições
+        atuais dos elementos móveis, usadas para interpolar o desenho entre passos.
+        """
+        if not RENDER_INTERPOLATION:
+            return
+        environment = self.environment
+        moveis = [self.player, self.player.sword]
+        moveis += environment.monsters.sprites()
+        moveis += environment.coins.sprites()
+        moveis += environment.projectiles()
+        self._posicoes_anteriores = {sprite: sprite.rect.topleft for sprite in moveis}
+
+    def _aplicar_interpolacao(self) -> list[tuple[pygame.Rect, tuple[int, int]]]:
+        """
+        Move temporariamente os retângulos para a posição interpolada entre o passo
+        anterior e o atual (Jogo.alfa_interpolacao). Retorna o necessário para desfazer.
+        """
+        alfa = getattr(self.jogo, "alfa_interpolacao", 1.0)
+        if not RENDER_INTERPOLATION or alfa >= 1.0 or not self._posicoes_anteriores:
+            return []
+        restaurar = []
+        for sprite, (x0, y0) in self._posicoes_anteriores.items():
+            rect = sprite.rect
+            x1, y1 = rect.topleft
+            if (x0, y0) == (x1, y1) or abs(x1 - x0) > 64 or abs(y1 - y0) > 64: # Parado ou teleportado
+                continue
+            restaurar.append((rect, (x1, y1)))
+            rect.topleft = (round(x0 + (x1 - x0) * alfa), round(y0 + (y1 - y0) * alfa))
+        return restaurar
+
+    @staticmethod
+    def _desfazer_interpolacao(restaurar: list[tuple[pygame.Rect, tuple[int, int]]]) -> None:
+        for rect, topleft in restaurar:
+            rect.topleft = topleft
+
     def desenhar(self, tela: pygame.Surface) -> None:
+        self._desenhar_fundo(tela)
+
+        self._atualizar_hud()
+        restaurar = self._aplicar_interpolacao()
+        try:
+            self.camera.follow(self.player.rect) # Segue a posição interpolada, sem trancos
+            self._montar_fila(tela.get_width() / self.jogo.largura)
+            self._fila_desenho.flush(tela)
+        finally:
+            self._desfazer_interpolacao(restaurar)
+
+    def _desenhar_fundo(self, tela: pygame.Surface) -> None:
+        """Céu e chão: não dependem da posição horizontal da câmera."""
+        largura, altura = tela.get_size() # Pode ser a resolução interna, menor ou maior que a janela
+        altura_chao = round(50 * altura / self.jogo.altura)
         tela.fill((135, 206, 235)) 
-        pygame.draw.rect(tela, (34, 139, 34), (0, self.jogo.altura - 50, self.jogo.largura, 50)) 
+        pygame.draw.rect(tela, (34, 139, 34), (0, altura - altura_chao, largura, altura_chao)) 
+
+    def desenhar_regioes(self, tela: pygame.Surface) -> list[pygame.Rect] | None:
+        """
+        Caminho de dirty rects: o fundo fica pré-desenhado e só as regiões dos sprites
+        que mudaram são redesenhadas e devolvidas para atualização. Quando a câmera
+        se move, tudo muda de lugar na tela e o frame é redesenhado por inteiro.
+        """
+        if self._renderer is None:
+            self._renderer = DirtyRectRenderer(tela.get_size())
+            self._renderer.bake_background(self._desenhar_fundo)
+
+        self._atualizar_hud()
+        restaurar = self._aplicar_interpolacao()
+        try:
+            self.camera.follow(self.player.rect)
+            if self.camera.x != self._camera_desenhada:
+                self._renderer.invalidate()
+                self._camera_desenhada = self.camera.x
+            self._montar_fila()
+            return self._renderer.render(tela, self._fila_desenho.items())
+        finally:
+            self._desfazer_interpolacao(restaurar)
+
+    def desenhar_interface(self, tela: pygame.Surface) -> None:
+        self._fila_desenho.flush_screen(tela) # HUD do último desenhar(), na resolução da janela
+
+    def preparar_escala(self, escala: float) -> bool:
+        if escala == 1.0:
+            return True
+        self._montar_fila() # Sem escala: a fila fica com as superfícies originais do que está visível
+        originais = (surface for surface, _ in self._fila_desenho.items(screen=False))
+        return asset_manager.prewarm_scaled(originais, escala, RENDER_SCALE_PREWARM_PER_FRAME)
+
+    def encerrar(self) -> None:
+        self.environment.release_resources()
 
-        self.environment.draw(tela) 
-        self.player.draw(tela) 
+    def invalidar_desenho(self) -> None:
+        if self._renderer is not None:
+            self._renderer.invalidate()
 
-        font = pygame.font.SysFont('Arial', 30)
-        coin_text = font.render(f"Moedas: {self.player.coins}", True, (0, 0, 0)) 
-        tela.blit(coin_text, (10, 10))
+    def _montar_fila(self, escala: float = 1.0) -> None:
+        """
+        Enche a fila de desenho com o que está dentro da câmera, cada coisa na sua camada.
+        O HUD vai na última camada, em coordenadas da janela e nunca reescalado.
+        `escala` é a da resolução interna.
+        """
+        fila = self._fila_desenho
+        fila.begin(self.camera.view_rect, escala)
+        self.environment.enqueue(fila)
+        fila.add(self.player.image, self.player.rect, LAYER_PLAYER)
+        fila.add(self.player.sword.image, self.player.sword.rect, LAYER_SWORD)
+        for surface, pos in zip(self._hud_surfaces, self._posicoes_hud()):
+            fila.add_screen(surface, surface.get_rect(topleft=pos), LAYER_HUD)
 
-        sword_height = self.player.sword.image.get_height()
-        sword_size_text = font.render(f"Espada: {sword_height}px", True, (0, 0, 0))
-        tela.blit(sword_size_text, (10, 50))
+    @staticmethod
+    def _posicoes_hud() -> list[tuple[int, int]]:
+        return [(10, 10 + i * 40) for i in range(3)]
 
-        health_text = font.render(f"Vida: {self.player.health}", True, (0, 0, 0)) 
-        tela.blit(health_text, (10, 90))
+    def _atualizar_hud(self) -> None:
+        hud_values = (self.player.coins, self.player.sword.scaled_current_image.get_height(), self.player.health)
+        if hud_values != self._hud_values:
+            coins, sword_height, health = hud_values
+            self._hud_values = hud_values
+            self._hud_surfaces = [
+                text_cache.render(f"Moedas: {coins}", (0, 0, 0)),
+                text_cache.render(f"Espada: {sword_height}px", (0, 0, 0)),
+                text_cache.render(f"Vida: {health}", (0, 0, 0)),
+            ]
 
     # Métodos para fornecer dados para o sistema de save
     def get_player_data(self) -> dict:
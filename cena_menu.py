@@ -3,6 +3,7 @@ import sys
 from botao import Botao
 import pygame
 from cena import Cena
+from core.text_cache import text_cache
 
 class CenaMenu(Cena):
     """
@@ -62,6 +63,7 @@ class CenaMenu(Cena):
         )
         
         self.botoes.extend([btn_jogar, btn_continuar, btn_opcoes, btn_sair]) 
+        self._estado_desenhado: tuple | None = None # Usado para não redesenhar um menu parado
     
     def _iniciar_novo_jogo(self) -> None: # TORNADO PRIVADO
         """
@@ -69,8 +71,7 @@ class CenaMenu(Cena):
         Inicia uma nova CenaJogo.
         """
         print("Iniciando novo jogo...")
-        from cena_jogo import CenaJogo 
-        self.jogo.mudar_cena(CenaJogo(self.jogo)) 
+        self.jogo.iniciar_novo_jogo() # O Jogo cria a CenaJogo (e começa a gravar o replay, se pedido)
     
     def _continuar_jogo(self) -> None: # TORNADO PRIVADO
         """
@@ -110,9 +111,22 @@ class CenaMenu(Cena):
         """
         tela.fill((240, 240, 240))  
         
-        fonte_titulo = pygame.font.SysFont('Arial', 48, bold=True)
-        titulo = fonte_titulo.render("Creepiest SWORD", True, (0, 0, 0))
+        titulo = text_cache.render("Creepiest SWORD", (0, 0, 0), 'Arial', 48, bold=True)
         tela.blit(titulo, (self.jogo.largura//2 - titulo.get_width()//2, 80))
         
         for botao in self.botoes:
-            botao.desenhar(tela)
\ No newline at end of file
+            botao.desenhar(tela)
+
+    def desenhar_regioes(self, tela: pygame.Surface) -> list[pygame.Rect] | None:
+        """
+        Só redesenha o menu quando algum botão muda de cor (hover).
+        """
+        estado = tuple(botao.cor_atual for botao in self.botoes)
+        if estado == self._estado_desenhado:
+            return []
+        self._estado_desenhado = estado
+        self.desenhar(tela)
+        return None
+
+    def invalidar_desenho(self) -> None:
+        self._estado_desenhado = None
\ No newline at end of file
@@ -3,6 +3,7 @@ import pygame
 import sys
 from cena import Cena
 from botao import Botao
+from core.text_cache import text_cache
 
 class CenaOpcoes(Cena):
     """
@@ -11,7 +12,6 @@ class CenaOpcoes(Cena):
     def __init__(self, jogo):
         self.jogo = jogo
         self.botoes = []
-        self.fonte = pygame.font.SysFont('Arial', 30)
 
         self.slider_musica_rect = pygame.Rect(self.jogo.largura // 2 - 150, 200, 300, 20)
         self.slider_efeitos_rect = pygame.Rect(self.jogo.largura // 2 - 150, 300, 300, 20)
@@ -30,6 +30,7 @@ class CenaOpcoes(Cena):
 
         self.arrastando_musica: bool = False
         self.arrastando_efeitos: bool = False
+        self._estado_desenhado: tuple | None = None # Usado para não redesenhar a tela parada
     
     def _voltar_para_menu(self) -> None: 
         from cena_menu import CenaMenu 
@@ -65,23 +66,36 @@ class CenaOpcoes(Cena):
     def desenhar(self, tela: pygame.Surface) -> None:
         tela.fill((200, 200, 220)) 
 
-        fonte_titulo = pygame.font.SysFont('Arial', 40, bold=True)
-        titulo = fonte_titulo.render("Opções de Som", True, (0, 0, 0))
+        titulo = text_cache.render("Opções de Som", (0, 0, 0), 'Arial', 40, bold=True)
         tela.blit(titulo, (self.jogo.largura // 2 - titulo.get_width() // 2, 80))
 
         pygame.draw.rect(tela, (180, 180, 180), self.slider_musica_rect) 
         indicador_musica_x = self.slider_musica_rect.left + (self.slider_musica_rect.width * self.jogo.volume_musica) # Acessa a property
         pygame.draw.circle(tela, (50, 150, 50), (int(indicador_musica_x), self.slider_musica_rect.centery), 10) 
         
-        texto_musica = self.fonte.render(f"Música: {int(self.jogo.volume_musica * 100)}%", True, (0, 0, 0)) # Acessa a property
+        texto_musica = text_cache.render(f"Música: {int(self.jogo.volume_musica * 100)}%", (0, 0, 0)) # Acessa a property
         tela.blit(texto_musica, (self.slider_musica_rect.x, self.slider_musica_rect.y - 30))
 
         pygame.draw.rect(tela, (180, 180, 180), self.slider_efeitos_rect) 
         indicador_efeitos_x = self.slider_efeitos_rect.left + (self.slider_efeitos_rect.width * self.jogo.volume_efeitos) # Acessa a property
         pygame.draw.circle(tela, (150, 50, 50), (int(indicador_efeitos_x), self.slider_efeitos_rect.centery), 10) 
 
-        texto_efeitos = self.fonte.render(f"Efeitos: {int(self.jogo.volume_efeitos * 100)}%", True, (0, 0, 0)) # Acessa a property
+        texto_efeitos = text_cache.render(f"Efeitos: {int(self.jogo.volume_efeitos * 100)}%", (0, 0, 0)) # Acessa a property
         tela.blit(texto_efeitos, (self.slider_efeitos_rect.x, self.slider_efeitos_rect.y - 30))
 
         for botao in self.botoes:
-            botao.desenhar(tela)
\ No newline at end of file
+            botao.desenhar(tela)
+
+    def desenhar_regioes(self, tela: pygame.Surface) -> list[pygame.Rect] | None:
+        """
+        Só redesenha quando um volume ou a cor de um botão muda.
+        """
+        estado = (self.jogo.volume_musica, self.jogo.volume_efeitos) + tuple(botao.cor_atual for botao in self.botoes)
+        if estado == self._estado_desenhado:
+            return []
+        self._estado_desenhado = estado
+        self.desenhar(tela)
+        return None
+
+    def invalidar_desenho(self) -> None:
+        self._estado_desenhado = None
\ No newline at end of file
@@ -2,19 +2,27 @@ import pygame
 import math
 from characters.monster import Monster 
 from world.projectile import Projectile 
-from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, COINS_PER_DRAGON_KILL, SFX_VOLUME 
+from world.projectile_pool import projectile_pool
+from core.sim_clock import sim_clock
+from core.animation import Animator, load_animation
+from core.settings import COINS_PER_DRAGON_KILL, SFX_VOLUME, ANIMATION_FRAME_MS, DRAGON_ATTACK_ANIMATION_MS 
 
 class Dragon(Monster):
     def __init__(self, x: int, y: int, initial_data: dict = None) -> None:
-        super().__init__(x, y, speed=3, health=100, damage=15, initial_data=initial_data) 
+        # Os dados salvos só são aplicados no fim deste construtor: Dragon.from_dict
+        # depende de atributos que ainda não existem durante o Monster.__init__
+        super().__init__(x, y, speed=3, health=100, damage=15) 
         
-        try:
-            self.original_image = pygame.image.load("assets/images/dragon.png").convert_alpha()
-            self.image = pygame.transform.scale(self.original_image, (250, 200)) 
-        except pygame.error:
-            print("Erro: Imagem do dragão (dragon.png) não encontrada. Usando um retângulo roxo como placeholder.")
-            self.image = pygame.Surface((250, 200), pygame.SRCALPHA) 
-            self.image.fill((128, 0, 128))
+        # dragaoataque.png é um quadro só (373x246), escalado mantendo a proporção
+        self.animator = Animator({
+            "fly": load_animation("assets/images/dragon.png", frame_count=1, size=(250, 200),
+                                  frame_ms=ANIMATION_FRAME_MS, placeholder=self._create_placeholder),
+            "attack": load_animation("assets/images/dragaoataque.png", frame_count=1, size=(250, 165),
+                                     frame_ms=DRAGON_ATTACK_ANIMATION_MS, loop=False,
+                                     placeholder=self._create_placeholder)
+        }, "fly")
+        self.facing_right: bool = True
+        self.image = self.animator.frame(self.facing_right)
 
         self.rect = self.image.get_rect(topleft=(x, y)) 
 
@@ -26,7 +34,7 @@ class Dragon(Monster):
         self.fireball_attack_range: int = 500 
 
         self._fireball_cooldown_ms: int = 1500 # Atributo interno para property
-        self.last_fireball_time: int = pygame.time.get_ticks()
+        self.last_fireball_time: int = sim_clock.ticks_ms()
 
         self.projectiles: pygame.sprite.Group = pygame.sprite.Group()
 
@@ -43,6 +51,13 @@ class Dragon(Monster):
         if initial_data: 
             self.from_dict(initial_data)
 
+    @staticmethod
+    def _create_placeholder() -> pygame.Surface:
+        print("Erro: Imagem do dragão (dragon.png) não encontrada. Usando um retângulo roxo como placeholder.")
+        image = pygame.Surface((250, 200), pygame.SRCALPHA) 
+        image.fill((128, 0, 128))
+        return image
+
     @property
     def fireball_cooldown_ms(self) -> int:
         return self._fireball_cooldown_ms
@@ -51,53 +66,73 @@ class Dragon(Monster):
     def fireball_cooldown_ms(self, value: int) -> None:
         self._fireball_cooldown_ms = max(0, value) # Garante que o cooldown não seja negativo
 
-    def update(self, player_rect: pygame.Rect) -> None:
+    def update(self, player_rect: pygame.Rect, steps: int = 1) -> None:
+        """
+        Persegue/patrulha e dispara no jogador. `steps` > 1 avança vários frames de uma vez
+        (usado pelo AIScheduler quando o dragão está longe do jogador).
+        """
         if not self.is_alive: 
-            self.projectiles.update() 
+            self.update_projectiles() 
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = sim_clock.ticks_ms()
 
         dx = player_rect.centerx - self.rect.centerx
         distance_to_player = math.hypot(dx, player_rect.centery - self.rect.centery)
 
-        if dx > 0: 
-            if self.image is not self.original_image: 
-                self.image = self.original_image
-        elif dx < 0: 
-            if self.image is self.original_image: 
-                self.image = pygame.transform.flip(self.original_image, True, False)
+        if dx != 0: 
+            self.facing_right = dx > 0
 
         if distance_to_player <= self.detection_range:
+            step_x = min(self.speed * steps, abs(dx)) # Com passos grandes, não passa do jogador
             if dx > 0:
-                self.rect.x += self.speed
+                self.rect.x += step_x
             elif dx < 0:
-                self.rect.x -= self.speed
+                self.rect.x -= step_x
             
             if distance_to_player <= self.fireball_attack_range:
                 if current_time - self.last_fireball_time > self.fireball_cooldown_ms: # Acessa a property
                     self._shoot_fireball(player_rect.center) 
                     self.last_fireball_time = current_time
         else:
-            self.rect.x += self.speed * self.direction
+            self.rect.x += self.speed * self.direction * steps
             if self.rect.x <= self.patrol_start_x - self.patrol_range:
                 self.direction = 1
             elif self.rect.x >= self.patrol_start_x + self.patrol_range:
                 self.direction = -1
-        
-        self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
 
+        self.animator.update(steps)
+        if self.animator.finished: # Fim do quadro de ataque
+            self.animator.play("fly")
+        self.image = self.animator.frame(self.facing_right)
+
+        self.update_projectiles()
+
+    def update_projectiles(self) -> None:
+        """
+        Move os projéteis e devolve ao pool os que ficaram inativos (saíram da tela).
+        Chamado também nos frames em que a IA do dragão é pulada, para os disparos não congelarem.
+        """
         self.projectiles.update()
+        for projectile in self.projectiles.sprites():
+            if not projectile.is_active:
+                projectile_pool.release(projectile)
+
+    def release_projectiles(self) -> None:
+        """Devolve ao pool todos os projéteis deste dragão (ex.: quando ele sai do jogo)."""
+        for projectile in self.projectiles.sprites():
+            projectile_pool.release(projectile)
 
     def _shoot_fireball(self, target_pos: tuple[int, int]) -> None: 
         if self.fireball_sound:
             self.fireball_sound.play()
             
-        fire_start_x = self.rect.centerx + (self.rect.width // 3 if self.image is self.original_image else -self.rect.width // 3)
+        fire_start_x = self.rect.centerx + (self.rect.width // 3 if self.facing_right else -self.rect.width // 3)
         fire_start_y = self.rect.top + (self.rect.height // 4) 
 
-        fireball = Projectile(fire_start_x, fire_start_y, target_pos, speed=7, damage=self.damage)
+        fireball = projectile_pool.acquire(fire_start_x, fire_start_y, target_pos, speed=7, damage=self.damage, owner=self)
         self.projectiles.add(fireball)
+        self.animator.play("attack", restart=True)
 
     def draw(self, screen: pygame.Surface) -> None:
         if self.is_alive: 
@@ -113,5 +148,6 @@ class Dragon(Monster):
 
     def from_dict(self, data: dict) -> None:
         super().from_dict(data) 
-        self.last_fireball_time = data.get("last_fireball_time", pygame.time.get_ticks()) 
+        # O relógio da simulação recomeça a cada sessão; um tempo salvo "no futuro" travaria os disparos
+        self.last_fireball_time = min(data.get("last_fireball_time", sim_clock.ticks_ms()), sim_clock.ticks_ms()) 
         self.fireball_cooldown_ms = data.get("fireball_cooldown_ms", self.fireball_cooldown_ms) # Usa o setter da property
\ No newline at end of file
@@ -1,16 +1,18 @@
 import pygame
-from core.settings import COINS_PER_MONSTER_KILL, SCREEN_HEIGHT
+from core.settings import COINS_PER_MONSTER_KILL, SCREEN_HEIGHT, MONSTER_CHASE_RADIUS, MONSTER_JUMP_POWER, ANIMATION_FRAME_MS
+from core.animation import Animator, load_animation
+from core.log import game_log
+from world.platform_index import PlatformIndex
+from world.navigation import NavGraph, NavLink
 
 class Monster(pygame.sprite.Sprite):
     def __init__(self, x: int, y: int, speed: int = 2, health: int = 20, damage: int = 5, initial_data: dict = None) -> None:
         super().__init__()
-        try:
-            self.image = pygame.image.load("assets/images/monster.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (90, 90))
-        except pygame.error:
-            print("Erro: Imagem do monstro (monster.png) não encontrada. Usando um retângulo vermelho como placeholder.")
-            self.image = pygame.Surface((90, 90), pygame.SRCALPHA)
-            self.image.fill((255, 0, 0)) 
+        # Quadros compartilhados por todos os monstros; o Animator guarda só o estado desta instância
+        walk = load_animation("assets/images/monster.png", frame_count=1, size=(90, 90),
+                              frame_ms=ANIMATION_FRAME_MS, placeholder=self._create_placeholder)
+        self.animator: Animator = Animator({"walk": walk}, "walk")
+        self.image = self.animator.frame(True)
         
         self.rect = self.image.get_rect(topleft=(x, y))
         self.speed: int = speed
@@ -21,6 +23,9 @@ class Monster(pygame.sprite.Sprite):
 
         self.velocity_y: float = 0.0
         self.gravity: float = 0.8
+        self.jump_power: float = MONSTER_JUMP_POWER
+        self.chase_radius: int = MONSTER_CHASE_RADIUS
+        self._nav_link: NavLink | None = None # Salto ou queda em andamento durante a perseguição
 
         self.direction: int = 1 
         self.patrol_start_x: int = x 
@@ -30,6 +35,13 @@ class Monster(pygame.sprite.Sprite):
         if initial_data: 
             self.from_dict(initial_data)
 
+    @staticmethod
+    def _create_placeholder() -> pygame.Surface:
+        print("Erro: Imagem do monstro (monster.png) não encontrada. Usando um retângulo vermelho como placeholder.")
+        image = pygame.Surface((90, 90), pygame.SRCALPHA)
+        image.fill((255, 0, 0)) 
+        return image
+
     @property # Getter para health
     def health(self) -> int:
         return self._health
@@ -47,7 +59,7 @@ class Monster(pygame.sprite.Sprite):
     @is_alive.setter # Setter para is_alive
     def is_alive(self, value: bool) -> None:
         if not value and self._is_alive: # Transição de vivo para morto
-            print(f"{self.__class__.__name__} derrotado!")
+            game_log.info("%s derrotado!", self.__class__.__name__)
             # TODO: Tocar som de monstro morrendo (se não for feito em Environment)
         self._is_alive = value
 
@@ -64,37 +76,81 @@ class Monster(pygame.sprite.Sprite):
             return self.coins_on_defeat
         return 0
 
-    def update(self) -> None: 
+    def update(self, steps: int = 1, platforms: PlatformIndex | None = None, navigation: NavGraph | None = None) -> None: 
+        """
+        Atualiza patrulha (ou perseguição) e física. `steps` > 1 avança vários frames
+        de uma vez (usado pelo AIScheduler para monstros longe do jogador). Com `platforms`,
+        o monstro pode parar em cima de plataformas, e não só no chão. Com `navigation`,
+        persegue o jogador pelas plataformas quando ele chega a `chase_radius`.
+        """
         if not self.is_alive: # Acessa a property
             return
 
-        self._handle_patrol_movement() 
-        self._apply_physics()          
+        if navigation is not None and self._in_chase_range(navigation.target_rect):
+            self._handle_chase_movement(steps, navigation)
+        else:
+            self._nav_link = None
+            self._handle_patrol_movement(steps) 
+        self._apply_physics(steps, platforms)          
+        self.animator.update(steps)
+        self.image = self.animator.frame(self.direction != -1)
             
-    def _handle_patrol_movement(self) -> None: 
-        self.rect.x += self.speed * self.direction
+    def _handle_patrol_movement(self, steps: int = 1) -> None: 
+        self.rect.x += self.speed * self.direction * steps
         
         if self.direction == 1 and self.rect.x >= self.walk_limit_right:
             self.direction = -1
         elif self.direction == -1 and self.rect.x <= self.walk_limit_left:
             self.direction = 1
 
-    def _apply_physics(self) -> None: 
-        self.velocity_y += self.gravity
-        self.rect.y += self.velocity_y
+    def _in_chase_range(self, target_rect: pygame.Rect | None) -> bool:
+        if target_rect is None:
+            return False
+        return (abs(target_rect.centerx - self.rect.centerx) <= self.chase_radius and
+                abs(target_rect.centery - self.rect.centery) <= self.chase_radius)
+
+    def _handle_chase_movement(self, steps: int, navigation: NavGraph) -> None:
+        """
+        Segue o caminho do grafo de navegação até o vão do jogador: anda até o ponto
+        de salto da próxima ligação, pula (ou cai da borda) e segue até o ponto de pouso.
+        """
+        reach = self.speed * steps
+        if self.velocity_y == 0: # Apoiado: escolhe a próxima ligação pelo vão atual
+            self._nav_link = navigation.next_link(navigation.span_at(self.rect), navigation.target_span)
+            link = self._nav_link
+            if link is None: # Já no vão do jogador (ou sem caminho): vai direto até ele
+                target_x = navigation.target_rect.centerx
+            elif abs(link.takeoff_x - self.rect.centerx) <= reach:
+                if link.jump:
+                    self.velocity_y = self.jump_power
+                target_x = link.landing_x
+            else:
+                target_x = link.takeoff_x
+        elif self._nav_link is not None: # No ar: segue para o ponto de pouso
+            target_x = self._nav_link.landing_x
+        else:
+            target_x = navigation.target_rect.centerx
+
+        move = max(-reach, min(reach, target_x - self.rect.centerx))
+        self.rect.x += move
+        if move:
+            self.direction = 1 if move > 0 else -1
+
+    def _apply_physics(self, steps: int = 1, platforms: PlatformIndex | None = None) -> None: 
+        previous_bottom = self.rect.bottom
+        self.velocity_y += self.gravity * steps
+        self.rect.y += self.velocity_y * steps
 
         ground_level = SCREEN_HEIGHT - 50 
+        if platforms is not None:
+            ground_level = platforms.landing_y(self.rect.left, self.rect.right, previous_bottom, ground_level)
         if self.rect.bottom >= ground_level:
             self.rect.bottom = ground_level
             self.velocity_y = 0 
             
     def draw(self, screen: pygame.Surface) -> None:
         if self.is_alive: # Acessa a property
-            if self.direction == -1:
-                flipped_image = pygame.transform.flip(self.image, True, False)
-                screen.blit(flipped_image, self.rect)
-            else:
-                screen.blit(self.image, self.rect)
+            screen.blit(self.image, self.rect)
 
     def to_dict(self) -> dict:
         return {
@@ -119,4 +175,5 @@ class Monster(pygame.sprite.Sprite):
         self.direction = data.get("direction", self.direction)
         self.patrol_start_x = data.get("patrol_start_x", self.patrol_start_x)
         self.walk_limit_left = self.patrol_start_x - 100
-        self.walk_limit_right = self.patrol_start_x + 100
\ No newline at end of file
+        self.walk_limit_right = self.patrol_start_x + 100
+        self.image = self.animator.frame(self.direction != -1)
\ No newline at end of file
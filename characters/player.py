@@ -1,18 +1,19 @@
 import pygame
 from characters.sword import Sword 
-from core.settings import PLAYER_SPEED, PLAYER_HEALTH, SCREEN_WIDTH, SCREEN_HEIGHT
+from core.settings import PLAYER_SPEED, PLAYER_HEALTH, SCREEN_HEIGHT, ANIMATION_FRAME_MS
+from core.animation import Animator, load_animation
+from core.log import game_log
+from world.platform_index import PlatformIndex
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x: int, y: int, initial_data: dict = None) -> None:
         super().__init__() 
 
-        try:
-            self.image = pygame.image.load("assets/images/player.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (80, 110)) 
-        except pygame.error:
-            print("Erro: Imagem do jogador (player.png) não encontrada. Usando um retângulo como placeholder.")
-            self.image = pygame.Surface((80, 110), pygame.SRCALPHA) 
-            self.image.fill((0, 150, 255)) 
+        # player.png tem um quadro só; com uma folha maior, basta mudar frame_count
+        walk = load_animation("assets/images/player.png", frame_count=1, size=(80, 110),
+                              frame_ms=ANIMATION_FRAME_MS, placeholder=self._create_placeholder)
+        self.animator: Animator = Animator({"idle": walk, "walk": walk}, "idle")
+        self.image = self.animator.frame(True)
         
         self.rect = self.image.get_rect(topleft=(x, y)) 
 
@@ -35,6 +36,13 @@ class Player(pygame.sprite.Sprite):
         if initial_data: 
             self.from_dict(initial_data)
     
+    @staticmethod
+    def _create_placeholder() -> pygame.Surface:
+        print("Erro: Imagem do jogador (player.png) não encontrada. Usando um retângulo como placeholder.")
+        image = pygame.Surface((80, 110), pygame.SRCALPHA) 
+        image.fill((0, 150, 255)) 
+        return image
+
     @property # Getter para health
     def health(self) -> int:
         return self._health
@@ -42,9 +50,9 @@ class Player(pygame.sprite.Sprite):
     @health.setter # Setter para health
     def health(self, amount: int) -> None:
         self._health = max(0, amount) # Garante que a vida não seja negativa
-        print(f"Jogador: Vida restante: {self._health}")
+        game_log.debug("Jogador: Vida restante: %d", self._health)
         if self._health <= 0:
-            print("Jogador foi derrotado! (Lógica de Game Over deve ser acionada externamente)")
+            game_log.info("Jogador foi derrotado! (Lógica de Game Over deve ser acionada externamente)")
             # Nota: O controle de Game Over está na CenaJogo, que verificará esta property.
 
     @property # Getter para coins
@@ -54,7 +62,7 @@ class Player(pygame.sprite.Sprite):
     @coins.setter # Setter para coins
     def coins(self, amount: int) -> None:
         self._coins = max(0, amount) # Moedas não devem ser negativas
-        print(f"Moedas: {self._coins}")
+        game_log.debug("Moedas: %d", self._coins)
         self.sword._try_grow_by_coins(self._coins) # Dispara a lógica da espada automaticamente
 
     def handle_input(self, event: pygame.event.Event) -> None:
@@ -84,9 +92,12 @@ class Player(pygame.sprite.Sprite):
                 self.moving_right = False
                 self.swing_initiated_by_movement = False
         
-    def update(self, platforms: pygame.sprite.Group) -> None: 
+    def update(self, platforms: PlatformIndex) -> None: 
         self._handle_horizontal_movement()      
         self._apply_gravity_and_collisions(platforms) 
+        self.animator.play("walk" if self.moving_left != self.moving_right else "idle")
+        self.animator.update()
+        self.image = self.animator.frame(self.facing_right)
         self.sword.update(self.rect.center, self.facing_right)
 
     def _handle_horizontal_movement(self) -> None: 
@@ -94,10 +105,9 @@ class Player(pygame.sprite.Sprite):
             self.rect.x -= self.speed
         elif self.moving_right and not self.moving_left:
             self.rect.x += self.speed
-        
-        self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
+        # Sem limite horizontal: o mundo rola com a câmera (ver world.camera)
 
-    def _apply_gravity_and_collisions(self, platforms: pygame.sprite.Group) -> None: 
+    def _apply_gravity_and_collisions(self, platforms: PlatformIndex) -> None: 
         self.velocity_y += self.gravity
         self.rect.y += self.velocity_y
 
@@ -107,31 +117,27 @@ class Player(pygame.sprite.Sprite):
             self.velocity_y = 0
             self.is_jumping = False 
 
-        collided_platforms = pygame.sprite.spritecollide(self, platforms, False) 
+        collided_platforms = platforms.query(self.rect) # Só as plataformas próximas, pelo índice estático
         
         if self.velocity_y > 0: 
             for platform in collided_platforms:
-                if self.rect.bottom - self.velocity_y <= platform.rect.top and \
-                   self.rect.bottom >= platform.rect.top:
-                    self.rect.bottom = platform.rect.top 
+                if self.rect.bottom - self.velocity_y <= platform.top and \
+                   self.rect.bottom >= platform.top:
+                    self.rect.bottom = platform.top 
                     self.velocity_y = 0 
                     self.is_jumping = False 
                     break 
 
         elif self.velocity_y < 0: 
             for platform in collided_platforms:
-                if self.rect.top >= platform.rect.bottom - abs(self.velocity_y) and \
-                   self.rect.top <= platform.rect.bottom:
-                    self.rect.top = platform.rect.bottom 
+                if self.rect.top >= platform.bottom - abs(self.velocity_y) and \
+                   self.rect.top <= platform.bottom:
+                    self.rect.top = platform.bottom 
                     self.velocity_y = 0 
                     break 
 
     def draw(self, screen: pygame.Surface) -> None:
-        if not self.facing_right:
-            flipped_image = pygame.transform.flip(self.image, True, False)
-            screen.blit(flipped_image, self.rect)
-        else:
-            screen.blit(self.image, self.rect)
+        screen.blit(self.image, self.rect)
         
         self.sword.draw(screen)
 
@@ -165,6 +171,7 @@ class Player(pygame.sprite.Sprite):
         self.health = data.get("health", self.health) # Usa o setter, que fará a validação
         self.coins = data.get("coins", self.coins)   # Usa o setter, que acionará o crescimento da espada
         self.facing_right = data.get("facing_right", self.facing_right)
+        self.image = self.animator.frame(self.facing_right)
         
         self.sword.current_growth_level = data.get("sword_growth_level", 0)
         self.sword.current_damage = data.get("sword_current_damage", 5) 
@@ -1,24 +1,25 @@
 import pygame
 import math
-from core.settings import SWORD_GROWTH_PER_COIN, COINS_FOR_SWORD_LEVEL_UP 
+from core.settings import SWORD_GROWTH_PER_COIN, COINS_FOR_SWORD_LEVEL_UP, SWORD_ROTATION_STEP_DEG, SWORD_ROTATION_PREFILL 
 from world.projectile import Projectile
+from core.asset_manager import asset_manager
+from core.rotation_cache import RotationCache
+from core.log import game_log
 
 class Sword(pygame.sprite.Sprite):
+    # Quadros da espada sem crescimento, compartilhados entre instâncias (cada partida nova
+    # começa no nível 0); os dos níveis de crescimento são de cada espada e liberados ao crescer
+    _base_rotation_cache: RotationCache | None = None
+
     def __init__(self) -> None:
         super().__init__()
 
-        try:
-            self.original_image = pygame.image.load("assets/images/sword.png").convert_alpha()
-            self.original_image = pygame.transform.scale(self.original_image, (45, 150)) 
-        except pygame.error:
-            print("Erro: Imagem da espada (sword.png) não encontrada. Usando um retângulo como placeholder.")
-            self.original_image = pygame.Surface((45, 150), pygame.SRCALPHA) 
-            self.original_image.fill((150, 150, 150)) 
-            pygame.draw.rect(self.original_image, (100, 50, 0), (15, 120, 15, 30)) 
+        self.original_image = asset_manager.get_image("assets/images/sword.png", (45, 150), placeholder=self._create_placeholder)
 
-        self.scaled_current_image = self.original_image.copy() 
+        self.scaled_current_image = self.original_image 
         self.image = self.scaled_current_image 
         self.rect = self.image.get_rect() 
+        self.drawn_angle: float = 0.0 # Ângulo quantizado do quadro atual (chave da máscara no cache)
 
         self.base_width: int = self.original_image.get_width()
         self.base_height: int = self.original_image.get_height()
@@ -40,6 +41,54 @@ class Sword(pygame.sprite.Sprite):
         self.SWING_OVERHEAD_LEFT_END_ANGLE = 135   
 
         self.sword_pivot_offset_local = pygame.math.Vector2(self.base_width / 2, self.base_height * 0.9)
+        if Sword._base_rotation_cache is None or Sword._base_rotation_cache.surface is not self.original_image:
+            Sword._base_rotation_cache = self._new_rotation_cache()
+        self.rotation_cache = Sword._base_rotation_cache
+
+    def _new_rotation_cache(self) -> RotationCache:
+        return RotationCache(self.scaled_current_image, SWORD_ROTATION_STEP_DEG, SWORD_ROTATION_PREFILL,
+                             prefill_angles=self._swing_angles())
+
+    def _swing_angles(self) -> set[float]:
+        """
+        Ângulos por onde um golpe passa: os dois arcos (um por frame do golpe) e a volta,
+        a swing_back_speed por frame, do fim de cada arco ou de um lado de repouso até
+        o repouso de cada lado. Outros caminhos (virar no meio da volta) saem sob demanda.
+        """
+        angles = {0.0, 180.0}
+        arcs = ((self.SWING_OVERHEAD_RIGHT_START_ANGLE, self.SWING_OVERHEAD_RIGHT_END_ANGLE),
+                (self.SWING_OVERHEAD_LEFT_START_ANGLE, self.SWING_OVERHEAD_LEFT_END_ANGLE))
+        for start, end in arcs:
+            for frame in range(self.swing_duration_frames + 1):
+                angles.add(start + (end - start) * frame / self.swing_duration_frames)
+        for origin in (self.SWING_OVERHEAD_RIGHT_END_ANGLE, self.SWING_OVERHEAD_LEFT_END_ANGLE, 0, 180):
+            for target in (0, 180):
+                angle = origin
+                while angle != target:
+                    angle = self._return_step(angle, target)
+                    angles.add(angle)
+        return angles
+
+    def _return_step(self, angle: float, target_angle: float) -> float:
+        """Um frame da volta da espada ao repouso: anda swing_back_speed pelo lado mais curto."""
+        angle = angle % 360
+        angle_diff = target_angle - angle
+        if angle_diff > 180:
+            angle_diff -= 360
+        elif angle_diff < -180:
+            angle_diff += 360
+
+        if abs(angle_diff) > self.swing_back_speed:
+            return angle + self.swing_back_speed if angle_diff > 0 else angle - self.swing_back_speed
+        return target_angle
+
+    @staticmethod
+    def _create_placeholder() -> pygame.Surface:
+        print("Erro: Imagem da espada (sword.png) não encontrada. Usando um retângulo como placeholder.")
+        image = pygame.Surface((45, 150), pygame.SRCALPHA) 
+        image.fill((150, 150, 150)) 
+        pygame.draw.rect(image, (100, 50, 0), (15, 120, 15, 30)) 
+        return image
 
     @property # Getter para current_damage
     def current_damage(self) -> int:
@@ -48,7 +97,7 @@ class Sword(pygame.sprite.Sprite):
     @current_damage.setter # Setter para current_damage
     def current_damage(self, value: int) -> None:
         self._current_damage = max(0, value) # Dano não deve ser negativo
-        print(f"Dano da espada atualizado para: {self._current_damage}")
+        game_log.debug("Dano da espada atualizado para: %d", self._current_damage)
 
     def _try_grow_by_coins(self, total_coins: int) -> None: 
         new_growth_level = total_coins // COINS_FOR_SWORD_LEVEL_UP
@@ -57,10 +106,17 @@ class Sword(pygame.sprite.Sprite):
             self.current_growth_level = new_growth_level
             new_height = self.base_height + (self.current_growth_level * SWORD_GROWTH_PER_COIN * 10)
             
+            # Cópia própria, fora do AssetManager: cada tamanho só serve a um nível e seria guardado para sempre
             self.scaled_current_image = pygame.transform.scale(self.original_image, (self.base_width, int(new_height)))
+            asset_manager.count_allocation()
             self.sword_pivot_offset_local = pygame.math.Vector2(self.base_width / 2, self.scaled_current_image.get_height() * 0.9)
 
-            print(f"Espada cresceu! Nível: {self.current_growth_level}, Altura: {new_height:.2f}px")
+            # Os quadros do nível anterior não servem mais para o novo tamanho: são liberados aqui
+            if self.rotation_cache is not Sword._base_rotation_cache:
+                self.rotation_cache.clear()
+            self.rotation_cache = self._new_rotation_cache()
+
+            game_log.info("Espada cresceu! Nível: %d, Altura: %.2fpx", self.current_growth_level, new_height)
             self.current_damage = 5 + (self.current_growth_level * 2) # Chama o setter da property
 
     def start_swing(self, direction: int) -> None:
@@ -90,26 +146,10 @@ class Sword(pygame.sprite.Sprite):
                 self.swing_angle = self.swing_end_angle 
 
         else: 
-            target_angle = 0 if player_facing_right else 180 
-            self.swing_angle = self.swing_angle % 360
-            target_angle = target_angle % 360
-
-            angle_diff = target_angle - self.swing_angle
-            if angle_diff > 180:
-                angle_diff -= 360
-            elif angle_diff < -180:
-                angle_diff += 360
-
-            if abs(angle_diff) > self.swing_back_speed:
-                if angle_diff > 0:
-                    self.swing_angle += self.swing_back_speed
-                else:
-                    self.swing_angle -= self.swing_back_speed
-            else:
-                self.swing_angle = target_angle
-            
+            self.swing_angle = self._return_step(self.swing_angle, 0 if player_facing_right else 180)
+
 
-        rotated_image = pygame.transform.rotate(self.scaled_current_image, self.swing_angle)
+        rotated_image, drawn_angle = self.rotation_cache.get(self.swing_angle)
         
         player_anchor_offset_x = 0 
         player_anchor_offset_y = -40 
@@ -117,7 +157,7 @@ class Sword(pygame.sprite.Sprite):
         player_anchor_world_x = player_center[0] + (player_anchor_offset_x if player_facing_right else -player_anchor_offset_x)
         player_anchor_world_y = player_center[1] + player_anchor_offset_y
 
-        rotated_pivot_offset = self.sword_pivot_offset_local.rotate(-self.swing_angle) 
+        rotated_pivot_offset = self.sword_pivot_offset_local.rotate(-drawn_angle) 
 
         new_topleft_x = player_anchor_world_x - rotated_pivot_offset.x
         new_topleft_y = player_anchor_world_y - rotated_pivot_offset.y
@@ -125,6 +165,22 @@ class Sword(pygame.sprite.Sprite):
         self.rect = rotated_image.get_rect(topleft=(new_topleft_x, new_topleft_y))
 
         self.image = rotated_image
+        self.drawn_angle = drawn_angle
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Máscara do quadro atual, guardada no RotationCache por (nível de crescimento, ângulo)."""
+        return self.rotation_cache.get_mask(self.drawn_angle)
+
+    def hits(self, sprite: pygame.sprite.Sprite) -> bool:
+        """
+        Teste por pixel entre a lâmina e o sprite. O teste de retângulos vem primeiro,
+        então a máscara só é consultada quando os retângulos já se tocam.
+        """
+        if not self.rect.colliderect(sprite.rect):
+            return False
+        offset = (sprite.rect.x - self.rect.x, sprite.rect.y - self.rect.y)
+        return self.mask.overlap(asset_manager.get_mask(sprite.image), offset) is not None
 
     def draw(self, screen: pygame.Surface) -> None:
         screen.blit(self.image, self.rect)
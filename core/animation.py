@@ -0,0 +1,89 @@
+import pygame
+from typing import Callable
+from core.asset_manager import asset_manager
+from core.sim_clock import sim_clock
+
+
+class Animation:
+    """
+    Quadros de uma animação, fatiados e espelhados uma única vez (AssetManager.get_sheet_frames).
+    Imutável e compartilhada por todas as instâncias de um tipo; o estado de cada
+    instância (quadro atual, tempo decorrido) fica no Animator.
+    """
+    __slots__ = ("frames", "frame_ms", "loop")
+
+    def __init__(self, frames: tuple[tuple[pygame.Surface, pygame.Surface], ...], frame_ms: float, loop: bool) -> None:
+        self.frames = frames
+        self.frame_ms = max(1.0, frame_ms)
+        self.loop = loop
+
+    @property
+    def duration_ms(self) -> float:
+        return self.frame_ms * len(self.frames)
+
+
+_library: dict[tuple, Animation] = {}
+
+
+def load_animation(path: str, frame_count: int = 1, size: tuple[int, int] | None = None, frame_ms: float = 100.0,
+                   loop: bool = True, placeholder: Callable[[], pygame.Surface] | None = None) -> Animation:
+    """
+    Retorna a animação de uma folha de sprites, criada só no primeiro pedido.
+    Args:
+        path (str): Caminho da folha (quadros lado a lado).
+        frame_count (int): Quantidade de quadros na folha.
+        size (tuple[int, int] | None): Tamanho de cada quadro; None mantém o original.
+        frame_ms (float): Duração de cada quadro, em ms de simulação.
+        loop (bool): Se False, a animação para no último quadro.
+        placeholder (Callable | None): Cria a folha substituta se a imagem não puder ser carregada.
+    """
+    key = (path, frame_count, size, frame_ms, loop)
+    animation = _library.get(key)
+    if animation is None:
+        frames = asset_manager.get_sheet_frames(path, frame_count, size, placeholder=placeholder)
+        animation = _library[key] = Animation(frames, frame_ms, loop)
+    return animation
+
+
+class Animator:
+    """
+    Estado de animação de um sprite: qual animação está tocando e há quanto tempo.
+    Avança com os passos da simulação (sim_clock.step_ms), então é determinístico
+    em replays e não cria nenhuma superfície durante o jogo.
+    """
+    __slots__ = ("animations", "state", "elapsed_ms")
+
+    def __init__(self, animations: dict[str, Animation], state: str) -> None:
+        """
+        Args:
+            animations (dict[str, Animation]): Animações por nome de estado.
+            state (str): Estado inicial.
+        """
+        self.animations = animations
+        self.state = state
+        self.elapsed_ms: float = 0.0
+
+    def play(self, state: str, restart: bool = False) -> None:
+        """Troca de estado; a animação só recomeça se o estado mudar (ou com `restart`)."""
+        if state != self.state or restart:
+            self.state = state
+            self.elapsed_ms = 0.0
+
+    def update(self, steps: int = 1) -> None:
+        """Avança `steps` passos de simulação."""
+        self.elapsed_ms += sim_clock.step_ms * steps
+        animation = self.animations[self.state]
+        if animation.loop and self.elapsed_ms >= animation.duration_ms:
+            self.elapsed_ms %= animation.duration_ms
+
+    @property
+    def finished(self) -> bool:
+        """True quando uma animação sem repetição já passou do último quadro."""
+        animation = self.animations[self.state]
+        return not animation.loop and self.elapsed_ms >= animation.duration_ms
+
+    def frame(self, facing_right: bool) -> pygame.Surface:
+        """Quadro atual, já virado para o lado pedido."""
+        animation = self.animations[self.state]
+        index = min(int(self.elapsed_ms // animation.frame_ms), len(animation.frames) - 1)
+        return animation.frames[index][facing_right]
@@ -0,0 +1,216 @@
+import pygame
+from collections import OrderedDict
+from typing import Callable, Iterable
+from core.settings import RENDER_SCALE_CACHE_MAX_ENTRIES
+
+
+class AssetManager:
+    """
+    Cache central de superfícies do jogo.
+    Cada imagem é carregada e redimensionada uma única vez e a mesma superfície
+    é compartilhada por todas as instâncias que a pedirem.
+    """
+    def __init__(self) -> None:
+        self._surfaces: dict[tuple, pygame.Surface] = {}
+        self._masks: dict[pygame.Surface, pygame.mask.Mask] = {}
+        # (superfície, escala) -> cópia reescalada; LRU, porque inclui textos do HUD que mudam sempre
+        self._scaled: OrderedDict[tuple[pygame.Surface, float], pygame.Surface] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.allocations: int = 0 # Superfícies criadas (carregadas, escaladas, espelhadas, rotacionadas)
+        self._frame_mark: int = 0
+
+    def get_image(self, path: str, size: tuple[int, int] | None = None, flags: int = pygame.SRCALPHA,
+                  placeholder: Callable[[], pygame.Surface] | None = None) -> pygame.Surface:
+        """
+        Retorna a superfície da imagem, carregando-a somente no primeiro pedido.
+        Args:
+            path (str): Caminho da imagem.
+            size (tuple[int, int] | None): Tamanho final da imagem; None mantém o original.
+            flags (int): pygame.SRCALPHA usa convert_alpha, 0 usa convert.
+            placeholder (Callable | None): Cria a superfície substituta se a imagem não puder ser carregada.
+        Returns:
+            pygame.Surface: Superfície compartilhada. Não deve ser alterada por quem a recebe.
+        """
+        key = (path, size, flags)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        try:
+            surface = self._load(path, flags)
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+                self.allocations += 1
+        except (pygame.error, FileNotFoundError):
+            if placeholder is None:
+                raise
+            surface = placeholder()
+            self.allocations += 1
+
+        self._surfaces[key] = surface
+        return surface
+
+    def _load(self, path: str, flags: int) -> pygame.Surface:
+        """Carrega a imagem original (sem escala), também reaproveitada entre tamanhos."""
+        key = (path, None, flags)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = pygame.image.load(path)
+            surface = surface.convert_alpha() if flags & pygame.SRCALPHA else surface.convert()
+            self.allocations += 1
+            self._surfaces[key] = surface
+        return surface
+
+    def get_flipped_pair(self, path: str, size: tuple[int, int] | None = None, flags: int = pygame.SRCALPHA,
+                         placeholder: Callable[[], pygame.Surface] | None = None) -> tuple[pygame.Surface, pygame.Surface]:
+        """
+        Retorna as versões da imagem viradas para a esquerda e para a direita.
+        A imagem original é considerada virada para a direita, então o par pode ser
+        indexado diretamente por um booleano `facing_right`.
+        Returns:
+            tuple[pygame.Surface, pygame.Surface]: (esquerda, direita), compartilhadas entre instâncias.
+        """
+        key = (path, size, flags, "flipped_pair")
+        pair = self._surfaces.get(key)
+        if pair is not None:
+            self.hits += 1
+            return pair
+
+        right = self.get_image(path, size, flags, placeholder)
+        left = pygame.transform.flip(right, True, False)
+        self.allocations += 1
+        pair = (left, right)
+        self._surfaces[key] = pair
+        return pair
+
+    def get_sheet_frames(self, path: str, frame_count: int, size: tuple[int, int] | None = None,
+                         flags: int = pygame.SRCALPHA,
+                         placeholder: Callable[[], pygame.Surface] | None = None) -> tuple[tuple[pygame.Surface, pygame.Surface], ...]:
+        """
+        Fatia uma folha de sprites (quadros lado a lado, da esquerda para a direita)
+        e retorna, para cada quadro, o par (esquerda, direita) já espelhado, como em
+        get_flipped_pair. O fatiamento acontece só no primeiro pedido.
+        Args:
+            path (str): Caminho da folha.
+            frame_count (int): Quantidade de quadros na folha.
+            size (tuple[int, int] | None): Tamanho final de cada quadro; None mantém o original.
+            flags (int): pygame.SRCALPHA usa convert_alpha, 0 usa convert.
+            placeholder (Callable | None): Cria a folha substituta se a imagem não puder ser carregada.
+        Returns:
+            tuple[tuple[pygame.Surface, pygame.Surface], ...]: Um par (esquerda, direita) por quadro.
+        """
+        key = (path, frame_count, size, flags, "sheet")
+        frames = self._surfaces.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        sheet_size = None if size is None else (size[0] * frame_count, size[1])
+        sheet = self.get_image(path, sheet_size, flags, placeholder)
+        frame_width = sheet.get_width() // frame_count
+        frames = []
+        for index in range(frame_count):
+            right = sheet.subsurface((index * frame_width, 0, frame_width, sheet.get_height())) # Compartilha os pixels da folha
+            frames.append((pygame.transform.flip(right, True, False), right))
+            self.allocations += 1
+        frames = tuple(frames)
+        self._surfaces[key] = frames
+        return frames
+
+    def get_mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """
+        Retorna a máscara de colisão de uma superfície compartilhada, criando-a só no primeiro pedido.
+        Só deve ser usado com superfícies que não mudam (as do cache, quadros de rotação).
+        """
+        mask = self._masks.get(surface)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            self._masks[surface] = mask
+        return mask
+
+    def get_scaled(self, surface: pygame.Surface, scale: float) -> pygame.Surface:
+        """
+        Retorna uma cópia da superfície multiplicada por `scale`, para a resolução
+        interna da renderização (ver core.render_scale). Guarda as últimas
+        RENDER_SCALE_CACHE_MAX_ENTRIES cópias.
+        """
+        key = (surface, scale)
+        scaled = self._scaled.get(key)
+        if scaled is not None:
+            self._scaled.move_to_end(key)
+            return scaled
+
+        width, height = surface.get_size()
+        scaled = pygame.transform.scale(surface, (max(1, round(width * scale)), max(1, round(height * scale))))
+        self.allocations += 1
+        self._scaled[key] = scaled
+        if len(self._scaled) > RENDER_SCALE_CACHE_MAX_ENTRIES:
+            self._scaled.popitem(last=False)
+        return scaled
+
+    def prewarm_scaled(self, surfaces: Iterable[pygame.Surface], scale: float, limit: int) -> bool:
+        """
+        Cria as cópias em `scale` que ainda faltam, no máximo `limit` por chamada,
+        para uma troca de resolução interna não criar todas no mesmo frame.
+        Returns:
+            bool: True quando todas as superfícies já têm cópia nessa escala.
+        """
+        missing = {surface for surface in surfaces if (surface, scale) not in self._scaled}
+        if len(missing) > RENDER_SCALE_CACHE_MAX_ENTRIES: # Não caberiam no cache de qualquer forma
+            return True
+        for surface in list(missing)[:limit]:
+            self.get_scaled(surface, scale)
+        return len(missing) <= limit
+
+    def keep_scaled_only(self, scale: float) -> None:
+        """Descarta as cópias reescaladas de outras escalas (chamado quando a resolução interna muda)."""
+        for key in [key for key in self._scaled if key[1] != scale]:
+            del self._scaled[key]
+
+    def count_allocation(self, amount: int = 1) -> None:
+        """Registra superfícies criadas fora do gerenciador (ex.: quadros de rotação)."""
+        self.allocations += amount
+
+    def begin_frame(self) -> None:
+        """Marca o início de um frame para a contagem de alocações por frame."""
+        self._frame_mark = self.allocations
+
+    @property
+    def frame_allocations(self) -> int:
+        """
+        Superfícies criadas desde o último begin_frame (mostrado no overlay do profiler, na
+        exportação e no resumo headless). Em combate normal deve ser zero. As exceções
+        esperadas são os primeiros usos: os quadros de rotação de um nível novo da espada,
+        gerados no primeiro golpe depois de crescer, e o primeiro ângulo de bola de fogo ou
+        valor de moeda que aparece na sessão.
+        """
+        return self.allocations - self._frame_mark
+
+    def clear(self) -> None:
+        """Descarta todas as superfícies em cache e zera os contadores."""
+        self._surfaces.clear()
+        self._masks.clear()
+        self._scaled.clear()
+        self.hits = 0
+        self.misses = 0
+        self.allocations = 0
+        self._frame_mark = 0
+
+    def stats(self) -> dict:
+        """Retorna os contadores de acertos/faltas do cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_surfaces": len(self._surfaces),
+            "cached_masks": len(self._masks),
+            "cached_scaled": len(self._scaled),
+            "allocations": self.allocations,
+            "frame_allocations": self.frame_allocations
+        }
+
+
+# Instância única usada por todos os sprites
+asset_manager = AssetManager()
@@ -0,0 +1,94 @@
+import pygame
+from typing import Callable, Iterable
+from core.settings import DIRTY_RECT_FULL_REDRAW_RATIO
+
+
+class DirtyRectRenderer:
+    """
+    Renderizador por regiões sujas.
+    O fundo estático é pré-desenhado em uma única superfície; a cada frame só as
+    regiões onde algum sprite mudou (apareceu, sumiu, se moveu ou trocou de imagem)
+    são limpas, redesenhadas e devolvidas para pygame.display.update(rects).
+    """
+    def __init__(self, size: tuple[int, int]) -> None:
+        """
+        Inicializa o renderizador.
+        Args:
+            size (tuple[int, int]): Tamanho da tela.
+        """
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.background = pygame.Surface(size).convert()
+        self._previous: list[tuple[pygame.Surface, pygame.Rect]] | None = None
+
+    def bake_background(self, draw_static: Callable[[pygame.Surface], None]) -> None:
+        """
+        Pré-desenha o fundo estático (céu, chão, plataformas) e força um redesenho completo.
+        Args:
+            draw_static (Callable): Função que desenha as partes estáticas na superfície recebida.
+        """
+        draw_static(self.background)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Faz o próximo frame redesenhar e atualizar a tela inteira."""
+        self._previous = None
+
+    def render(self, tela: pygame.Surface, itens: Iterable[tuple[pygame.Surface, pygame.Rect]]) -> list[pygame.Rect] | None:
+        """
+        Desenha os sprites do frame.
+        Args:
+            tela (pygame.Surface): Superfície da tela.
+            itens (Iterable): Pares (superfície, retângulo) na ordem de desenho.
+        Returns:
+            list[pygame.Rect] | None: Regiões a atualizar; None quando a tela inteira foi redesenhada.
+        """
+        current = [(surface, pygame.Rect(rect)) for surface, rect in itens]
+
+        if self._previous is None:
+            return self._render_full(tela, current)
+
+        previous_keys = {(id(surface), tuple(rect)) for surface, rect in self._previous}
+        current_keys = {(id(surface), tuple(rect)) for surface, rect in current}
+        dirty = [rect for surface, rect in self._previous if (id(surface), tuple(rect)) not in current_keys]
+        dirty += [rect for surface, rect in current if (id(surface), tuple(rect)) not in previous_keys]
+        dirty = self._merge([rect.clip(self.screen_rect) for rect in dirty])
+
+        if not dirty:
+            self._previous = current
+            return []
+
+        dirty_area = sum(rect.width * rect.height for rect in dirty)
+        if dirty_area > self.screen_rect.width * self.screen_rect.height * DIRTY_RECT_FULL_REDRAW_RATIO:
+            return self._render_full(tela, current)
+
+        rects = [rect for _, rect in current]
+        for area in dirty:
+            # O clip evita redesenhar (e reaplicar o alfa de) pixels fora da região suja
+            tela.set_clip(area)
+            tela.blit(self.background, area, area)
+            for i in area.collidelistall(rects):
+                tela.blit(current[i][0], rects[i])
+        tela.set_clip(None)
+
+        self._previous = current
+        return dirty
+
+    def _render_full(self, tela: pygame.Surface, current: list[tuple[pygame.Surface, pygame.Rect]]) -> None:
+        tela.blit(self.background, (0, 0))
+        tela.blits(current, doreturn=False)
+        self._previous = current
+        return None
+
+    @staticmethod
+    def _merge(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Une retângulos que se sobrepõem, para não redesenhar a mesma área duas vezes."""
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            if rect.width == 0 or rect.height == 0:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
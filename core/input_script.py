@@ -0,0 +1,46 @@
+import pygame
+import random
+
+
+class ScriptedInput:
+    """
+    Fonte de entrada roteirizada para rodar o jogo sem teclado (modo headless).
+    Gera, a partir de uma semente, uma sequência reprodutível de eventos de teclado
+    que imita um jogador andando, pulando e golpeando.
+    """
+    def __init__(self, seed: int = 0, min_hold_frames: int = 10, max_hold_frames: int = 60) -> None:
+        """
+        Inicializa o roteiro.
+        Args:
+            seed (int): Semente do gerador de ações.
+            min_hold_frames (int): Menor duração, em frames, de cada ação.
+            max_hold_frames (int): Maior duração, em frames, de cada ação.
+        """
+        self._rng = random.Random(seed)
+        self.min_hold_frames = min_hold_frames
+        self.max_hold_frames = max_hold_frames
+        self._held_key: int | None = None
+        self._next_change_frame: int = 0
+
+    def eventos(self, frame: int) -> list:
+        """
+        Retorna os eventos do frame indicado. Deve ser chamado com frames crescentes.
+        """
+        if frame < self._next_change_frame:
+            return []
+
+        eventos = []
+        if self._held_key is not None:
+            eventos.append(pygame.event.Event(pygame.KEYUP, key=self._held_key))
+            self._held_key = None
+
+        acao = self._rng.choice((pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, None))
+        if acao is not None:
+            eventos.append(pygame.event.Event(pygame.KEYDOWN, key=acao))
+            if acao == pygame.K_SPACE:
+                eventos.append(pygame.event.Event(pygame.KEYUP, key=acao))
+            else:
+                self._held_key = acao
+
+        self._next_change_frame = frame + self._rng.randint(self.min_hold_frames, self.max_hold_frames)
+        return eventos
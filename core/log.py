@@ -0,0 +1,162 @@
+import collections
+import os
+import sys
+import threading
+import time
+from core.settings import (LOG_LEVEL, LOG_CONSOLE_LEVEL, LOG_BUFFER_SIZE, LOG_RATE_LIMIT, LOG_RATE_WINDOW_S,
+                           LOG_FLUSH_INTERVAL_S)
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+
+class GameLog:
+    """
+    Log do jogo com níveis, limite de repetições por mensagem e buffer circular em memória.
+    Registrar uma mensagem só guarda o modelo e os argumentos: a formatação e a escrita
+    (arquivo e/ou console) acontecem no flush, que pode rodar numa thread de fundo.
+    Assim, setters chamados várias vezes por frame não fazem I/O no loop do jogo.
+    """
+    def __init__(self, level: int = LOG_LEVEL, console_level: int | None = LOG_CONSOLE_LEVEL,
+                 capacity: int = LOG_BUFFER_SIZE, rate_limit: int = LOG_RATE_LIMIT,
+                 rate_window_s: float = LOG_RATE_WINDOW_S) -> None:
+        """
+        Inicializa o log.
+        Args:
+            level (int): Nível mínimo guardado.
+            console_level (int | None): Nível mínimo escrito no console no flush; None desativa o console.
+            capacity (int): Tamanho do buffer circular.
+            rate_limit (int): Máximo de registros da mesma mensagem por janela.
+            rate_window_s (float): Duração da janela do limite, em segundos.
+        """
+        self.level: int = level
+        self.console_level: int | None = console_level
+        self.rate_limit: int = rate_limit
+        self.rate_window_s: float = rate_window_s
+
+        self._lock = threading.Lock()
+        self._records: collections.deque = collections.deque(maxlen=capacity) # (seq, tempo, nível, modelo, args, suprimidas)
+        self._sequence: int = 0
+        self._flushed_sequence: int = 0
+        self._rates: dict[str, list] = {} # modelo -> [início da janela, contagem, suprimidas]
+        self.suppressed: int = 0
+
+        self._file = None
+        self._flush_thread: threading.Thread | None = None
+        self._stop_flush = threading.Event()
+
+    def log(self, level: int, template: str, *args) -> None:
+        """
+        Registra uma mensagem. `template` segue o formato de % (ex.: "Moedas: %d") e também
+        identifica a mensagem para o limite de repetições.
+        """
+        if level < self.level:
+            return
+        now = time.monotonic()
+        with self._lock:
+            rate = self._rates.get(template)
+            if rate is None or now - rate[0] >= self.rate_window_s:
+                suppressed = rate[2] if rate is not None else 0
+                self._rates[template] = [now, 1, 0]
+            elif rate[1] < self.rate_limit:
+                rate[1] += 1
+                suppressed = 0
+            else:
+                rate[2] += 1
+                self.suppressed += 1
+                return
+            self._sequence += 1
+            self._records.append((self._sequence, now, level, template, args, suppressed))
+
+    def debug(self, template: str, *args) -> None:
+        self.log(DEBUG, template, *args)
+
+    def info(self, template: str, *args) -> None:
+        self.log(INFO, template, *args)
+
+    def warning(self, template: str, *args) -> None:
+        self.log(WARNING, template, *args)
+
+    def error(self, template: str, *args) -> None:
+        self.log(ERROR, template, *args)
+
+    @staticmethod
+    def _format(record: tuple) -> str:
+        _, timestamp, level, template, args, suppressed = record
+        try:
+            message = template % args if args else template
+        except (TypeError, ValueError):
+            message = f"{template} {args!r}"
+        if suppressed:
+            message += f" (+{suppressed} repetições suprimidas)"
+        return f"{timestamp:10.3f} {LEVEL_NAMES.get(level, level)}: {message}"
+
+    def recent(self, count: int = 20) -> list[str]:
+        """Últimas mensagens do buffer, já formatadas (ex.: para um overlay de depuração)."""
+        with self._lock:
+            records = list(self._records)[-count:]
+        return [self._format(record) for record in records]
+
+    def flush(self) -> int:
+        """
+        Escreve no arquivo e/ou console as mensagens registradas desde o último flush.
+        Returns:
+            int: Quantidade de mensagens escritas.
+        """
+        with self._lock:
+            pending = [record for record in self._records if record[0] > self._flushed_sequence]
+            dropped = self._sequence - self._flushed_sequence - len(pending) # Sobrescritas no buffer antes do flush
+            self._flushed_sequence = self._sequence
+        if not pending and not dropped:
+            return 0
+
+        lines = [self._format(record) for record in pending]
+        if dropped:
+            lines.insert(0, f"... {dropped} mensagens descartadas (buffer cheio)")
+        if self._file is not None:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+        if self.console_level is not None:
+            console = [self._format(record) for record in pending if record[2] >= self.console_level]
+            if console:
+                sys.stdout.write("\n".join(console) + "\n")
+        return len(pending)
+
+    def start_background_flush(self, path: str | None, interval_s: float = LOG_FLUSH_INTERVAL_S) -> None:
+        """
+        Inicia a thread que faz o flush periodicamente.
+        Args:
+            path (str | None): Arquivo onde as mensagens são acrescentadas; None escreve só no console.
+            interval_s (float): Intervalo entre os flushes.
+        """
+        self.stop_background_flush()
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(path, 'a', encoding='utf-8')
+        self._stop_flush.clear()
+        self._flush_thread = threading.Thread(target=self._flush_loop, args=(interval_s,), name="LogFlush", daemon=True)
+        self._flush_thread.start()
+
+    def _flush_loop(self, interval_s: float) -> None:
+        while not self._stop_flush.wait(interval_s):
+            self.flush()
+
+    def stop_background_flush(self) -> None:
+        """Para a thread de flush, escreve o que faltar e fecha o arquivo."""
+        if self._flush_thread is not None:
+            self._stop_flush.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Instância única usada pelo jogo
+game_log = GameLog()
@@ -0,0 +1,214 @@
+import csv
+import json
+import time
+import pygame
+from collections import deque
+from core.settings import PROFILER_WINDOW_FRAMES, PROFILER_OVERLAY_REFRESH_FRAMES
+from core.text_cache import text_cache
+
+
+class _Section:
+    """Gerenciador de contexto que mede um trecho do frame e soma o tempo no profiler."""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Section":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.add_time(self.name, time.perf_counter() - self.start)
+
+
+class FrameProfiler:
+    """
+    Mede quanto cada subsistema consome de cada frame.
+    Mantém uma janela móvel para percentis (p50, p95, p99), desenha um overlay
+    com sparklines e contagem de entidades e pode exportar os tempos de cada frame
+    para CSV ou JSONL.
+    """
+    def __init__(self, window: int = PROFILER_WINDOW_FRAMES) -> None:
+        """
+        Inicializa o profiler.
+        Args:
+            window (int): Quantidade de frames guardados para percentis e sparklines.
+        """
+        self.window: int = window
+        self.history: dict[str, deque] = {}
+        self.counts: dict[str, int] = {}
+        self.overlay_visible: bool = False
+        self.frame_index: int = 0
+
+        self._sections: dict[str, _Section] = {}
+        self._current: dict[str, float] = {}
+        self._frame_start: float | None = None
+
+        self._export_file = None
+        self._export_format: str | None = None
+        self._csv_writer: csv.DictWriter | None = None
+        self._csv_columns: list[str] = []
+
+        self._overlay_lines: list[pygame.Surface] = []
+
+    def section(self, name: str) -> _Section:
+        """
+        Retorna um gerenciador de contexto que mede o trecho indicado.
+        Ex.: `with profiler.section("colisoes"): ...`
+        """
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Soma um tempo (em segundos) ao trecho indicado no frame atual."""
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def begin_frame(self) -> None:
+        """Marca o início de um frame."""
+        self._frame_start = time.perf_counter()
+        self._current = {}
+
+    def end_frame(self) -> None:
+        """Fecha o frame: guarda os tempos na janela móvel e exporta a linha, se houver exportação."""
+        if self._frame_start is None:
+            return
+        self._current["frame"] = time.perf_counter() - self._frame_start
+        self._frame_start = None
+
+        for name, seconds in self._current.items():
+            samples = self.history.get(name)
+            if samples is None:
+                samples = self.history[name] = deque(maxlen=self.window)
+            samples.append(seconds * 1000.0)
+
+        if self._export_file is not None:
+            self._export_row()
+        self.frame_index += 1
+
+    def percentiles(self, name: str) -> dict[str, float]:
+        """
+        Retorna p50, p95 e p99 (em ms) do trecho indicado na janela atual.
+        """
+        samples = self.history.get(name)
+        if not samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            "p50": ordered[round(last * 0.50)],
+            "p95": ordered[round(last * 0.95)],
+            "p99": ordered[round(last * 0.99)]
+        }
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Percentis de todos os trechos medidos."""
+        return {name: self.percentiles(name) for name in self.history}
+
+    def set_counts(self, counts: dict[str, int]) -> None:
+        """Informa a contagem de entidades por grupo, mostrada no overlay e exportada."""
+        self.counts = counts
+
+    # Exportação
+
+    def start_export(self, path: str) -> None:
+        """
+        Começa a gravar os tempos de cada frame. O formato vem da extensão: .csv ou .jsonl.
+        """
+        self.stop_export()
+        self._export_format = "csv" if path.lower().endswith(".csv") else "jsonl"
+        self._export_file = open(path, "w+", encoding="utf-8", newline="")
+        self._csv_writer = None
+        self._csv_columns = []
+
+    def stop_export(self) -> None:
+        """Fecha o arquivo de exportação, se houver."""
+        if self._export_file is not None:
+            self._export_file.close()
+        self._export_file = None
+        self._csv_writer = None
+
+    def _export_row(self) -> None:
+        row = {"frame_index": self.frame_index}
+        row.update({f"{name}_ms": round(seconds * 1000.0, 4) for name, seconds in self._current.items()})
+        row.update(self.counts)
+        if self._export_format == "csv":
+            if self._csv_writer is None or any(name not in self._csv_writer.fieldnames for name in row):
+                self._rewrite_csv_header(row)
+            self._csv_writer.writerow(row)
+        else:
+            self._export_file.write(json.dumps(row, separators=(",", ":")) + "\n")
+
+    def _rewrite_csv_header(self, row: dict) -> None:
+        """
+        Acrescenta as colunas novas de `row` (trechos ou grupos que aparecem só
+        depois, como a troca de cena) e regrava o arquivo com o cabeçalho ampliado.
+        Linhas antigas ficam com a coluna vazia. Acontece poucas vezes por exportação.
+        """
+        self._csv_columns.extend(name for name in row if name not in self._csv_columns)
+        previous: list[dict] = []
+        if self._csv_writer is not None:
+            self._export_file.seek(0)
+            previous = list(csv.DictReader(self._export_file))
+            self._export_file.seek(0)
+            self._export_file.truncate()
+        self._csv_writer = csv.DictWriter(self._export_file, fieldnames=self._csv_columns)
+        self._csv_writer.writeheader()
+        self._csv_writer.writerows(previous)
+
+    # Overlay
+
+    def toggle_overlay(self) -> None:
+        """Mostra ou esconde o overlay de desempenho."""
+        self.overlay_visible = not self.overlay_visible
+        self._overlay_lines = []
+
+    def draw_overlay(self, tela: pygame.Surface) -> None:
+        """
+        Desenha, no canto superior direito, os percentis de cada trecho,
+        a contagem de entidades e a sparkline do tempo de frame.
+        """
+        if not self.overlay_visible:
+            return
+
+        if not self._overlay_lines or self.frame_index % PROFILER_OVERLAY_REFRESH_FRAMES == 0:
+            lines = []
+            for name, p in self.summary().items():
+                lines.append(f"{name}: p50 {p['p50']:.2f}  p95 {p['p95']:.2f}  p99 {p['p99']:.2f} ms")
+            if self.counts:
+                lines.append("  ".join(f"{name}: {count}" for name, count in self.counts.items()))
+            self._overlay_lines = [text_cache.render(line, (255, 255, 255), None, 20) for line in lines]
+
+        largura = 360
+        sparkline_altura = 40
+        altura = 8 + 16 * len(self._overlay_lines) + sparkline_altura + 8
+        x = tela.get_width() - largura - 10
+        y = 10
+
+        painel = pygame.Rect(x, y, largura, altura)
+        pygame.draw.rect(tela, (0, 0, 0), painel)
+        pygame.draw.rect(tela, (255, 255, 255), painel, 1)
+
+        for i, surface in enumerate(self._overlay_lines):
+            tela.blit(surface, (x + 6, y + 6 + i * 16))
+
+        self._draw_sparkline(tela, pygame.Rect(x + 6, painel.bottom - sparkline_altura - 4, largura - 12, sparkline_altura))
+
+    def _draw_sparkline(self, tela: pygame.Surface, area: pygame.Rect) -> None:
+        samples = self.history.get("frame")
+        if not samples or len(samples) < 2 or self.window <= 1:
+            return
+        escala_ms = 33.3 # Topo da área = 2 frames a 60 FPS
+        orcamento_y = area.bottom - area.height * (16.6 / escala_ms)
+        pygame.draw.line(tela, (90, 90, 90), (area.left, orcamento_y), (area.right, orcamento_y))
+
+        passo = area.width / (self.window - 1)
+        pontos = [
+            (area.left + i * passo, area.bottom - area.height * min(1.0, ms / escala_ms))
+            for i, ms in enumerate(samples)
+        ]
+        pygame.draw.lines(tela, (0, 255, 0), False, pontos)
@@ -0,0 +1,155 @@
+import pygame
+from typing import Iterable
+from core.asset_manager import asset_manager
+from core.settings import RENDER_QUEUE_SORT_TEXTURES
+
+# Camadas de desenho, da mais ao fundo para a mais à frente
+LAYER_PLATFORMS: int = 0
+LAYER_TREES: int = 1
+LAYER_MONSTERS: int = 2
+LAYER_PROJECTILES: int = 3
+LAYER_COINS: int = 4
+LAYER_PLAYER: int = 5
+LAYER_SWORD: int = 6
+LAYER_HUD: int = 7
+
+
+class RenderQueue:
+    """
+    Fila de desenho de um frame: junta pares (superfície, retângulo) de todas as
+    camadas, descarta o que está fora da área visível e envia cada camada à tela
+    numa única chamada Surface.blits(..., doreturn=False).
+    Dentro de uma camada, os itens saem na ordem em que entraram. Com sort_textures,
+    são agrupados pela superfície (textura) para que os blits da mesma imagem saiam
+    seguidos; isso troca quem fica por cima entre sprites sobrepostos de texturas
+    diferentes, então só serve para cenas em que a ordem dentro da camada não importa.
+    A ordem entre camadas é sempre mantida.
+    A mesma fila é reaproveitada a cada frame, sem recriar as listas.
+    Com uma escala diferente de 1 (resolução interna, ver core.render_scale), posições
+    e superfícies do mundo são reescaladas ao entrar na fila; as cópias ficam no AssetManager.
+    Itens de tela (HUD) nunca são reescalados: com escala 1 saem no mesmo flush, por cima
+    do mundo; com outra escala ficam para flush_screen, chamado sobre a janela depois
+    de RenderScaler.present.
+    """
+    def __init__(self, sort_textures: bool = RENDER_QUEUE_SORT_TEXTURES) -> None:
+        """
+        Args:
+            sort_textures (bool): Agrupa os itens de cada camada pela superfície antes de desenhar
+                (desligado por padrão: muda a sobreposição dentro da camada).
+        """
+        self.sort_textures: bool = sort_textures
+        self._layers: dict[int, list[tuple[pygame.Surface, pygame.Rect]]] = {}
+        self._screen_layers: dict[int, list[tuple[pygame.Surface, pygame.Rect]]] = {}
+        self._view: pygame.Rect | None = None
+        self._offset: tuple[int, int] = (0, 0)
+        self._scale: float = 1.0
+        self.queued: int = 0 # Itens aceitos desde o último begin
+        self.culled: int = 0 # Itens descartados por estarem fora da área visível
+        self.batches: int = 0 # Chamadas a blits no último flush
+
+    def begin(self, view_rect: pygame.Rect | None = None, scale: float = 1.0) -> None:
+        """
+        Começa um frame novo.
+        Args:
+            view_rect (pygame.Rect | None): Área visível em coordenadas do mundo; None desenha tudo sem deslocamento.
+            scale (float): Escala da superfície de destino em relação às coordenadas da tela.
+        """
+        for items in self._layers.values():
+            items.clear()
+        for items in self._screen_layers.values():
+            items.clear()
+        self._view = view_rect
+        self._offset = (0, 0) if view_rect is None else (-view_rect.x, -view_rect.y)
+        self._scale = scale
+        self.queued = 0
+        self.culled = 0
+
+    def add(self, surface: pygame.Surface, rect: pygame.Rect, layer: int) -> None:
+        """Enfileira uma superfície posicionada em coordenadas do mundo."""
+        if self._view is not None and not self._view.colliderect(rect):
+            self.culled += 1
+            return
+        self._layer(layer).append(self._scaled(surface, rect.move(self._offset)))
+        self.queued += 1
+
+    def add_sprites(self, sprites: Iterable[pygame.sprite.Sprite], layer: int) -> None:
+        """Enfileira a imagem de cada sprite (em coordenadas do mundo) que estiver visível."""
+        if self._scale != 1.0:
+            for sprite in sprites:
+                self.add(sprite.image, sprite.rect, layer)
+            return
+        items = self._layer(layer)
+        before = len(items)
+        offset = self._offset
+        view = self._view
+        if view is None:
+            items.extend((sprite.image, sprite.rect.move(offset)) for sprite in sprites)
+            self.queued += len(items) - before
+            return
+        total = 0
+        for sprite in sprites:
+            total += 1
+            rect = sprite.rect
+            if view.colliderect(rect):
+                items.append((sprite.image, rect.move(offset)))
+        added = len(items) - before
+        self.queued += added
+        self.culled += total - added
+
+    def add_screen(self, surface: pygame.Surface, rect: pygame.Rect, layer: int) -> None:
+        """Enfileira uma superfície já em coordenadas da janela (HUD), sem descarte, deslocamento nem escala."""
+        self._layer(layer, self._screen_layers).append((surface, rect))
+        self.queued += 1
+
+    def _scaled(self, surface: pygame.Surface, rect: pygame.Rect) -> tuple[pygame.Surface, pygame.Rect]:
+        scale = self._scale
+        if scale == 1.0:
+            return surface, rect
+        surface = asset_manager.get_scaled(surface, scale)
+        return surface, surface.get_rect(topleft=(round(rect.x * scale), round(rect.y * scale)))
+
+    def _layer(self, layer: int, layers: dict | None = None) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        layers = self._layers if layers is None else layers
+        items = layers.get(layer)
+        if items is None:
+            items = layers[layer] = []
+        return items
+
+    def _sorted_layers(self) -> list[list[tuple[pygame.Surface, pygame.Rect]]]:
+        layers = [self._layers[layer] for layer in sorted(self._layers) if self._layers[layer]]
+        if self.sort_textures:
+            for items in layers:
+                items.sort(key=lambda item: id(item[0])) # Estável: a ordem de chegada vale dentro da textura
+        return layers
+
+    def _screen_items(self) -> list[list[tuple[pygame.Surface, pygame.Rect]]]:
+        return [self._screen_layers[layer] for layer in sorted(self._screen_layers) if self._screen_layers[layer]]
+
+    def items(self, screen: bool = True) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Todos os itens do frame, na ordem de desenho (usado pelo DirtyRectRenderer).
+        Args:
+            screen (bool): Inclui os itens de tela (HUD) depois dos do mundo.
+        """
+        layers = self._sorted_layers() + (self._screen_items() if screen else [])
+        return [item for items in layers for item in items]
+
+    def flush(self, target: pygame.Surface) -> None:
+        """
+        Desenha as camadas em ordem, uma chamada blits por camada. Os itens de tela
+        entram aqui só com escala 1; com outra escala, ver flush_screen.
+        """
+        layers = self._sorted_layers()
+        if self._scale == 1.0:
+            layers += self._screen_items()
+        for items in layers:
+            target.blits(items, doreturn=False)
+        self.batches = len(layers)
+
+    def flush_screen(self, window: pygame.Surface) -> None:
+        """Desenha os itens de tela (HUD) na janela, depois de a cena reescalada ter sido esticada para ela."""
+        for items in self._screen_items():
+            window.blits(items, doreturn=False)
+
+    def __len__(self) -> int:
+        return self.queued
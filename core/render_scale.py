@@ -0,0 +1,103 @@
+import pygame
+from collections import deque
+from core.settings import (FPS, RENDER_SCALE, RENDER_SCALE_ADAPTIVE, RENDER_SCALE_MIN, RENDER_SCALE_STEP,
+                           RENDER_SCALE_WINDOW_FRAMES)
+
+
+class RenderScaler:
+    """
+    Resolução interna da renderização. A cena desenha numa superfície fora da tela,
+    de tamanho janela × escala, que é esticada para a janela uma vez por frame.
+    No modo adaptativo, a escala desce um passo quando o tempo médio de trabalho
+    do frame passa do orçamento (1000 / FPS) e sobe de volta, até a escala
+    configurada, quando sobra bastante tempo. A escala nova fica pendente até
+    quem desenha preparar as cópias reescaladas e chamar apply_pending().
+    """
+    def __init__(self, window_size: tuple[int, int], scale: float = RENDER_SCALE,
+                 adaptive: bool = RENDER_SCALE_ADAPTIVE, min_scale: float = RENDER_SCALE_MIN,
+                 step: float = RENDER_SCALE_STEP, window_frames: int = RENDER_SCALE_WINDOW_FRAMES,
+                 budget_ms: float | None = None) -> None:
+        """
+        Args:
+            window_size (tuple[int, int]): Tamanho da janela.
+            scale (float): Escala pedida; no modo adaptativo, é também o teto.
+            adaptive (bool): Ajusta a escala pelo tempo de frame.
+            min_scale (float): Menor escala do modo adaptativo.
+            step (float): Passo de cada ajuste.
+            window_frames (int): Frames na média antes de cada ajuste.
+            budget_ms (float | None): Orçamento do frame; None usa 1000 / FPS.
+        """
+        self.window_size: tuple[int, int] = window_size
+        self.target_scale: float = max(0.1, scale)
+        self.adaptive: bool = adaptive
+        self.min_scale: float = min(max(0.1, min_scale), self.target_scale)
+        self.step: float = max(0.01, step)
+        self.budget_ms: float = budget_ms if budget_ms is not None else 1000.0 / max(1, FPS)
+        self._samples: deque[float] = deque(maxlen=max(1, window_frames))
+        self._surface: pygame.Surface | None = None
+        self.scale: float = self.target_scale
+        self.pending_scale: float | None = None # Escala decidida pelo modo adaptativo, ainda não aplicada
+        self.changes: int = 0 # Ajustes feitos pelo modo adaptativo
+
+    @property
+    def active(self) -> bool:
+        """True quando a cena é desenhada fora da tela (escala diferente de 1)."""
+        return self.scale != 1.0
+
+    def set_scale(self, scale: float) -> None:
+        """Define a escala pedida (e o teto do modo adaptativo)."""
+        self.target_scale = max(0.1, scale)
+        self.min_scale = min(self.min_scale, self.target_scale)
+        self.scale = self.target_scale
+        self.pending_scale = None
+        self._samples.clear()
+
+    def surface(self) -> pygame.Surface:
+        """Superfície interna do tamanho atual, recriada só quando a escala muda."""
+        width, height = self.window_size
+        size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+        if self._surface is None or self._surface.get_size() != size:
+            self._surface = pygame.Surface(size).convert()
+        return self._surface
+
+    def present(self, window: pygame.Surface) -> None:
+        """Estica a superfície interna para a janela."""
+        pygame.transform.scale(self.surface(), window.get_size(), window)
+
+    def record_frame(self, work_ms: float) -> bool:
+        """
+        Registra o tempo de trabalho de um frame (sem a espera do limite de FPS).
+        Returns:
+            bool: True se uma escala nova ficou pendente (ver pending_scale e apply_pending).
+        """
+        if not self.adaptive or self.pending_scale is not None:
+            return False
+        self._samples.append(work_ms)
+        if len(self._samples) < self._samples.maxlen:
+            return False
+
+        average = sum(self._samples) / len(self._samples)
+        scale = self.scale
+        if average > self.budget_ms and scale > self.min_scale:
+            scale = max(self.min_scale, scale - self.step)
+        elif average < self.budget_ms * 0.6 and scale < self.target_scale:
+            scale = min(self.target_scale, scale + self.step)
+        self._samples.clear()
+        if scale == self.scale:
+            return False
+        self.pending_scale = scale
+        return True
+
+    def apply_pending(self) -> bool:
+        """
+        Passa a usar a escala pendente.
+        Returns:
+            bool: True se a escala mudou (quem desenha por dirty rects deve redesenhar tudo).
+        """
+        if self.pending_scale is None:
+            return False
+        self.scale = self.pending_scale
+        self.pending_scale = None
+        self.changes += 1
+        self._samples.clear()
+        return True
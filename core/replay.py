@@ -0,0 +1,129 @@
+import base64
+import gzip
+import hashlib
+import json
+import pygame
+from core.sim_clock import sim_clock
+from world.physics_store import physics_store
+
+REPLAY_VERSION = 1
+_KEY_EVENT_TYPES = {pygame.KEYDOWN: 1, pygame.KEYUP: 0}
+_EVENT_TYPES_BY_CODE = {code: event_type for event_type, code in _KEY_EVENT_TYPES.items()}
+
+
+def state_hash(cena) -> bytes:
+    """
+    Resumo (8 bytes) do estado da simulação de uma CenaJogo: relógio, jogador, espada
+    e todos os elementos carregados do ambiente. Dois estados iguais têm o mesmo resumo;
+    floats entram pelo repr, então qualquer diferença de bit muda o resultado.
+    """
+    player = cena.player
+    sword = player.sword
+    environment = cena.environment
+    state = [
+        sim_clock.step_count,
+        tuple(player.rect), player.health, player.coins, player.velocity_y, player.facing_right,
+        sword.swing_active, sword.swing_angle, sword.current_growth_level,
+        sorted(environment.loaded_chunks),
+        [(tuple(tree.rect), tree.health, tree.is_cut) for tree in environment.trees],
+        [(tuple(monster.rect), monster.health, monster.direction, monster.velocity_y) for monster in environment.monsters],
+        [(tuple(coin.rect), coin.value, coin.velocity_y) for coin in environment.coins],
+        [(tuple(projectile.rect), projectile.is_active, projectile.repelled) for projectile in environment.projectiles()],
+    ]
+    return hashlib.blake2b(repr(state).encode("utf-8"), digest_size=8).digest()
+
+
+class ReplayRecorder:
+    """
+    Grava, passo a passo, os eventos de teclado entregues a CenaJogo.atualizar e o
+    resumo do estado depois de cada passo. Junto com a semente, isso basta para
+    reproduzir a partida exatamente (ver ReplayPlayer).
+    """
+    def __init__(self, seed: int) -> None:
+        """
+        Inicializa o gravador.
+        Args:
+            seed (int): Semente do RNG global usada no início da partida gravada.
+        """
+        self.seed: int = seed
+        self.frames: int = 0
+        self._events: list[list[int]] = [] # [frame, tipo (1 = KEYDOWN, 0 = KEYUP), tecla]
+        self._hashes: list[bytes] = []
+
+    def record_step(self, frame: int, eventos: list, cena) -> None:
+        """Registra os eventos de teclado de um passo e o estado resultante."""
+        for evento in eventos:
+            code = _KEY_EVENT_TYPES.get(evento.type)
+            if code is not None:
+                self._events.append([frame, code, evento.key])
+        self._hashes.append(state_hash(cena))
+        self.frames = frame + 1
+
+    def save(self, path: str) -> None:
+        """Grava o replay em um arquivo JSON compactado com gzip."""
+        data = {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "frames": self.frames,
+            "step_ms": sim_clock.step_ms,
+            "numpy_physics": physics_store is not None,
+            "events": self._events,
+            "hashes": base64.b64encode(b"".join(self._hashes)).decode("ascii")
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        print(f"Replay gravado em {path}: {self.frames} frames, {len(self._events)} eventos.")
+
+
+class ReplayPlayer:
+    """
+    Reproduz um replay: entrega os eventos gravados frame a frame (como um ScriptedInput)
+    e compara o resumo do estado de cada passo com o gravado.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Carrega o replay.
+        Args:
+            path (str): Arquivo gravado por ReplayRecorder.save.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Versão de replay não suportada: {data.get('version')}")
+
+        self.seed: int = data["seed"]
+        self.frames: int = data["frames"]
+        raw_hashes = base64.b64decode(data["hashes"])
+        self._hashes: list[bytes] = [raw_hashes[i:i + 8] for i in range(0, len(raw_hashes), 8)]
+        self._events_by_frame: dict[int, list] = {}
+        for frame, code, key in data["events"]:
+            self._events_by_frame.setdefault(frame, []).append(pygame.event.Event(_EVENT_TYPES_BY_CODE[code], key=key))
+
+        self.checked_frames: int = 0
+        self.mismatches: int = 0
+        self.first_mismatch: int | None = None
+
+        if data.get("step_ms") != sim_clock.step_ms:
+            print(f"Aviso: replay gravado com passo de {data.get('step_ms')} ms; o atual é {sim_clock.step_ms} ms.")
+        if data.get("numpy_physics") != (physics_store is not None):
+            print("Aviso: replay gravado com outro backend de física (NumPy/Python); o estado pode divergir.")
+
+    def eventos(self, frame: int) -> list:
+        """Eventos gravados para o frame indicado."""
+        return self._events_by_frame.get(frame, [])
+
+    def check_step(self, frame: int, eventos: list, cena) -> None:
+        """Compara o estado depois do passo com o gravado."""
+        if frame >= len(self._hashes):
+            return
+        self.checked_frames += 1
+        if state_hash(cena) != self._hashes[frame]:
+            self.mismatches += 1
+            if self.first_mismatch is None:
+                self.first_mismatch = frame
+                print(f"Replay divergiu no frame {frame}.")
+
+    @property
+    def identical(self) -> bool:
+        """Indica se todos os frames conferidos tiveram o mesmo estado da gravação."""
+        return self.mismatches == 0 and self.checked_frames == len(self._hashes)
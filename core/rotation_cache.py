@@ -0,0 +1,98 @@
+import pygame
+import threading
+from typing import Iterable
+from core.asset_manager import asset_manager
+
+
+class RotationCache:
+    """
+    Guarda quadros rotacionados de uma superfície em ângulos quantizados.
+    Os quadros são gerados sob demanda ou, opcionalmente, em uma thread de fundo.
+    Só os gerados sob demanda contam como alocações do frame no AssetManager; os da
+    thread de fundo ficam em `prefilled`, para não aparecerem como picos no frame em que
+    a thread por acaso trabalhou.
+    A máscara de colisão de cada quadro também é guardada, criada só quando pedida.
+    """
+    def __init__(self, surface: pygame.Surface, angle_step: float = 3.0, prefill: bool = False,
+                 prefill_angles: Iterable[float] | None = None) -> None:
+        """
+        Inicializa o cache.
+        Args:
+            surface (pygame.Surface): Superfície base (não rotacionada).
+            angle_step (float): Passo de quantização dos ângulos, em graus.
+            prefill (bool): Se True, gera quadros em segundo plano. pygame.transform.rotate
+                segura o GIL, então a thread atrasa o loop principal enquanto trabalha.
+            prefill_angles (Iterable[float] | None): Ângulos gerados pela thread; None gera todos.
+        """
+        self.surface = surface
+        self.angle_step: float = max(0.1, angle_step)
+        self.frame_count: int = max(1, round(360 / self.angle_step))
+        self._frames: dict[int, pygame.Surface] = {}
+        self._masks: dict[int, pygame.mask.Mask] = {}
+        self._cancelled = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.hits: int = 0
+        self.misses: int = 0
+        self.prefilled: int = 0 # Quadros gerados pela thread de fundo
+        self._prefill_indices: list[int] = (list(range(self.frame_count)) if prefill_angles is None
+                                            else sorted({self._index(angle) for angle in prefill_angles}))
+
+        if prefill:
+            self.prefill_in_background()
+
+    def _index(self, angle: float) -> int:
+        """Converte um ângulo em graus para o índice do quadro quantizado."""
+        return round((angle % 360) / self.angle_step) % self.frame_count
+
+    def _render(self, index: int) -> pygame.Surface:
+        return pygame.transform.rotate(self.surface, index * self.angle_step)
+
+    def get(self, angle: float) -> tuple[pygame.Surface, float]:
+        """
+        Retorna o quadro mais próximo do ângulo pedido.
+        Returns:
+            tuple[pygame.Surface, float]: O quadro rotacionado e o ângulo quantizado que ele representa.
+        """
+        index = self._index(angle)
+        frame = self._frames.get(index)
+        if frame is None:
+            self.misses += 1
+            asset_manager.count_allocation()
+            frame = self._frames.setdefault(index, self._render(index))
+        else:
+            self.hits += 1
+        return frame, index * self.angle_step
+
+    def get_mask(self, angle: float) -> pygame.mask.Mask:
+        """Retorna a máscara de colisão do quadro mais próximo do ângulo pedido."""
+        index = self._index(angle)
+        mask = self._masks.get(index)
+        if mask is None:
+            frame, _ = self.get(angle)
+            mask = self._masks.setdefault(index, pygame.mask.from_surface(frame))
+        return mask
+
+    def prefill_in_background(self) -> None:
+        """Inicia uma thread que gera os quadros de prefill_angles ainda ausentes."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._cancelled.clear()
+        self._thread = threading.Thread(target=self._prefill, daemon=True)
+        self._thread.start()
+
+    def _prefill(self) -> None:
+        for index in self._prefill_indices:
+            if self._cancelled.is_set():
+                return
+            if index not in self._frames:
+                self._frames.setdefault(index, self._render(index))
+                self.prefilled += 1
+
+    def clear(self) -> None:
+        """Interrompe a geração em segundo plano e descarta os quadros e máscaras guardados."""
+        self._cancelled.set()
+        self._frames.clear()
+        self._masks.clear()
+
+    def __len__(self) -> int:
+        return len(self._frames)
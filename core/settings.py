@@ -33,3 +33,92 @@ ASSETS_DIR: str = "assets/"
 IMAGE_DIR: str = ASSETS_DIR + "images/"
 SOUND_DIR: str = ASSETS_DIR + "sounds/"
 FONT_DIR: str = ASSETS_DIR + "fonts/"
+
+# Cache de rotação da espada
+SWORD_ROTATION_STEP_DEG: float = 3.0 # Ângulos são arredondados para múltiplos deste passo
+SWORD_ROTATION_PREFILL: bool = False # Gera em segundo plano os quadros do golpe ao crescer a espada; desligado, cada quadro é gerado no primeiro uso
+
+# Cache de textos renderizados
+TEXT_CACHE_MAX_ENTRIES: int = 256
+
+# Broadphase de colisões (hash espacial em grade uniforme)
+SPATIAL_HASH_CELL_SIZE: int = 128
+
+# Projéteis
+PROJECTILE_ROTATION_STEP_DEG: float = 5.0
+PROJECTILE_POOL_MAX_SIZE: int = 256 # Máximo de projéteis inativos guardados para reuso
+
+# Salvamento
+AUTOSAVE_INTERVAL_S: float = 60.0 # Intervalo do salvamento automático durante o jogo; 0 desativa
+
+# Profiler de frames
+PROFILER_WINDOW_FRAMES: int = 300 # Frames usados nos percentis e sparklines
+PROFILER_OVERLAY_REFRESH_FRAMES: int = 15 # De quantos em quantos frames o texto do overlay é atualizado
+
+# Renderização por regiões sujas (dirty rects)
+DIRTY_RECT_RENDERING: bool = False # Atualiza só as regiões da tela que mudaram, em vez de dar flip na tela toda
+DIRTY_RECT_FULL_REDRAW_RATIO: float = 0.5 # Acima desta fração da tela suja, redesenha tudo
+
+# Simulação em passo fixo
+SIMULATION_HZ: int = 60 # Passos de física por segundo, independente do FPS de renderização
+MAX_CATCHUP_STEPS: int = 5 # Máximo de passos de simulação por frame quando a renderização atrasa
+RENDER_INTERPOLATION: bool = True # Interpola posições entre os dois últimos passos ao desenhar
+
+# Física em lote com NumPy (moedas e projéteis); só é usada se o NumPy estiver instalado
+USE_NUMPY_PHYSICS: bool = True
+
+# Moedas
+COIN_DENOMINATIONS: tuple[int, ...] = (25, 10, 5, 1) # Valores das pilhas de moedas geradas nos drops, do maior para o menor
+COIN_MERGE_INTERVAL_FRAMES: int = 30 # De quantos em quantos frames moedas paradas e sobrepostas são juntadas numa pilha
+
+# Mundo em chunks e câmera
+CHUNK_WIDTH: int = 1280 # Largura (px) de cada pedaço do mundo
+CHUNK_LOAD_RADIUS: int = 1 # Chunks mantidos carregados de cada lado do chunk do jogador
+CHUNK_SAVE_DIR: str = "save_data/chunks" # Onde ficam os chunks descarregados durante a sessão
+CHUNK_CACHE_MAX_ENTRIES: int = 16 # Chunks descarregados (já gravados) mantidos em memória; o resto é lido do disco
+PROJECTILE_CULL_MARGIN: int = 200 # Projéteis além desta distância (px) da área visível são desativados
+
+# Nível de detalhe da IA (monstros longe do jogador atualizam menos)
+AI_LOD_ENABLED: bool = True
+AI_NEAR_RADIUS: int = 1400 # Até esta distância do jogador (px), IA completa a cada frame
+# Além desta distância, a IA fica congelada até o jogador se aproximar. Só há monstros nos chunks
+# carregados (até uns (CHUNK_LOAD_RADIUS + 1) * CHUNK_WIDTH px do jogador), então o raio sai das
+# configurações de chunk: dorme quem está na metade mais distante dos chunks das pontas.
+AI_SLEEP_RADIUS: int = CHUNK_LOAD_RADIUS * CHUNK_WIDTH + CHUNK_WIDTH // 2
+AI_FAR_UPDATE_INTERVAL: int = 4 # Entre os dois raios, atualiza 1 a cada N frames, com passo N vezes maior
+
+# Geração procedural do mundo
+WORLDGEN_WORKERS: int = 2 # Processos que pré-geram chunks; 0 gera tudo na thread principal
+WORLDGEN_LOOKAHEAD_CHUNKS: int = 2 # Quantos chunks além da área carregada são pré-gerados de cada lado
+WORLDGEN_DRAGON_CHANCE: float = 0.35 # Chance de um chunk (fora o inicial) ter um dragão
+
+# Log do jogo (core.log)
+LOG_LEVEL: int = 20 # Nível mínimo guardado no buffer: 10 DEBUG, 20 INFO, 30 WARNING, 40 ERROR
+LOG_CONSOLE_LEVEL: int | None = None # Nível mínimo escrito no console; None = nada no console
+LOG_BUFFER_SIZE: int = 2000 # Mensagens mantidas no buffer circular em memória
+LOG_RATE_LIMIT: int = 5 # Máximo de repetições da mesma mensagem por janela
+LOG_RATE_WINDOW_S: float = 1.0 # Janela do limite de repetições, em segundos
+LOG_FILE: str | None = "save_data/game.log" # Destino do flush em segundo plano; None desativa
+LOG_FLUSH_INTERVAL_S: float = 1.0 # Intervalo entre os flushes em segundo plano
+
+# Navegação dos monstros (world.navigation)
+MONSTER_CHASE_RADIUS: int = 500 # A esta distância (px) do jogador, o monstro para de patrulhar e persegue
+MONSTER_JUMP_POWER: float = -18.0 # Velocidade vertical do pulo dos monstros ao seguir um salto do grafo
+NAV_MAX_JUMP_GAP: int = 80 # Maior distância horizontal (px) entre dois vãos ligada por um salto
+NAV_EDGE_CLEARANCE: int = 50 # Quanto (px) o centro do monstro passa da borda para cair de uma plataforma
+
+# Animações (core.animation)
+ANIMATION_FRAME_MS: float = 100.0 # Duração padrão de cada quadro das folhas de sprites
+DRAGON_ATTACK_ANIMATION_MS: float = 400.0 # Tempo que o dragão fica no quadro de ataque após cada disparo
+
+# Fila de desenho (core.render_queue)
+RENDER_QUEUE_SORT_TEXTURES: bool = False # Agrupa os blits de cada camada pela superfície; muda quem fica por cima quando sprites se sobrepõem
+
+# Escala de renderização (core.render_scale)
+RENDER_SCALE: float = 1.0 # Resolução interna da cena de jogo em relação à janela (0.5 = metade, 2.0 = supersampling)
+RENDER_SCALE_ADAPTIVE: bool = False # Reduz a escala quando o frame passa do orçamento e volta a aumentar quando sobra tempo
+RENDER_SCALE_MIN: float = 0.5 # Menor escala usada pelo modo adaptativo
+RENDER_SCALE_STEP: float = 0.125 # Quanto a escala muda a cada ajuste do modo adaptativo
+RENDER_SCALE_WINDOW_FRAMES: int = 30 # Frames usados na média de tempo antes de cada ajuste
+RENDER_SCALE_CACHE_MAX_ENTRIES: int = 1024 # Superfícies reescaladas guardadas pelo AssetManager
+RENDER_SCALE_PREWARM_PER_FRAME: int = 16 # Cópias reescaladas criadas por frame antes de o modo adaptativo trocar de escala
@@ -0,0 +1,36 @@
+from core.settings import SIMULATION_HZ
+
+
+class SimClock:
+    """
+    Relógio da simulação. Só avança quando um passo fixo de simulação é executado,
+    então cooldowns medidos com ele não dependem do FPS de renderização e
+    funcionam igual ao rodar mais rápido que o tempo real (modo headless, testes).
+    """
+    def __init__(self, hz: int = SIMULATION_HZ) -> None:
+        """
+        Inicializa o relógio.
+        Args:
+            hz (int): Passos de simulação por segundo.
+        """
+        self.step_ms: float = 1000.0 / hz
+        self.step_count: int = 0
+        self._ticks_ms: float = 0.0
+
+    def ticks_ms(self) -> int:
+        """Tempo simulado, em milissegundos (substitui pygame.time.get_ticks na lógica do jogo)."""
+        return int(self._ticks_ms)
+
+    def advance(self, steps: int = 1) -> None:
+        """Avança o relógio em `steps` passos fixos."""
+        self.step_count += steps
+        self._ticks_ms += self.step_ms * steps
+
+    def reset(self, ticks_ms: int = 0) -> None:
+        """Reinicia o relógio no tempo indicado."""
+        self.step_count = 0
+        self._ticks_ms = float(ticks_ms)
+
+
+# Relógio único da simulação, avançado pelo loop de Jogo
+sim_clock = SimClock()
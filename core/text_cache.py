@@ -0,0 +1,70 @@
+import pygame
+from collections import OrderedDict
+from core.settings import TEXT_CACHE_MAX_ENTRIES
+
+
+class TextCache:
+    """
+    Registro de fontes e cache LRU de textos renderizados.
+    Evita criar fontes e chamar Font.render a cada frame para textos que não mudaram.
+    """
+    def __init__(self, max_entries: int = TEXT_CACHE_MAX_ENTRIES) -> None:
+        """
+        Inicializa o cache.
+        Args:
+            max_entries (int): Quantidade máxima de superfícies de texto guardadas.
+        """
+        self.max_entries: int = max_entries
+        self._fonts: dict[tuple, pygame.font.Font] = {}
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_font(self, name: str | None = "Arial", size: int = 30, bold: bool = False) -> pygame.font.Font:
+        """
+        Retorna a fonte pedida, criando-a somente na primeira vez.
+        Args:
+            name (str | None): Nome da fonte do sistema; None usa a fonte padrão do Pygame.
+            size (int): Tamanho da fonte.
+            bold (bool): Se a fonte deve ser negrito.
+        """
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            if name is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+            else:
+                font = pygame.font.SysFont(name, size, bold=bold)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text: str, color: tuple, name: str | None = "Arial", size: int = 30, bold: bool = False) -> pygame.Surface:
+        """
+        Retorna a superfície do texto, renderizando-a só quando ela não está no cache.
+        Returns:
+            pygame.Surface: Superfície compartilhada. Não deve ser alterada por quem a recebe.
+        """
+        key = ((name, size, bold), text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(name, size, bold).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False) # Remove o texto usado há mais tempo
+        return surface
+
+    def clear(self) -> None:
+        """Descarta os textos renderizados (as fontes continuam registradas)."""
+        self._surfaces.clear()
+
+
+# Instância única usada pelas cenas e botões
+text_cache = TextCache()
@@ -2,24 +2,48 @@ import pygame
 import sys
 from abc import ABC, abstractmethod
 import os 
+import random
+import time
+from typing import Callable
 
 from cena import Cena 
 from cena_menu import CenaMenu
 from cena_opcoes import CenaOpcoes
 from cena_jogo import CenaJogo 
 from save_system.save_load import SaveLoad 
-from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, CAPTION 
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, CAPTION, FPS, AUTOSAVE_INTERVAL_S, DIRTY_RECT_RENDERING, MAX_CATCHUP_STEPS, LOG_FILE 
+from core.render_scale import RenderScaler
+from core.asset_manager import asset_manager
+from core.text_cache import text_cache
+from core.input_script import ScriptedInput
+from core.profiler import FrameProfiler
+from core.sim_clock import sim_clock
+from core.replay import ReplayRecorder
+from core.log import game_log
+from world.worldgen import shutdown_pool
 
 
 class Jogo:
     """Classe principal que controla o loop do jogo e gerencia as cenas"""
     
-    def __init__(self, largura: int = SCREEN_WIDTH, altura: int = SCREEN_HEIGHT, titulo: str = CAPTION):
+    def __init__(self, largura: int = SCREEN_WIDTH, altura: int = SCREEN_HEIGHT, titulo: str = CAPTION, headless: bool = False):
         """
-        Inicializa o jogo com configurações básicas
+        Inicializa o jogo com configurações básicas.
+        Com headless=True, usa os drivers "dummy" do SDL: nenhuma janela é aberta e nenhum som é tocado.
         """
+        self.headless: bool = headless
+        if headless:
+            # Precisa ser definido antes de pygame.init()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         pygame.init()
-        pygame.mixer.init() 
+        try:
+            pygame.mixer.init() 
+            self.audio_disponivel: bool = True
+        except pygame.error as e:
+            print(f"Aviso: áudio indisponível ({e}). O jogo seguirá sem som.")
+            self.audio_disponivel = False
         self.tela = pygame.display.set_mode((largura, altura))
         pygame.display.set_caption(titulo)
         self.clock = pygame.time.Clock()
@@ -39,6 +63,31 @@ class Jogo:
         self.musica_atual_tocando: str | None = None 
 
         self.save_load_system = SaveLoad() 
+        game_log.start_background_flush(LOG_FILE) # Mensagens de jogo vão para o arquivo fora do loop principal
+        self.profiler = FrameProfiler() # F3 mostra/esconde o overlay de desempenho
+
+        # Com dirty rects, só as regiões que mudaram vão para a tela (display.update em vez de flip)
+        self.renderizacao_dirty_rects: bool = DIRTY_RECT_RENDERING
+        self._pausa_desenhada: bool = False
+
+        # Resolução interna da cena de jogo, esticada para a janela (ver core.render_scale)
+        self.escala_render: RenderScaler = RenderScaler((largura, altura))
+
+        # Loop de passo fixo: a simulação avança em passos de sim_clock.step_ms,
+        # independente do FPS de renderização (fps_render = 0 desliga o limite)
+        self.fps_render: int = FPS
+        self.alfa_interpolacao: float = 1.0
+        self._acumulador_ms: float = sim_clock.step_ms
+        self._eventos_pendentes: list = []
+        self.intervalo_autosave_ms: int = int(AUTOSAVE_INTERVAL_S * 1000) # 0 desativa o salvamento automático
+        self._ultimo_autosave_ms: int = 0
+
+        # Gravação de replay da próxima partida nova (ver gravar_replay)
+        self.caminho_replay: str | None = None
+        self.semente_replay: int = 0
+        self._gravador: ReplayRecorder | None = None
+        self._cena_gravada: Cena | None = None
+        self._frame_gravado: int = 0
 
         self.mudar_cena(CenaMenu(self))
 
@@ -54,7 +103,7 @@ class Jogo:
         Garate que o volume esteja entre 0.0 e 1.0.
         """
         self._volume_musica = max(0.0, min(1.0, volume)) 
-        if pygame.mixer.music.get_busy():
+        if self.audio_disponivel and pygame.mixer.music.get_busy():
             pygame.mixer.music.set_volume(self._volume_musica)
     
     @property # Getter para volume_efeitos
@@ -77,6 +126,8 @@ class Jogo:
         """
         Carrega e toca uma nova música, ou continua a atual se for a mesma.
         """
+        if not self.audio_disponivel:
+            return
         try:
                 pygame.mixer.music.load(caminho_nova_musica)
                 pygame.mixer.music.set_volume(self._volume_musica) # Usa o atributo gerenciado pela property
@@ -91,7 +142,7 @@ class Jogo:
         """
         Para a reprodução da música atual.
         """
-        if pygame.mixer.music.get_busy():
+        if self.audio_disponivel and pygame.mixer.music.get_busy():
             pygame.mixer.music.stop()
             self.musica_atual_tocando = None
             
@@ -106,67 +157,314 @@ class Jogo:
         Se o jogo estiver em pausa, para a música. Se estiver despausado, retoma a música.
         """
         self.pausado = not self.pausado
+        self._pausa_desenhada = False
+        if not self.pausado and self.cena_atual:
+            self.cena_atual.invalidar_desenho() # O overlay de pausa cobriu a tela
         if self.pausado:
             print("Jogo Pausado. Pressione ESC para despausar ou 'S' para Salvar.")
-            pygame.mixer.music.pause() 
+            if self.audio_disponivel:
+                pygame.mixer.music.pause() 
         else:
             print("Jogo Despausado.")
-            pygame.mixer.music.unpause() 
+            if self.audio_disponivel:
+                pygame.mixer.music.unpause() 
 
     def executar(self) -> None: 
         """
         Executa o loop principal do jogo.
         """
         while self.rodando:
-            eventos = pygame.event.get()
-            for evento in eventos:
-                if evento.type == pygame.QUIT:
-                    self.rodando = False
+            inicio_frame = time.perf_counter()
+            self.profiler.begin_frame()
+            asset_manager.begin_frame() # Zera a contagem de superfícies criadas neste frame
+            with self.profiler.section("eventos"):
+                eventos = pygame.event.get()
+                for evento in eventos:
+                    if evento.type == pygame.QUIT:
+                        self.rodando = False
                 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        if isinstance(self.cena_atual, CenaJogo): 
-                             self.alternar_pausa()
-                    if self.pausado and evento.key == pygame.K_s: 
-                        if isinstance(self.cena_atual, CenaJogo):
-                            print("Tentando salvar jogo...")
-                            # Estes métodos get_player_data e get_environment_data
-                            # precisarão ser implementados em CenaJogo para fornecer os dados.
-                            player_data = self.cena_atual.get_player_data() if hasattr(self.cena_atual, 'get_player_data') else {}
-                            environment_data = self.cena_atual.get_environment_data() if hasattr(self.cena_atual, 'get_environment_data') else {}
-                            self.save_game_state(player_data, environment_data)
-                            print("Jogo salvo!")
-                        else:
-                            print("Não é possível salvar fora da cena de jogo.")
+                    if evento.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) and self.cena_atual:
+                        self.cena_atual.invalidar_desenho()
+                        self._pausa_desenhada = False
+
+                    if evento.type == pygame.KEYDOWN:
+                        if evento.key == pygame.K_F3:
+                            self.profiler.toggle_overlay()
+                            if self.cena_atual:
+                                self.cena_atual.invalidar_desenho()
+                        if evento.key == pygame.K_ESCAPE:
+                            if isinstance(self.cena_atual, CenaJogo): 
+                                 self.alternar_pausa()
+                        if self.pausado and evento.key == pygame.K_s: 
+                            if isinstance(self.cena_atual, CenaJogo):
+                                print("Tentando salvar jogo...")
+                                self._salvar_cena_atual()
+                            else:
+                                print("Não é possível salvar fora da cena de jogo.")
 
+            regioes: list[pygame.Rect] | None = None
             if self.cena_atual:
                 if not self.pausado:
-                    self.cena_atual.atualizar(eventos)
-                
-                self.cena_atual.desenhar(self.tela)
+                    self._simular(eventos)
+                    self._verificar_autosave()
+                else:
+                    self._acumulador_ms = 0.0 # Não recupera o tempo parado ao despausar
                 
-                if self.pausado:
-                    font = pygame.font.Font(None, 74)
-                    text_surface = font.render("PAUSADO", True, (255, 255, 255))
-                    text_rect = text_surface.get_rect(center=(self.largura // 2, self.altura // 2 - 50))
-                    self.tela.blit(text_surface, text_rect)
+                with self.profiler.section("desenhar"):
+                    regioes = self._desenhar_cena()
 
-                    save_text_surface = font.render("Pressione 'S' para Salvar", True, (200, 200, 200))
-                    save_text_rect = save_text_surface.get_rect(center=(self.largura // 2, self.altura // 2 + 50))
-                    self.tela.blit(save_text_surface, save_text_rect)
+                self._registrar_contagens()
+                self.profiler.draw_overlay(self.tela)
 
-            pygame.display.flip()
-            self.clock.tick(60)
+            with self.profiler.section("flip"):
+                if regioes is None:
+                    pygame.display.flip()
+                elif regioes:
+                    pygame.display.update(regioes)
+            self.escala_render.record_frame(1000 * (time.perf_counter() - inicio_frame))
+            if self.escala_render.pending_scale is not None:
+                self._trocar_escala_render()
+            self.profiler.end_frame()
+            self._acumulador_ms += self.clock.tick(self.fps_render)
 
+        self._finalizar_gravacao()
+        if self.cena_atual is not None:
+            self.cena_atual.encerrar() # Libera a pasta de chunks e cancela as pré-gerações da partida
+        shutdown_pool()
+        self.save_load_system.shutdown() # Termina de gravar um save pendente antes de sair
+        self.profiler.stop_export()
+        game_log.stop_background_flush()
         pygame.quit()
         sys.exit()
 
+    def gravar_replay(self, caminho: str, semente: int = 0) -> None:
+        """
+        Faz a próxima partida nova ser gravada em `caminho`. A partida começa com o
+        RNG global e o relógio da simulação reiniciados a partir de `semente`.
+        """
+        self.caminho_replay = caminho
+        self.semente_replay = semente
+
+    def iniciar_novo_jogo(self) -> None:
+        """Começa uma partida nova, gravando-a se um replay foi pedido."""
+        if self.caminho_replay is not None and self._gravador is None:
+            random.seed(self.semente_replay)
+            sim_clock.reset()
+            self._gravador = ReplayRecorder(self.semente_replay)
+            self._frame_gravado = 0
+            self._cena_gravada = CenaJogo(self)
+            self.mudar_cena(self._cena_gravada)
+            print(f"Gravando replay em {self.caminho_replay}.")
+            return
+        self.mudar_cena(CenaJogo(self))
+
+    def _finalizar_gravacao(self) -> None:
+        """Grava o arquivo do replay em andamento, se houver."""
+        if self._gravador is None:
+            return
+        self._gravador.save(self.caminho_replay)
+        self._gravador = None
+        self._cena_gravada = None
+        self.caminho_replay = None # Só a primeira partida é gravada
+
+    def _simular(self, eventos: list) -> None:
+        """
+        Executa quantos passos fixos de simulação couberem no tempo acumulado,
+        até MAX_CATCHUP_STEPS por frame. Os eventos do frame vão para o primeiro passo;
+        se nenhum passo rodar, ficam guardados para o próximo. O resto do acumulador
+        vira o fator de interpolação usado no desenho.
+        """
+        self._eventos_pendentes.extend(eventos)
+        passo_ms = sim_clock.step_ms
+        cena = self.cena_atual
+        passos = 0
+        while self._acumulador_ms >= passo_ms and passos < MAX_CATCHUP_STEPS:
+            cena.guardar_estado_anterior()
+            eventos_do_passo, self._eventos_pendentes = self._eventos_pendentes, []
+            cena.atualizar(eventos_do_passo)
+            sim_clock.advance()
+            if self._gravador is not None and cena is self._cena_gravada:
+                self._gravador.record_step(self._frame_gravado, eventos_do_passo, cena)
+                self._frame_gravado += 1
+            self._acumulador_ms -= passo_ms
+            passos += 1
+            if self.cena_atual is not cena: # A cena mudou (ex.: game over)
+                self._acumulador_ms = 0.0
+                break
+
+        if passos == MAX_CATCHUP_STEPS and self._acumulador_ms >= passo_ms:
+            self._acumulador_ms = 0.0 # Atraso grande demais: descarta em vez de entrar em espiral
+        self.alfa_interpolacao = min(1.0, self._acumulador_ms / passo_ms)
+
+    def _desenhar_cena(self) -> list[pygame.Rect] | None:
+        """
+        Desenha a cena atual (e o overlay de pausa).
+        Returns:
+            list[pygame.Rect] | None: Regiões a atualizar na tela; None para atualizar a tela inteira.
+        """
+        escalada = self.cena_atual.aceita_escala_render and self.escala_render.active
+        if not self.renderizacao_dirty_rects or self.profiler.overlay_visible or escalada:
+            # Com resolução interna, a imagem toda é reescalada a cada frame: dirty rects não ajudam
+            self._desenhar_cena_completa()
+            if self.pausado:
+                self._desenhar_overlay_pausa()
+            return None
+
+        if self.pausado:
+            if self._pausa_desenhada: # Nada muda enquanto o jogo está pausado
+                return []
+            self._desenhar_cena_completa()
+            self._desenhar_overlay_pausa()
+            self._pausa_desenhada = True
+            return None
+
+        return self.cena_atual.desenhar_regioes(self.tela)
+
+    def _desenhar_cena_completa(self) -> None:
+        """Desenha a cena inteira, na resolução interna quando a cena aceita escala."""
+        if self.cena_atual.aceita_escala_render and self.escala_render.active:
+            self.cena_atual.desenhar(self.escala_render.surface())
+            self.escala_render.present(self.tela)
+            self.cena_atual.desenhar_interface(self.tela)
+        else:
+            self.cena_atual.desenhar(self.tela)
+
+    def _trocar_escala_render(self) -> None:
+        """
+        Aplica a escala pendente do modo adaptativo só quando a cena já preparou as
+        cópias reescaladas (algumas por frame), para a troca não criar todas de uma
+        vez num frame que já passou do orçamento. As cópias da escala antiga são descartadas.
+        """
+        escala = self.escala_render.pending_scale
+        if self.cena_atual is not None and not self.cena_atual.preparar_escala(escala):
+            return
+        self.escala_render.apply_pending()
+        asset_manager.keep_scaled_only(escala)
+        if self.cena_atual is not None:
+            self.cena_atual.invalidar_desenho() # A escala mudou: o próximo frame é completo
+
+    def _desenhar_overlay_pausa(self) -> None:
+        text_surface = text_cache.render("PAUSADO", (255, 255, 255), None, 74)
+        text_rect = text_surface.get_rect(center=(self.largura // 2, self.altura // 2 - 50))
+        self.tela.blit(text_surface, text_rect)
+
+        save_text_surface = text_cache.render("Pressione 'S' para Salvar", (200, 200, 200), None, 74)
+        save_text_rect = save_text_surface.get_rect(center=(self.largura // 2, self.altura // 2 + 50))
+        self.tela.blit(save_text_surface, save_text_rect)
+
+    def _registrar_contagens(self) -> None:
+        """Passa ao profiler a contagem de entidades da cena atual e as superfícies criadas no frame (overlay e exportação)."""
+        contagens = self.cena_atual.contagem_entidades() if hasattr(self.cena_atual, 'contagem_entidades') else {}
+        contagens["alocacoes"] = asset_manager.frame_allocations
+        self.profiler.set_counts(contagens)
+
+    def _salvar_cena_atual(self) -> None:
+        """
+        Tira um snapshot da cena de jogo na thread principal e o entrega à thread de salvamento.
+        """
+        # Estes métodos get_player_data e get_environment_data
+        # precisarão ser implementados em CenaJogo para fornecer os dados.
+        player_data = self.cena_atual.get_player_data() if hasattr(self.cena_atual, 'get_player_data') else {}
+        environment_data = self.cena_atual.get_environment_data() if hasattr(self.cena_atual, 'get_environment_data') else {}
+        self.save_game_state(player_data, environment_data)
+        self._ultimo_autosave_ms = pygame.time.get_ticks()
+
+    def _verificar_autosave(self) -> None:
+        """Salva automaticamente a cada intervalo_autosave_ms enquanto a cena de jogo roda."""
+        if self.intervalo_autosave_ms <= 0 or not isinstance(self.cena_atual, CenaJogo):
+            return
+        if pygame.time.get_ticks() - self._ultimo_autosave_ms >= self.intervalo_autosave_ms:
+            if not self.save_load_system.is_saving: # Não acumula saves se o disco estiver lento
+                self._salvar_cena_atual()
+
+    def executar_headless(self, frames: int, seed: int = 0, fonte_entrada: ScriptedInput | None = None,
+                          observador: Callable[[int, list, Cena], None] | None = None) -> dict:
+        """
+        Roda a cena de jogo sem janela e sem limite de FPS, para testes de carga e balanceamento.
+        Cada frame executa um passo fixo de simulação, então o jogo roda mais rápido que o tempo real.
+        A entrada vem de uma fonte roteirizada em vez do teclado.
+        Args:
+            frames (int): Quantidade de frames a simular.
+            seed (int): Semente do gerador aleatório global e do roteiro de entrada.
+            fonte_entrada (ScriptedInput | None): Fonte de eventos; por padrão, um ScriptedInput com a mesma semente.
+                Qualquer objeto com um método eventos(frame) serve (ex.: core.replay.ReplayPlayer).
+            observador (Callable | None): Chamado como observador(frame, eventos, cena) depois de cada passo
+                (ex.: ReplayRecorder.record_step, ReplayPlayer.check_step).
+        Returns:
+            dict: Frames simulados, FPS e tempos médios de atualização e desenho (em ms).
+        """
+        random.seed(seed)
+        sim_clock.reset()
+        self.alfa_interpolacao = 1.0 # Cada frame é exatamente um passo: nada a interpolar
+        fonte_entrada = fonte_entrada or ScriptedInput(seed)
+        self.mudar_cena(CenaJogo(self))
+
+        tempo_atualizar = 0.0
+        tempo_desenhar = 0.0
+        reinicios = 0
+        frames_simulados = 0
+        frames_com_alocacao = 0 # Frames que criaram superfícies (ver AssetManager.frame_allocations)
+        inicio = time.perf_counter()
+
+        for frame in range(frames):
+            if not self.rodando:
+                break
+            self.profiler.begin_frame()
+            asset_manager.begin_frame()
+            with self.profiler.section("eventos"):
+                pygame.event.pump() # Mantém o SDL respondendo, mesmo sem janela
+                eventos = fonte_entrada.eventos(frame)
+
+            t0 = time.perf_counter()
+            cena = self.cena_atual
+            cena.atualizar(eventos)
+            sim_clock.advance()
+            t1 = time.perf_counter()
+            if observador is not None:
+                observador(frame, eventos, cena)
+            with self.profiler.section("desenhar"):
+                self._desenhar_cena_completa()
+            t2 = time.perf_counter()
+            if asset_manager.frame_allocations:
+                frames_com_alocacao += 1
+            self._registrar_contagens()
+            self.profiler.end_frame()
+
+            tempo_atualizar += t1 - t0
+            tempo_desenhar += t2 - t1
+            frames_simulados += 1
+
+            if not isinstance(self.cena_atual, CenaJogo): # Game over volta ao menu; recomeça a simulação
+                reinicios += 1
+                self.mudar_cena(CenaJogo(self))
+
+        duracao = time.perf_counter() - inicio
+        resultado = {
+            "frames": frames_simulados,
+            "seed": seed,
+            "fps": frames_simulados / duracao if duracao > 0 else 0.0,
+            "atualizar_ms": 1000 * tempo_atualizar / max(1, frames_simulados),
+            "desenhar_ms": 1000 * tempo_desenhar / max(1, frames_simulados),
+            "reinicios": reinicios,
+            "frames_com_alocacao": frames_com_alocacao
+        }
+        print(f"Frames: {resultado['frames']} | FPS: {resultado['fps']:.1f} | "
+              f"Atualizar: {resultado['atualizar_ms']:.3f} ms | Desenhar: {resultado['desenhar_ms']:.3f} ms | "
+              f"Reinícios: {reinicios} | Frames com alocação: {frames_com_alocacao}")
+        return resultado
+
     def mudar_cena(self, nova_cena: Cena) -> None: 
         """
         Altera a cena atual do jogo.
         """
+        if self.cena_atual is not None and self.cena_atual is not nova_cena:
+            if self.cena_atual is self._cena_gravada:
+                self._finalizar_gravacao() # A partida gravada terminou (game over, menu, load)
+            self.cena_atual.encerrar()
         self.cena_atual = nova_cena
         self.pausado = False 
+        self._pausa_desenhada = False
+        self._ultimo_autosave_ms = pygame.time.get_ticks()
 
         if isinstance(nova_cena, CenaMenu):
             self._mudar_musica(self.musica_fundo_menu_path) 
@@ -188,8 +486,8 @@ class Jogo:
             "music_volume": self.volume_musica, # Acessa a property
             "sfx_volume": self.volume_efeitos   # Acessa a property
         }
-        self.save_load_system.save_game(game_state)
-        print("Estado do jogo salvo com sucesso!")
+        self.save_load_system.save_game_async(game_state) # Gravação em segundo plano, sem travar o frame
+        print("Estado do jogo enviado para salvamento.")
 
     def load_game_state(self) -> dict | None:
         """
@@ -1,14 +1,92 @@
 import pygame
 import sys
+import argparse
 from jogo import Jogo
 from cena_menu import CenaMenu
+from core.replay import ReplayRecorder, ReplayPlayer
+from core.log import game_log, DEBUG, INFO, WARNING, ERROR
+from world.worldgen import shutdown_pool
+
+NIVEIS_LOG = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="A Lenda da Espada Crescente")
+    parser.add_argument("--headless", action="store_true",
+                        help="Roda a simulação sem janela e sem som (testes de carga e balanceamento).")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="Quantidade de frames simulados no modo headless.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semente do gerador aleatório e da entrada roteirizada.")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="Atualiza só as regiões da tela que mudaram, em vez da tela inteira.")
+    parser.add_argument("--render-scale", type=float, metavar="ESCALA",
+                        help="Resolução interna da cena de jogo em relação à janela (ex.: 0.5, 0.75, 2.0).")
+    parser.add_argument("--adaptive-scale", action="store_true",
+                        help="Reduz a resolução interna quando o frame passa do orçamento de tempo do FPS.")
+    parser.add_argument("--profile-out", metavar="ARQUIVO",
+                        help="Grava o tempo de cada subsistema, frame a frame, em .csv ou .jsonl.")
+    parser.add_argument("--record", metavar="ARQUIVO",
+                        help="Grava a próxima partida (ou a simulação headless) em um arquivo de replay.")
+    parser.add_argument("--replay", metavar="ARQUIVO",
+                        help="Reproduz um replay sem janela e confere o estado frame a frame.")
+    parser.add_argument("--log-console", choices=list(NIVEIS_LOG), metavar="NIVEL",
+                        help="Também escreve no console as mensagens do log a partir deste nível (debug, info, warning, error).")
+    return parser.parse_args(argv)
+
+def _reproduzir_replay(jogo: Jogo, caminho: str) -> int:
+    """Roda um replay headless e retorna o código de saída (0 = estado idêntico ao gravado)."""
+    replay = ReplayPlayer(caminho)
+    jogo.executar_headless(replay.frames, replay.seed, fonte_entrada=replay, observador=replay.check_step)
+    if replay.identical:
+        print(f"Replay idêntico: {replay.checked_frames} frames conferidos.")
+        return 0
+    print(f"Replay divergiu em {replay.mismatches} de {replay.checked_frames} frames "
+          f"(primeiro: {replay.first_mismatch}).")
+    return 1
 
 def main():
     """
     Função principal que inicializa o Pygame e inicia o jogo.
     """
+    args = _parse_args()
+    if args.log_console:
+        game_log.console_level = NIVEIS_LOG[args.log_console]
+        game_log.level = min(game_log.level, game_log.console_level)
+
     # Cria a instância do jogo
-    jogo = Jogo()
+    jogo = Jogo(headless=args.headless or args.replay is not None)
+    if args.dirty_rects:
+        jogo.renderizacao_dirty_rects = True
+    if args.render_scale is not None:
+        jogo.escala_render.set_scale(args.render_scale)
+    if args.adaptive_scale:
+        jogo.escala_render.adaptive = True
+    if args.profile_out:
+        jogo.profiler.start_export(args.profile_out)
+
+    if args.replay:
+        codigo = _reproduzir_replay(jogo, args.replay)
+        jogo.cena_atual.encerrar()
+        shutdown_pool()
+        jogo.profiler.stop_export()
+        game_log.stop_background_flush()
+        pygame.quit()
+        sys.exit(codigo)
+
+    if args.headless:
+        gravador = ReplayRecorder(args.seed) if args.record else None
+        jogo.executar_headless(args.frames, args.seed, observador=gravador.record_step if gravador else None)
+        if gravador:
+            gravador.save(args.record)
+        jogo.cena_atual.encerrar()
+        shutdown_pool()
+        jogo.profiler.stop_export()
+        game_log.stop_background_flush()
+        pygame.quit()
+        return
+
+    if args.record:
+        jogo.gravar_replay(args.record, args.seed)
     
     # Define a cena inicial para o menu
     # O jogo já inicializa com o menu dentro do __init__
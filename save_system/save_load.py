@@ -1,9 +1,13 @@
 import json
 import os
+import threading
+from concurrent.futures import Future
 
 class SaveLoad:
     """
     Gerencia o salvamento e carregamento do estado do jogo para um arquivo JSON.
+    A gravação é atômica (arquivo temporário + fsync + rename) e pode ser feita
+    por uma thread de fundo com save_game_async, sem travar o loop do jogo.
     """
     def __init__(self, save_file_name: str = "savegame.json") -> None:
         """
@@ -14,25 +18,120 @@ class SaveLoad:
         self.save_file_path = os.path.join("save_data", save_file_name) # Salva em uma pasta separada
         os.makedirs(os.path.dirname(self.save_file_path), exist_ok=True) # Garante que a pasta 'save_data' exista
 
+        # Thread de salvamento: guarda só o snapshot mais recente ainda não gravado
+        self._condition = threading.Condition()
+        self._pending_snapshot: dict | None = None
+        self._writing: bool = False
+        self._worker: threading.Thread | None = None
+        self._stopping: bool = False
+        self.saves_completed: int = 0
+        self.last_error: Exception | None = None
+
     def save_game(self, game_data: dict) -> None:
         """
-        Salva o estado atual do jogo para um arquivo.
+        Salva o estado atual do jogo para um arquivo, na thread atual.
         Args:
             game_data (dict): Um dicionário contendo todo o estado do jogo a ser salvo.
         """
         try:
-            with open(self.save_file_path, 'w', encoding='utf-8') as f:
-                json.dump(game_data, f, indent=4) # Salva com indentação para legibilidade
+            self._write_atomic(game_data)
             print(f"Jogo salvo com sucesso em: {self.save_file_path}")
-        except IOError as e:
+        except (IOError, TypeError, ValueError) as e:
+            self.last_error = e
             print(f"Erro ao salvar o jogo: {e}")
 
+    def save_game_async(self, snapshot: dict) -> None:
+        """
+        Agenda o salvamento em uma thread de fundo e retorna imediatamente.
+        O snapshot deve ser montado na thread principal (ex.: Player.to_dict/Environment.to_dict)
+        e não pode ser alterado depois de entregue. Partes que são Futures (os chunks
+        guardados em disco, ver ChunkStore.snapshot) são esperadas na thread de fundo. Se já houver um salvamento na fila,
+        ele é substituído por este, mais recente.
+        Args:
+            snapshot (dict): Estado do jogo a ser salvo.
+        """
+        with self._condition:
+            self._pending_snapshot = snapshot
+            if self._worker is None or not self._worker.is_alive():
+                self._stopping = False
+                self._worker = threading.Thread(target=self._worker_loop, name="SaveWorker", daemon=True)
+                self._worker.start()
+            self._condition.notify()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending_snapshot is None and not self._stopping:
+                    self._condition.wait()
+                if self._pending_snapshot is None:
+                    return
+                snapshot = self._pending_snapshot
+                self._pending_snapshot = None
+                self._writing = True
+            try:
+                self._write_atomic(snapshot)
+                self.saves_completed += 1
+            except (IOError, TypeError, ValueError) as e:
+                self.last_error = e
+                print(f"Erro ao salvar o jogo: {e}")
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write_atomic(self, game_data: dict) -> None:
+        """
+        Grava em um arquivo temporário e só então o renomeia sobre o save atual,
+        para que uma queda no meio da escrita nunca deixe o savegame.json corrompido.
+        """
+        game_data = self._resolve(game_data)
+        temp_path = self.save_file_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(game_data, f, separators=(",", ":")) # Formato compacto
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.save_file_path)
+
+    @classmethod
+    def _resolve(cls, data):
+        """Troca os Futures do snapshot, em qualquer nível de dicionário, pelos seus resultados."""
+        if isinstance(data, Future):
+            return data.result()
+        if isinstance(data, dict):
+            return {key: cls._resolve(value) for key, value in data.items()}
+        return data
+
+    @property
+    def is_saving(self) -> bool:
+        """Indica se há um salvamento na fila ou sendo gravado."""
+        with self._condition:
+            return self._pending_snapshot is not None or self._writing
+
+    def wait_until_idle(self, timeout: float | None = None) -> bool:
+        """
+        Espera os salvamentos pendentes terminarem.
+        Returns:
+            bool: True se não há mais nada a gravar.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending_snapshot is None and not self._writing, timeout)
+
+    def shutdown(self, timeout: float | None = 5.0) -> None:
+        """Grava o que estiver pendente e encerra a thread de salvamento."""
+        self.wait_until_idle(timeout)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
     def load_game(self) -> dict | None:
         """
         Carrega o estado do jogo de um arquivo.
         Returns:
             dict | None: O dicionário com o estado do jogo se bem-sucedido, None caso contrário.
         """
+        self.wait_until_idle(timeout=5.0) # Não lê um save que ainda está sendo gravado
         if not os.path.exists(self.save_file_path):
             print("Nenhum arquivo de save encontrado. Iniciando novo jogo.")
             return None
@@ -0,0 +1,64 @@
+import weakref
+import pygame
+from core.settings import AI_LOD_ENABLED, AI_NEAR_RADIUS, AI_SLEEP_RADIUS, AI_FAR_UPDATE_INTERVAL
+
+
+class AIScheduler:
+    """
+    Decide com que frequência a IA de cada monstro roda, pela distância até o jogador:
+    - perto (até near_radius): todo frame, passo normal;
+    - longe (até sleep_radius): 1 a cada `far_interval` frames, com passo `far_interval` vezes maior;
+    - dormindo (além de sleep_radius): não atualiza até o jogador voltar a se aproximar.
+    Os monstros distantes são distribuídos entre os frames para não atualizarem todos juntos.
+    """
+    def __init__(self, near_radius: int = AI_NEAR_RADIUS, sleep_radius: int = AI_SLEEP_RADIUS,
+                 far_interval: int = AI_FAR_UPDATE_INTERVAL, enabled: bool = AI_LOD_ENABLED) -> None:
+        self.near_radius: int = near_radius
+        self.sleep_radius: int = max(sleep_radius, near_radius)
+        self.far_interval: int = max(1, far_interval)
+        self.enabled: bool = enabled
+
+        self._frame: int = 0
+        self._phases: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() # Sprite -> frame da vez dele
+        self._next_phase: int = 0
+        self.counts: dict[str, int] = {"near": 0, "far": 0, "asleep": 0}
+
+    def begin_frame(self) -> None:
+        """Avança o contador de frames e zera as contagens por faixa."""
+        self._frame += 1
+        self.counts = {"near": 0, "far": 0, "asleep": 0}
+
+    def steps_for(self, sprite: pygame.sprite.Sprite, player_rect: pygame.Rect) -> int:
+        """
+        Retorna quantos passos de simulação o sprite deve avançar neste frame (0 = pular).
+        """
+        if not self.enabled:
+            self.counts["near"] += 1
+            return 1
+
+        dx = sprite.rect.centerx - player_rect.centerx
+        dy = sprite.rect.centery - player_rect.centery
+        distance_sq = dx * dx + dy * dy
+
+        if distance_sq <= self.near_radius * self.near_radius:
+            self.counts["near"] += 1
+            return 1
+        if distance_sq > self.sleep_radius * self.sleep_radius:
+            self.counts["asleep"] += 1
+            return 0
+
+        self.counts["far"] += 1
+        phase = self._phases.get(sprite)
+        if phase is None:
+            phase = self._next_phase
+            self._next_phase = (self._next_phase + 1) % self.far_interval
+            self._phases[sprite] = phase
+        if (self._frame + phase) % self.far_interval == 0:
+            return self.far_interval
+        return 0
+
+    def reset(self) -> None:
+        """Esquece as fases atribuídas (ex.: ao carregar outro estado de jogo)."""
+        self._frame = 0
+        self._phases.clear()
+        self._next_phase = 0
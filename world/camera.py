@@ -0,0 +1,38 @@
+import pygame
+
+
+class Camera:
+    """
+    Câmera horizontal que segue o jogador pelo mundo.
+    Tudo no jogo é posicionado em coordenadas do mundo; a câmera só converte
+    para coordenadas da tela na hora de desenhar.
+    """
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Inicializa a câmera.
+        Args:
+            width (int): Largura da área visível (tela).
+            height (int): Altura da área visível (tela).
+        """
+        self.width: int = width
+        self.height: int = height
+        self.x: int = 0
+        self.y: int = 0 # O mundo só rola na horizontal
+
+    def follow(self, target_rect: pygame.Rect) -> None:
+        """Centraliza a câmera horizontalmente no alvo."""
+        self.x = target_rect.centerx - self.width // 2
+
+    @property
+    def view_rect(self) -> pygame.Rect:
+        """Área visível, em coordenadas do mundo."""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        """Deslocamento a somar a uma posição do mundo para obter a posição na tela."""
+        return (-self.x, -self.y)
+
+    def apply(self, rect: pygame.Rect) -> pygame.Rect:
+        """Converte um retângulo do mundo para a tela."""
+        return rect.move(-self.x, -self.y)
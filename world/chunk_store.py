@@ -0,0 +1,219 @@
+import json
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Iterable
+from core.log import game_log
+from core.settings import CHUNK_SAVE_DIR, CHUNK_CACHE_MAX_ENTRIES
+
+
+class ChunkStore:
+    """
+    Guarda os chunks que saíram da área carregada ao redor do jogador.
+    Os dados de cada chunk (mesmo formato de Environment.to_dict: só listas e números,
+    sem superfícies nem slots de física) são gravados em disco, como JSON atômico, por
+    uma thread de fundo. Em memória ficam só os chunks ainda não gravados e um LRU dos
+    mais recentes (CHUNK_CACHE_MAX_ENTRIES), então a memória não cresce com a distância
+    percorrida. Os chunks perto do jogador são lidos de volta pela mesma thread (prefetch),
+    como a pré-geração de world.worldgen; um chunk pedido antes de a leitura terminar
+    é lido na hora.
+    Cada ChunkStore usa uma pasta própria dentro de `root`, então vários ambientes
+    (benchmarks, reinícios headless) nunca apagam os chunks uns dos outros.
+    """
+    def __init__(self, root: str = CHUNK_SAVE_DIR, cache_size: int = CHUNK_CACHE_MAX_ENTRIES) -> None:
+        """
+        Inicializa o armazenamento numa pasta nova e vazia.
+        Args:
+            root (str): Pasta onde a pasta desta sessão é criada.
+            cache_size (int): Chunks já gravados mantidos em memória.
+        """
+        os.makedirs(root, exist_ok=True)
+        self.directory: str = tempfile.mkdtemp(prefix="session_", dir=root)
+        self.cache_size: int = max(0, cache_size)
+        self._stored: set[int] = set()
+        self._unwritten: dict[int, dict] = {} # Na fila de gravação: não podem sair da memória
+        self._cache: OrderedDict[int, dict] = OrderedDict() # Já gravados, usados por último no fim
+        self._reading: set[int] = set() # Leituras agendadas na thread de fundo
+        self._lock = threading.Lock() # Protege os três acima, que a thread de fundo também altera
+        self._jobs: queue.Queue = queue.Queue() # ("write" | "read" | "snapshot", ...), "clear" ou None (encerra)
+        self._worker: threading.Thread | None = None
+        self.read_inline: int = 0 # Chunks lidos do disco na thread principal (não estavam prontos a tempo)
+
+    def _path(self, chunk_x: int) -> str:
+        return os.path.join(self.directory, f"chunk_{chunk_x}.json")
+
+    def __contains__(self, chunk_x: int) -> bool:
+        return chunk_x in self._stored
+
+    def stored(self) -> list[int]:
+        """Índices dos chunks guardados, em ordem."""
+        return sorted(self._stored)
+
+    def in_memory(self) -> int:
+        """Quantidade de chunks guardados que estão em memória (não gravados + LRU)."""
+        with self._lock:
+            return len(self._unwritten) + len(self._cache)
+
+    def save(self, chunk_x: int, record: dict) -> None:
+        """
+        Guarda os dados de um chunk e agenda a gravação em disco.
+        O dicionário passa a pertencer ao ChunkStore e não deve ser alterado por quem o entregou.
+        """
+        with self._lock:
+            self._stored.add(chunk_x)
+            self._unwritten[chunk_x] = record
+            self._cache.pop(chunk_x, None)
+        self._enqueue(("write", chunk_x, record))
+
+    def prefetch(self, chunk_xs: Iterable[int]) -> None:
+        """Agenda a leitura, em segundo plano, dos chunks guardados que não estão em memória."""
+        with self._lock:
+            wanted = [chunk_x for chunk_x in chunk_xs
+                      if chunk_x in self._stored and chunk_x not in self._unwritten
+                      and chunk_x not in self._cache and chunk_x not in self._reading]
+            self._reading.update(wanted)
+        for chunk_x in wanted:
+            self._enqueue(("read", chunk_x))
+
+    def load(self, chunk_x: int) -> dict | None:
+        """
+        Retorna os dados de um chunk guardado: da memória, se estiverem lá, ou lidos do disco agora.
+        Returns:
+            dict | None: Os dados do chunk, ou None se ele não foi guardado.
+        """
+        with self._lock:
+            if chunk_x not in self._stored:
+                return None
+            record = self._unwritten.get(chunk_x)
+            if record is None:
+                record = self._cache.get(chunk_x)
+                if record is not None:
+                    self._cache.move_to_end(chunk_x)
+        if record is None:
+            self.read_inline += 1
+            record = self._read(chunk_x) # Fora da fila de gravação, então o arquivo já está completo
+        return record
+
+    def snapshot(self, exclude: Iterable[int] = ()) -> Future:
+        """
+        Dados de todos os chunks guardados (menos os de `exclude`), para o save.
+        Os que estão em memória entram já; os que só estão em disco são lidos pela thread
+        de fundo, depois das gravações já agendadas, então o resultado é o estado de agora.
+        Returns:
+            Future: Resolve para {str(chunk_x): dados}, em ordem; SaveLoad espera por ele na sua thread.
+        """
+        exclude = set(exclude)
+        known: dict[int, dict] = {}
+        missing: list[int] = []
+        with self._lock:
+            for chunk_x in sorted(self._stored - exclude):
+                record = self._unwritten.get(chunk_x)
+                if record is None:
+                    record = self._cache.get(chunk_x)
+                if record is None:
+                    missing.append(chunk_x)
+                else:
+                    known[chunk_x] = record
+        future: Future = Future()
+        if missing:
+            self._enqueue(("snapshot", future, known, missing))
+        else:
+            future.set_result({str(chunk_x): record for chunk_x, record in known.items()})
+        return future
+
+    def _remember(self, chunk_x: int, record: dict) -> None:
+        """Põe um chunk já gravado no LRU e descarta os mais antigos. Chamado com o lock."""
+        self._cache[chunk_x] = record
+        self._cache.move_to_end(chunk_x)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _read(self, chunk_x: int) -> dict | None:
+        try:
+            with open(self._path(chunk_x), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            game_log.error("Erro ao ler o chunk %d em %s: %s", chunk_x, self.directory, e)
+            return None
+
+    def _write(self, chunk_x: int, record: dict) -> None:
+        path = self._path(chunk_x)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    def _enqueue(self, job) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._worker_loop, name="ChunkWriter", daemon=True)
+            self._worker.start()
+        self._jobs.put(job)
+
+    def _worker_loop(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            if job == "clear":
+                try:
+                    for name in os.listdir(self.directory):
+                        if name.startswith("chunk_"):
+                            os.remove(os.path.join(self.directory, name))
+                except OSError as e:
+                    game_log.error("Erro ao apagar os chunks em %s: %s", self.directory, e)
+                continue
+
+            kind = job[0]
+            if kind == "write":
+                _, chunk_x, record = job
+                try:
+                    self._write(chunk_x, record)
+                except OSError as e:
+                    game_log.error("Erro ao gravar o chunk em %s: %s", self.directory, e)
+                    continue # Continua só em memória
+                with self._lock:
+                    if self._unwritten.get(chunk_x) is record: # Não foi guardado de novo nem apagado
+                        del self._unwritten[chunk_x]
+                        self._remember(chunk_x, record)
+            elif kind == "read":
+                _, chunk_x = job
+                record = self._read(chunk_x)
+                with self._lock:
+                    self._reading.discard(chunk_x)
+                    if (record is not None and chunk_x in self._stored
+                            and chunk_x not in self._unwritten and chunk_x not in self._cache):
+                        self._remember(chunk_x, record)
+            elif kind == "snapshot":
+                _, future, known, missing = job
+                for chunk_x in missing:
+                    record = self._read(chunk_x)
+                    if record is not None:
+                        known[chunk_x] = record
+                future.set_result({str(chunk_x): known[chunk_x] for chunk_x in sorted(known)})
+
+    def close(self) -> None:
+        """Encerra a thread de fundo e apaga a pasta desta sessão. O ChunkStore não deve ser usado depois disso."""
+        if self._worker is not None:
+            self._jobs.put(None)
+            self._worker.join(timeout=5.0)
+            self._worker = None
+        shutil.rmtree(self.directory, ignore_errors=True)
+        with self._lock:
+            self._stored.clear()
+            self._unwritten.clear()
+            self._cache.clear()
+            self._reading.clear()
+
+    def clear(self) -> None:
+        """Esquece todos os chunks guardados (os arquivos são apagados em segundo plano)."""
+        with self._lock:
+            self._stored.clear()
+            self._unwritten.clear()
+            self._cache.clear()
+            self._reading.clear()
+        if self._worker is not None:
+            self._enqueue("clear")
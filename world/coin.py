@@ -1,10 +1,13 @@
 import pygame
-from core.settings import SCREEN_HEIGHT #
+from core.settings import SCREEN_HEIGHT, COIN_DENOMINATIONS #
+from core.asset_manager import asset_manager
+from world.physics_store import physics_store, PhysicsStore
 
 class Coin(pygame.sprite.Sprite):
     """
-    Representa uma moeda que o jogador pode coletar.
-    Possui física de queda simples.
+    Representa uma moeda (ou pilha de moedas, quando value > 1) que o jogador pode coletar.
+    Possui física de queda simples. Com o NumPy disponível, a queda é calculada
+    em lote pelo PhysicsStore e a moeda só guarda o índice (slot) dos seus dados.
     """
     def __init__(self, x: int, y: int, value: int = 1, initial_data: dict = None) -> None:
         """
@@ -16,35 +19,106 @@ class Coin(pygame.sprite.Sprite):
             initial_data (dict | None): Dados para restaurar o estado da moeda.
         """
         super().__init__()
-        try:
-            self.image = pygame.image.load("assets/images/coin.png").convert_alpha() #
-            self.image = pygame.transform.scale(self.image, (40, 40)) #
-        except pygame.error:
-            print("Erro: Imagem da moeda (coin.png) não encontrada. Usando um círculo amarelo como placeholder.")
-            self.image = pygame.Surface((40, 40), pygame.SRCALPHA) #
-            pygame.draw.circle(self.image, (255, 255, 0), (20, 20), 20) #
+        self.value: int = value
+        self.image = self._image_for_value(value)
         
         self.rect = self.image.get_rect(topleft=(x, y)) #
-        self.value: int = value
         self.collected: bool = False #
 
-        self.velocity_y: float = 0.0 #
+        self._slot: int | None = None # Slot no PhysicsStore, quando a física é em lote
+        self._velocity_y: float = 0.0
         self.gravity: float = 0.5 #
+        self.floor_y: float = SCREEN_HEIGHT - 50 # Onde a moeda para de cair (chão ou topo de plataforma)
 
         if initial_data: 
             self.from_dict(initial_data)
 
+        if physics_store is not None:
+            self._slot = physics_store.bind(self, PhysicsStore.FLAG_LANDS, vy=self._velocity_y, gravity=self.gravity)
+            physics_store.set_floor(self._slot, self.floor_y)
+
+    @property
+    def velocity_y(self) -> float:
+        if self._slot is not None:
+            return float(physics_store.vy[self._slot])
+        return self._velocity_y
+
+    @velocity_y.setter
+    def velocity_y(self, value: float) -> None:
+        self._velocity_y = value
+        if self._slot is not None:
+            physics_store.set_velocity(self._slot, 0.0, value)
+
+    @property
+    def is_resting(self) -> bool:
+        """
+        True quando a moeda está parada no seu chão. Uma moeda recém-gerada também
+        tem velocidade zero, mas ainda está no ar; por isso a altura é conferida.
+        """
+        return self.velocity_y == 0 and self.rect.bottom >= self.floor_y
+
+    @staticmethod
+    def _image_for_value(value: int) -> pygame.Surface:
+        """Retorna a imagem da moeda; pilhas de valor maior são desenhadas um pouco maiores."""
+        size = 40 + 4 * sum(1 for denomination in COIN_DENOMINATIONS if 1 < denomination <= value)
+        return asset_manager.get_image("assets/images/coin.png", (size, size),
+                                       placeholder=lambda: Coin._create_placeholder(size))
+
+    def set_value(self, value: int) -> None:
+        """Altera o valor da pilha, trocando a imagem e mantendo a base da moeda no mesmo lugar."""
+        self.value = value
+        image = self._image_for_value(value)
+        if image.get_size() != self.image.get_size():
+            self.rect = image.get_rect(midbottom=self.rect.midbottom)
+            if self._slot is not None:
+                physics_store.set_size(self._slot, self.rect.width, self.rect.height)
+            self.sync_position()
+        self.image = image
+
+    def absorb(self, other: "Coin") -> None:
+        """Junta o valor de outra moeda nesta pilha. Quem chama é responsável por remover `other`."""
+        self.set_value(self.value + other.value)
+
+    def update_floor(self, platforms) -> None:
+        """
+        Recalcula onde a moeda vai parar, pelo índice de plataformas (world.platform_index).
+        Chamado ao gerar a moeda e quando as plataformas carregadas mudam.
+        """
+        self.floor_y = platforms.landing_y(self.rect.left, self.rect.right, self.rect.bottom, SCREEN_HEIGHT - 50)
+        if self._slot is not None:
+            physics_store.set_floor(self._slot, self.floor_y)
+
+    def sync_position(self) -> None:
+        """Copia para o PhysicsStore uma posição alterada diretamente no rect."""
+        if self._slot is not None:
+            physics_store.set_position(self._slot, self.rect.x, self.rect.y)
+
+    def kill(self) -> None:
+        """Remove a moeda de todos os grupos e libera seu slot no PhysicsStore."""
+        if self._slot is not None:
+            physics_store.release(self._slot)
+            self._slot = None
+        super().kill()
+
+    @staticmethod
+    def _create_placeholder(size: int = 40) -> pygame.Surface:
+        """Cria a imagem substituta usada quando coin.png não pode ser carregada."""
+        print("Erro: Imagem da moeda (coin.png) não encontrada. Usando um círculo amarelo como placeholder.")
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(image, (255, 255, 0), (size // 2, size // 2), size // 2)
+        return image
+
     def update(self) -> None:
         """
         Atualiza a lógica da moeda (principalmente a física de queda).
         """
-        if self.collected: #
+        if self.collected or self._slot is not None: # Em lote, quem move a moeda é o PhysicsStore
             return
 
         self.velocity_y += self.gravity #
         self.rect.y += self.velocity_y #
 
-        ground_level = SCREEN_HEIGHT - 50 #
+        ground_level = self.floor_y #
         if self.rect.bottom >= ground_level: 
             self.rect.bottom = ground_level 
             self.velocity_y = 0 #
@@ -70,8 +144,31 @@ class Coin(pygame.sprite.Sprite):
 
     def from_dict(self, data: dict) -> None:
         """Restaura o estado da moeda a partir de um dicionário."""
-        self.rect.x = data.get("x", self.rect.x)
-        self.rect.y = data.get("y", self.rect.y)
         self.value = data.get("value", self.value)
+        self.image = self._image_for_value(self.value)
+        self.rect = self.image.get_rect(topleft=(data.get("x", self.rect.x), data.get("y", self.rect.y)))
         self.collected = data.get("collected", self.collected)
-        self.velocity_y = data.get("velocity_y", 0.0)
\ No newline at end of file
+        self.velocity_y = data.get("velocity_y", 0.0)
+        self.sync_position()
+
+def split_into_stacks(total: int, denominations: tuple[int, ...] = COIN_DENOMINATIONS) -> list[int]:
+    """
+    Divide um total de moedas em pilhas, usando as maiores denominações primeiro.
+    A soma das pilhas é sempre igual a `total`; se a tabela não tiver o valor 1,
+    o resto vira uma última pilha menor.
+    Args:
+        total (int): Quantidade de moedas do drop.
+        denominations (tuple[int, ...]): Valores possíveis de cada pilha.
+    Returns:
+        list[int]: Valores das pilhas, do maior para o menor.
+    """
+    stacks = []
+    remaining = max(0, total)
+    for denomination in sorted(denominations, reverse=True):
+        if denomination <= 0:
+            continue
+        count, remaining = divmod(remaining, denomination)
+        stacks.extend([denomination] * count)
+    if remaining:
+        stacks.append(remaining)
+    return stacks
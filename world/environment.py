@@ -1,69 +1,251 @@
 import pygame
 import random
 from world.tree import Tree
-from world.coin import Coin
+from world.coin import Coin, split_into_stacks
 from world.platform import Platform 
+from world.platform_index import PlatformIndex
+from world.navigation import NavGraph
 from characters.monster import Monster
 from characters.dragon import Dragon 
-from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT #
+from world.spatial_hash import SpatialHash
+from world.ai_scheduler import AIScheduler
+from world.chunk_store import ChunkStore
+from world.worldgen import WorldGenerator
+from world.projectile import Projectile
+from world.projectile_pool import projectile_pool
+from world.physics_store import physics_store
+from core.render_queue import (RenderQueue, LAYER_PLATFORMS, LAYER_TREES, LAYER_MONSTERS, LAYER_PROJECTILES,
+                               LAYER_COINS)
+from core.settings import (SCREEN_WIDTH, SCREEN_HEIGHT, COIN_MERGE_INTERVAL_FRAMES, #
+                           CHUNK_WIDTH, CHUNK_LOAD_RADIUS, PROJECTILE_CULL_MARGIN)
 
 class Environment:
     """
     Gerencia os elementos do cenário, como árvores, moedas, inimigos e plataformas.
     É responsável por gerar, atualizar e desenhar esses elementos.
+    O mundo é dividido em chunks de CHUNK_WIDTH pixels; só os chunks ao redor do
+    jogador ficam em memória como sprites; os demais viram dados simples no ChunkStore.
     """
-    def __init__(self, initial_data: dict = None) -> None:
+    def __init__(self, initial_data: dict = None, world_seed: int | None = None) -> None:
         """
         Inicializa o ambiente, criando grupos de sprites.
+        Args:
+            initial_data (dict | None): Estado salvo a restaurar.
+            world_seed (int | None): Semente do mundo; None sorteia uma (pelo RNG global).
         """
         self.trees: pygame.sprite.Group = pygame.sprite.Group() 
         self.coins: pygame.sprite.Group = pygame.sprite.Group() 
         self.monsters: pygame.sprite.Group = pygame.sprite.Group() 
         self.platforms: pygame.sprite.Group = pygame.sprite.Group() 
+        self.static_version: int = 0 # Incrementado sempre que a geometria estática (plataformas) muda
+        self.platform_index: PlatformIndex = PlatformIndex() # Usado pelo jogador, monstros e moedas para pousar
+        self.navigation: NavGraph = NavGraph() # Vãos e saltos para os monstros perseguirem o jogador
+        self._indexed_version: int | None = None # static_version do último rebuild do índice
+        self._frames_since_coin_merge: int = 0
+        self.ai_scheduler: AIScheduler = AIScheduler()
+
+        self.chunk_store: ChunkStore = ChunkStore()
+        self.loaded_chunks: set[int] = set()
+        self._center_chunk: int | None = None # Chunk do jogador no último streaming
+
+        self.world_seed: int = world_seed if world_seed is not None else random.randrange(2 ** 31)
+        self.world_generator: WorldGenerator = WorldGenerator(self.world_seed)
+
+        # Broadphase: uma grade por tipo de elemento, atualizada a cada update()
+        self.spatial_index: dict[str, SpatialHash] = {
+            "trees": SpatialHash(),
+            "monsters": SpatialHash(),
+            "coins": SpatialHash(),
+            "projectiles": SpatialHash()
+        }
 
         if initial_data:
             self.from_dict(initial_data)
         else:
-            self._generate_initial_elements() # Chamada para o método privado
+            self._generate_chunk(0) # Chamada para o método privado
+            self.loaded_chunks.add(0)
+            self._prefetch_around(0) # Já sobe o pool de geração durante a criação da cena
+        self._refresh_platform_index()
+        self._sync_spatial_index()
+
+    def _refresh_platform_index(self) -> None:
+        """
+        Reconstrói o índice de plataformas se a geometria estática mudou (chunk carregado,
+        descarregado ou save restaurado), junto com o grafo de navegação, e recalcula
+        onde cada moeda vai parar.
+        """
+        if self._indexed_version == self.static_version:
+            return
+        self._indexed_version = self.static_version
+        self.platform_index.rebuild(self.platforms)
+        self.navigation.rebuild(self.platform_index)
+        for coin in self.coins:
+            coin.update_floor(self.platform_index)
 
-    def _generate_initial_elements(self) -> None: # NOVO MÉTODO PRIVADO
+    def _generate_chunk(self, chunk_x: int) -> None: # NOVO MÉTODO PRIVADO
         """
-        Gera os elementos iniciais para o cenário, posicionando-os no chão ou em alturas específicas.
+        Cria os elementos de um chunk novo a partir do layout determinístico de
+        world.worldgen (pré-gerado em outro processo quando possível).
         """
-        ground_y_top = SCREEN_HEIGHT - 50 #
+        self._add_record(self.world_generator.take(chunk_x))
+        self.static_version += 1
 
-        for _ in range(3):
-            x = random.randint(100, SCREEN_WIDTH - 200)
-            y = ground_y_top - 180 
-            self.trees.add(Tree(x, y))
+    # Streaming de chunks
 
-        for _ in range(2):
-            x = random.randint(150, SCREEN_WIDTH - 150)
-            y = ground_y_top - 90 
-            self.monsters.add(Monster(x, y))
-        
-        dragon_x = SCREEN_WIDTH // 4 
-        dragon_y = 150 
-        self.monsters.add(Dragon(dragon_x, dragon_y))
+    def _chunk_of(self, rect: pygame.Rect) -> int:
+        """
+        Chunk ao qual um elemento pertence, pelo centro do seu retângulo. Elementos que
+        andaram para fora da área carregada ficam com o chunk carregado mais próximo.
+        """
+        chunk_x = rect.centerx // CHUNK_WIDTH
+        if self.loaded_chunks:
+            chunk_x = max(min(self.loaded_chunks), min(chunk_x, max(self.loaded_chunks)))
+        return chunk_x
+
+    def _stream_chunks(self, player_rect: pygame.Rect) -> None:
+        """
+        Mantém carregados só os chunks a até CHUNK_LOAD_RADIUS do chunk do jogador:
+        os que saíram da área vão para o disco e os que entraram são lidos (ou gerados).
+        """
+        center = player_rect.centerx // CHUNK_WIDTH
+        if center == self._center_chunk:
+            return
+        self._center_chunk = center
+
+        wanted = set(range(center - CHUNK_LOAD_RADIUS, center + CHUNK_LOAD_RADIUS + 1))
+        leaving = self.loaded_chunks - wanted
+        if leaving:
+            self._unload_chunks(leaving)
+        for chunk_x in sorted(wanted - self.loaded_chunks):
+            self._load_chunk(chunk_x)
+        self._prefetch_around(center)
+
+    def _prefetch_around(self, center: int) -> None:
+        """
+        Prepara, em segundo plano, os chunks logo além da área carregada: os novos são
+        pré-gerados e os já visitados são lidos do disco pelo ChunkStore.
+        """
+        reach = CHUNK_LOAD_RADIUS + self.world_generator.lookahead
+        nearby = [chunk_x for chunk_x in range(center - reach, center + reach + 1) if chunk_x not in self.loaded_chunks]
+        ahead = [chunk_x for chunk_x in nearby if chunk_x not in self.chunk_store]
+        self.world_generator.discard(set(ahead))
+        self.world_generator.prefetch(ahead)
+        self.chunk_store.prefetch(nearby)
+
+    def _unload_chunks(self, chunk_xs: set[int]) -> None:
+        """Guarda no ChunkStore e remove da memória os elementos dos chunks informados."""
+        records = {chunk_x: {"trees": [], "monsters": [], "coins": [], "platforms": []} for chunk_x in chunk_xs}
+        groups = (("trees", self.trees), ("monsters", self.monsters), ("coins", self.coins), ("platforms", self.platforms))
+        for kind, group in groups:
+            for sprite in group.sprites():
+                record = records.get(self._chunk_of(sprite.rect))
+                if record is None:
+                    continue
+                record[kind].append(sprite.to_dict())
+                if isinstance(sprite, Dragon):
+                    sprite.release_projectiles()
+                sprite.kill() # Moedas também liberam o slot de física
+
+        for chunk_x, record in records.items():
+            self.chunk_store.save(chunk_x, record)
+            self.loaded_chunks.discard(chunk_x)
+        self.static_version += 1
 
-        self.platforms.add(Platform(SCREEN_WIDTH // 4 - 100, ground_y_top - 150, 150, 30))
-        self.platforms.add(Platform(SCREEN_WIDTH // 2 - 75, ground_y_top - 250, 150, 30))
-        self.platforms.add(Platform(SCREEN_WIDTH * 3 // 4 - 50, ground_y_top - 350, 100, 30))
+    def _load_chunk(self, chunk_x: int) -> None:
+        """Traz um chunk de volta como sprites: do ChunkStore, se já foi visitado, ou gerando-o."""
+        record = self.chunk_store.load(chunk_x) if chunk_x in self.chunk_store else None
+        if record is None:
+            self._generate_chunk(chunk_x)
+        else:
+            self._add_record(record)
+        self.loaded_chunks.add(chunk_x)
+        self.static_version += 1
 
+    def _add_record(self, data: dict) -> None:
+        """Cria os sprites descritos em um dicionário no formato de to_dict."""
+        for tree_data in data.get("trees", []):
+            self.trees.add(Tree(0, 0, initial_data=tree_data)) 
+
+        for monster_data in data.get("monsters", []):
+            monster_type = monster_data.get("type", "Monster") 
+            if monster_type == "Dragon": 
+                self.monsters.add(Dragon(0, 0, initial_data=monster_data))
+            else:
+                self.monsters.add(Monster(0, 0, initial_data=monster_data))
 
-    def update(self, player_rect: pygame.Rect) -> None:
+        for coin_data in data.get("coins", []):
+            self.coins.add(Coin(0, 0, initial_data=coin_data))
+
+        for platform_data in data.get("platforms", []): 
+            self.platforms.add(Platform(0, 0, 1, 1, initial_data=platform_data)) 
+
+    def update(self, player_rect: pygame.Rect, view_rect: pygame.Rect | None = None) -> None:
         """
         Atualiza a lógica de todos os elementos do ambiente.
+        Args:
+            player_rect (pygame.Rect): Retângulo do jogador, em coordenadas do mundo.
+            view_rect (pygame.Rect | None): Área visível (câmera); projéteis longe dela são desativados.
         """
+        self._stream_chunks(player_rect)
+        self._refresh_platform_index()
+
+        if view_rect is None:
+            view_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+            view_rect.centerx = player_rect.centerx
+        cull_bounds = view_rect.inflate(2 * PROJECTILE_CULL_MARGIN, 2 * PROJECTILE_CULL_MARGIN)
+        Projectile.cull_bounds = cull_bounds
+        if physics_store is not None:
+            physics_store.step(cull_bounds) # Moedas e projéteis, todos de uma vez
+        self.navigation.set_target(player_rect)
+        self.ai_scheduler.begin_frame()
         for monster in self.monsters:
+            steps = self.ai_scheduler.steps_for(monster, player_rect)
             if isinstance(monster, Dragon): 
-                monster.update(player_rect)
-            else: 
-                monster.update()
+                if steps:
+                    monster.update(player_rect, steps)
+                else:
+                    monster.update_projectiles() # Os disparos já feitos continuam voando
+            elif steps: 
+                monster.update(steps, self.platform_index, self.navigation)
         
         self.coins.update() #
 
         self._handle_element_removal_and_coin_generation() # Chamada para o método privado
+        self._sync_spatial_index()
+
+        self._frames_since_coin_merge += 1
+        if self._frames_since_coin_merge >= COIN_MERGE_INTERVAL_FRAMES:
+            self._frames_since_coin_merge = 0
+            self._merge_resting_coins()
+
+    def projectiles(self) -> list:
+        """Retorna todos os projéteis disparados pelos dragões do ambiente."""
+        result = []
+        for monster in self.monsters:
+            if isinstance(monster, Dragon):
+                result.extend(monster.projectiles)
+        return result
+
+    def _sync_spatial_index(self) -> None:
+        """Atualiza as grades de colisão com as posições atuais dos elementos."""
+        self.spatial_index["trees"].sync(self.trees)
+        self.spatial_index["monsters"].sync(self.monsters)
+        self.spatial_index["coins"].sync(self.coins)
+        self.spatial_index["projectiles"].sync(self.projectiles())
+
+    def query(self, kind: str, rect: pygame.Rect) -> list:
+        """
+        Retorna os elementos de um tipo ("trees", "monsters", "coins", "projectiles") que colidem com `rect`.
+        """
+        return self.spatial_index[kind].query(rect)
+
+    def discard(self, kind: str, sprite: pygame.sprite.Sprite) -> None:
+        """Remove um elemento do jogo (de seus grupos e da grade de colisão)."""
+        if kind == "projectiles":
+            projectile_pool.release(sprite)
+        else:
+            sprite.kill()
+        self.spatial_index[kind].remove(sprite)
 
     def _handle_element_removal_and_coin_generation(self) -> None: # NOVO MÉTODO PRIVADO
         """
@@ -72,62 +254,130 @@ class Environment:
         """
         for tree in self.trees.copy(): 
             if tree.is_cut:
-                for _ in range(tree.coins_on_cut):
-                    coin_x = tree.rect.x + random.randint(0, tree.rect.width - 30)
-                    coin_y = tree.rect.y + (tree.rect.height // 4) 
-                    self.coins.add(Coin(coin_x, coin_y))
+                self._spawn_coin_drop(tree.coins_on_cut, tree.rect)
                 self.trees.remove(tree) 
 
         for monster in self.monsters.copy():
             if not monster.is_alive:
-                for _ in range(monster.coins_on_defeat):
-                    coin_x = monster.rect.x + random.randint(0, monster.rect.width - 30)
-                    coin_y = monster.rect.y + (monster.rect.height // 4) 
-                    self.coins.add(Coin(coin_x, coin_y))
+                self._spawn_coin_drop(monster.coins_on_defeat, monster.rect)
+                if isinstance(monster, Dragon):
+                    monster.release_projectiles()
                 self.monsters.remove(monster) 
 
+    def _spawn_coin_drop(self, total: int, source_rect: pygame.Rect) -> None:
+        """
+        Gera as moedas de um drop como poucas pilhas de valor maior (ver COIN_DENOMINATIONS),
+        em vez de uma moeda de valor 1 por unidade. O valor total do drop é mantido.
+        """
+        for value in split_into_stacks(total):
+            coin_x = source_rect.x + random.randint(0, max(0, source_rect.width - 30))
+            coin_y = source_rect.y + (source_rect.height // 4) 
+            coin = Coin(coin_x, coin_y, value)
+            coin.update_floor(self.platform_index)
+            self.coins.add(coin)
+
+    def _merge_resting_coins(self) -> None:
+        """
+        Junta moedas paradas no chão que se sobrepõem numa única pilha, somando seus valores.
+        Usa a grade de colisão das moedas, então deve rodar logo após _sync_spatial_index().
+        """
+        merged = set()
+        for coin in self.coins.sprites():
+            if coin in merged or coin.collected or not coin.is_resting:
+                continue
+            absorbed = False
+            for other in self.query("coins", coin.rect):
+                if other is coin or other in merged or other.collected or not other.is_resting:
+                    continue
+                coin.absorb(other)
+                merged.add(other)
+                self.discard("coins", other)
+                absorbed = True
+            if absorbed:
+                self.spatial_index["coins"].update(coin) # A pilha pode ter crescido
+
+    def release_resources(self) -> None:
+        """
+        Libera o que o ambiente ocupa fora dele (slots de física das moedas, projéteis no pool
+        e a pasta de chunks desta sessão).
+        Chamado quando a cena de jogo é descartada.
+        """
+        for coin in self.coins.sprites():
+            coin.kill()
+        for monster in self.monsters:
+            if isinstance(monster, Dragon):
+                monster.release_projectiles()
+        self.world_generator.shutdown()
+        self.chunk_store.close()
+
     def to_dict(self) -> dict:
-        """Converte o estado do ambiente e seus sprites em um dicionário para salvamento."""
+        """
+        Converte o estado do ambiente e seus sprites em um dicionário para salvamento.
+        Inclui os chunks guardados no ChunkStore, para que o save tenha o mundo inteiro.
+        "stored_chunks" é um Future (ver ChunkStore.snapshot): os chunks que só estão em
+        disco são lidos fora da thread principal, e o SaveLoad espera por eles antes de gravar.
+        """
         trees_data = [tree.to_dict() for tree in self.trees]
         monsters_data = [monster.to_dict() for monster in self.monsters]
         coins_data = [coin.to_dict() for coin in self.coins] 
         platforms_data = [platform.to_dict() for platform in self.platforms] 
 
+        stored_chunks = self.chunk_store.snapshot(exclude=self.loaded_chunks)
+
         return {
             "trees": trees_data,
             "monsters": monsters_data,
             "coins": coins_data,
-            "platforms": platforms_data 
+            "platforms": platforms_data,
+            "world_seed": self.world_seed,
+            "loaded_chunks": sorted(self.loaded_chunks),
+            "stored_chunks": stored_chunks
         }
 
     def from_dict(self, data: dict) -> None:
         """Restaura o estado do ambiente e seus sprites a partir de um dicionário."""
         self.trees.empty() 
-        for tree_data in data.get("trees", []):
-            self.trees.add(Tree(0, 0, initial_data=tree_data)) 
-
+        for monster in self.monsters:
+            if isinstance(monster, Dragon):
+                monster.release_projectiles()
         self.monsters.empty()
-        for monster_data in data.get("monsters", []):
-            monster_type = monster_data.get("type", "Monster") 
-            if monster_type == "Dragon": 
-                self.monsters.add(Dragon(0, 0, initial_data=monster_data))
-            else:
-                self.monsters.add(Monster(0, 0, initial_data=monster_data))
+        self.ai_scheduler.reset()
+        for coin in self.coins.sprites():
+            coin.kill() # Libera os slots de física das moedas descartadas
+        self.platforms.empty() 
 
-        self.coins.empty()
-        for coin_data in data.get("coins", []):
-            self.coins.add(Coin(0, 0, initial_data=coin_data))
+        self._add_record(data)
+
+        if "world_seed" in data and data["world_seed"] != self.world_seed:
+            self.world_generator.shutdown()
+            self.world_seed = data["world_seed"]
+            self.world_generator = WorldGenerator(self.world_seed)
+        self.chunk_store.clear()
+        for chunk_x, record in data.get("stored_chunks", {}).items():
+            self.chunk_store.save(int(chunk_x), record)
+        self.loaded_chunks = set(data.get("loaded_chunks", []))
+        if not self.loaded_chunks: # Saves de antes dos chunks: o mundo cabia na tela
+            self.loaded_chunks = {0}
+        self._center_chunk = None
+        self.static_version += 1
 
-        self.platforms.empty() 
-        for platform_data in data.get("platforms", []): 
-            self.platforms.add(Platform(0, 0, 1, 1, initial_data=platform_data)) 
 
+    def enqueue(self, queue: RenderQueue) -> None:
+        """Coloca os elementos do ambiente na fila de desenho, cada grupo na sua camada."""
+        queue.add_sprites(self.platforms, LAYER_PLATFORMS)
+        queue.add_sprites(self.trees, LAYER_TREES)
+        queue.add_sprites(self.monsters, LAYER_MONSTERS)
+        queue.add_sprites(self.projectiles(), LAYER_PROJECTILES)
+        queue.add_sprites(self.coins, LAYER_COINS)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, view_rect: pygame.Rect | None = None) -> None:
         """
-        Desenha todos os elementos do ambiente na tela.
+        Desenha na tela os elementos do ambiente que estão dentro da área visível.
+        Args:
+            screen (pygame.Surface): Superfície da tela.
+            view_rect (pygame.Rect | None): Área visível em coordenadas do mundo; None é a própria tela.
         """
-        self.trees.draw(screen)
-        self.monsters.draw(screen) 
-        self.coins.draw(screen)
-        self.platforms.draw(screen)
\ No newline at end of file
+        queue = RenderQueue()
+        queue.begin(view_rect if view_rect is not None else screen.get_rect())
+        self.enqueue(queue)
+        queue.flush(screen)
\ No newline at end of file
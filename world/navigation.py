@@ -0,0 +1,172 @@
+import pygame
+from collections import deque
+from world.platform_index import PlatformIndex
+from core.settings import SCREEN_HEIGHT, MONSTER_JUMP_POWER, NAV_MAX_JUMP_GAP, NAV_EDGE_CLEARANCE
+
+GROUND_SPAN: int = 0 # O chão é sempre o vão 0 e se estende pelo mundo todo
+_WORLD_EDGE: int = 10 ** 9
+
+
+class NavLink:
+    """Ligação entre dois vãos: andar até `takeoff_x`, pular (ou só cair) e seguir até `landing_x`."""
+    __slots__ = ("source", "target", "takeoff_x", "landing_x", "jump")
+
+    def __init__(self, source: int, target: int, takeoff_x: int, landing_x: int, jump: bool) -> None:
+        self.source = source
+        self.target = target
+        self.takeoff_x = takeoff_x
+        self.landing_x = landing_x
+        self.jump = jump
+
+
+class NavGraph:
+    """
+    Grafo de navegação dos monstros: os vãos onde dá para andar (o chão e o topo de
+    cada plataforma) ligados por saltos e quedas. É montado a partir do PlatformIndex
+    só quando a geometria estática muda (ver Environment._refresh_platform_index).
+
+    As rotas são calculadas por uma busca em largura reversa a partir do vão do
+    jogador e guardadas por vão de destino: enquanto o jogador continuar no mesmo
+    vão, cada monstro só faz uma consulta de dicionário por (vão de origem, vão de destino).
+    """
+    def __init__(self, ground_y: int = SCREEN_HEIGHT - 50, jump_power: float = MONSTER_JUMP_POWER,
+                 gravity: float = 0.8, max_gap: int = NAV_MAX_JUMP_GAP,
+                 edge_clearance: int = NAV_EDGE_CLEARANCE) -> None:
+        """
+        Args:
+            ground_y (int): Altura do chão.
+            jump_power (float): Velocidade inicial do pulo dos monstros.
+            gravity (float): Gravidade dos monstros (a mesma de Monster).
+            max_gap (int): Maior distância horizontal ligada por um salto.
+            edge_clearance (int): Quanto o centro do monstro passa da borda para cair.
+        """
+        self.ground_y: int = ground_y
+        self.max_rise: float = self._jump_height(jump_power, gravity)
+        self.max_gap: int = max_gap
+        self.edge_clearance: int = edge_clearance
+
+        self._platforms: PlatformIndex | None = None
+        self.spans: list[tuple[int, int, int]] = [(-_WORLD_EDGE, _WORLD_EDGE, ground_y)] # (esquerda, direita, y)
+        self._span_ids: dict[tuple[int, int], int] = {} # (esquerda, topo) da plataforma -> vão
+        self._incoming: list[list[NavLink]] = [[]]
+        self._routes: dict[int, dict[int, NavLink]] = {} # vão de destino -> próximo salto de cada origem
+        self.searches: int = 0 # Buscas feitas desde o último rebuild (para benchmarks e o overlay)
+
+        self.target_rect: pygame.Rect | None = None
+        self.target_span: int | None = None
+
+    @staticmethod
+    def _jump_height(jump_power: float, gravity: float) -> float:
+        """Altura máxima do pulo, com a mesma integração passo a passo de Monster._apply_physics."""
+        height, velocity = 0.0, jump_power
+        while True:
+            velocity += gravity
+            if velocity >= 0:
+                return height
+            height -= velocity
+
+    def rebuild(self, platforms: PlatformIndex) -> None:
+        """Remonta vãos e ligações a partir do índice de plataformas e descarta as rotas guardadas."""
+        self._platforms = platforms
+        self.spans = [(-_WORLD_EDGE, _WORLD_EDGE, self.ground_y)]
+        self._span_ids = {}
+        for rect in platforms:
+            if rect.top < self.ground_y:
+                self._span_ids[(rect.left, rect.top)] = len(self.spans)
+                self.spans.append((rect.left, rect.right, rect.top))
+        self._incoming = [[] for _ in self.spans]
+        self._routes.clear()
+        self.searches = 0
+        self.target_span = None
+
+        for source, (left, right, top) in enumerate(self.spans):
+            if source == GROUND_SPAN:
+                candidates = range(1, len(self.spans))
+            else:
+                # Só as plataformas ao alcance de um salto para cima ou de uma queda
+                reach_top = top - int(self.max_rise)
+                reach = pygame.Rect(left - self.max_gap - self.edge_clearance, reach_top,
+                                    right - left + 2 * (self.max_gap + self.edge_clearance), self.ground_y - reach_top)
+                candidates = [self._span_ids[(rect.left, rect.top)] for rect in platforms.query(reach)
+                              if (rect.left, rect.top) in self._span_ids]
+                candidates.append(GROUND_SPAN)
+            for target in candidates:
+                if target != source:
+                    for link in self._links_between(source, target):
+                        self._incoming[target].append(link)
+
+    def _links_between(self, source: int, target: int) -> list[NavLink]:
+        left, right, top = self.spans[source]
+        target_left, target_right, target_top = self.spans[target]
+        if target_top > top: # Mais baixo: cai pelas bordas
+            links = []
+            for takeoff_x in (left - self.edge_clearance, right + self.edge_clearance):
+                landing_x = min(max(takeoff_x, target_left), target_right)
+                if abs(landing_x - takeoff_x) <= self.max_gap:
+                    links.append(NavLink(source, target, takeoff_x, landing_x, False))
+            return links
+
+        if top - target_top > self.max_rise:
+            return []
+        overlap_left, overlap_right = max(left, target_left), min(right, target_right)
+        if overlap_left < overlap_right: # Logo acima: pula no meio da sobreposição
+            if target_top == top:
+                return []
+            middle = (overlap_left + overlap_right) // 2
+            return [NavLink(source, target, middle, middle, True)]
+        if target_left >= right: # À direita
+            if target_left - right > self.max_gap:
+                return []
+            return [NavLink(source, target, right, target_left + self.edge_clearance, True)]
+        if left - target_right > self.max_gap: # À esquerda
+            return []
+        return [NavLink(source, target, left, target_right - self.edge_clearance, True)]
+
+    def span_at(self, rect: pygame.Rect) -> int | None:
+        """Vão em que um corpo com este retângulo está apoiado, ou None se estiver no ar."""
+        if rect.bottom >= self.ground_y:
+            return GROUND_SPAN
+        if self._platforms is None:
+            return None
+        for platform in self._platforms.query(pygame.Rect(rect.left, rect.bottom, rect.width, 1)):
+            if platform.top == rect.bottom:
+                return self._span_ids.get((platform.left, platform.top))
+        return None
+
+    def set_target(self, rect: pygame.Rect) -> None:
+        """
+        Define o alvo da perseguição (o jogador). Enquanto ele está no ar, o vão
+        de destino continua sendo o último em que ele esteve apoiado.
+        """
+        self.target_rect = rect
+        span = self.span_at(rect)
+        if span is not None:
+            self.target_span = span
+
+    def next_link(self, source: int | None, target: int | None) -> NavLink | None:
+        """
+        Próxima ligação no caminho de `source` até `target`, ou None se já está
+        no vão de destino ou se não há caminho.
+        """
+        if source is None or target is None or source == target:
+            return None
+        routes = self._routes.get(target)
+        if routes is None:
+            routes = self._routes[target] = self._search(target)
+        return routes.get(source)
+
+    def _search(self, target: int) -> dict[int, NavLink]:
+        """Busca em largura reversa: para cada vão que alcança `target`, a primeira ligação do caminho."""
+        self.searches += 1
+        next_hop: dict[int, NavLink] = {}
+        queue = deque([target])
+        while queue:
+            span = queue.popleft()
+            for link in self._incoming[span]:
+                if link.source != target and link.source not in next_hop:
+                    next_hop[link.source] = link
+                    queue.append(link.source)
+        return next_hop
+
+    def __len__(self) -> int:
+        return len(self.spans)
@@ -0,0 +1,142 @@
+import pygame
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, USE_NUMPY_PHYSICS
+
+try:
+    import numpy as np
+except ImportError: # NumPy é opcional: sem ele, cada sprite se atualiza sozinho
+    np = None
+
+
+class PhysicsStore:
+    """
+    Armazena posição, velocidade e flags de moedas e projéteis em arrays NumPy
+    (estrutura de arrays) e atualiza todos de uma vez: gravidade, movimento,
+    pouso no chão e descarte de quem saiu da tela.
+    Os sprites viram apenas "visões" de uma posição (slot) destes arrays.
+    """
+    FLAG_ACTIVE = 1
+    FLAG_LANDS = 2  # Para no chão (moedas)
+    FLAG_CULLED = 4 # Desativado ao sair da área visível (projéteis)
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Inicializa o armazenamento.
+        Args:
+            capacity (int): Quantidade inicial de slots; cresce sob demanda.
+        """
+        self.capacity: int = 0
+        self.sprites: list = []
+        self._free: list[int] = []
+        self._resize(capacity)
+
+    def _resize(self, capacity: int) -> None:
+        old = self.capacity
+        def grow(array, dtype, fill=0):
+            new = np.full(capacity, fill, dtype=dtype)
+            if array is not None:
+                new[:old] = array
+            return new
+
+        self.x = grow(getattr(self, "x", None), np.float64)
+        self.y = grow(getattr(self, "y", None), np.float64)
+        self.vx = grow(getattr(self, "vx", None), np.float64)
+        self.vy = grow(getattr(self, "vy", None), np.float64)
+        self.gravity = grow(getattr(self, "gravity", None), np.float64)
+        self.w = grow(getattr(self, "w", None), np.int32)
+        self.h = grow(getattr(self, "h", None), np.int32)
+        self.floor = grow(getattr(self, "floor", None), np.float64, SCREEN_HEIGHT - 50)
+        self.flags = grow(getattr(self, "flags", None), np.uint8)
+        self.rect_x = grow(getattr(self, "rect_x", None), np.int64)
+        self.rect_y = grow(getattr(self, "rect_y", None), np.int64)
+
+        self.sprites.extend([None] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def bind(self, sprite: pygame.sprite.Sprite, flags: int, vx: float = 0.0, vy: float = 0.0, gravity: float = 0.0) -> int:
+        """
+        Reserva um slot para o sprite, a partir do seu rect atual.
+        Returns:
+            int: Índice do slot, a ser guardado pelo sprite.
+        """
+        if not self._free:
+            self._resize(self.capacity * 2)
+        slot = self._free.pop()
+        rect = sprite.rect
+        self.sprites[slot] = sprite
+        self.x[slot], self.y[slot] = rect.x, rect.y
+        self.rect_x[slot], self.rect_y[slot] = rect.x, rect.y
+        self.w[slot], self.h[slot] = rect.width, rect.height
+        self.vx[slot], self.vy[slot] = vx, vy
+        self.gravity[slot] = gravity
+        self.floor[slot] = SCREEN_HEIGHT - 50
+        self.flags[slot] = flags | self.FLAG_ACTIVE
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Libera o slot para ser reutilizado."""
+        self.flags[slot] = 0
+        self.sprites[slot] = None
+        self._free.append(slot)
+
+    def set_position(self, slot: int, x: float, y: float) -> None:
+        """Atualiza a posição de um slot (quando o rect do sprite foi alterado fora do lote)."""
+        self.x[slot], self.y[slot] = x, y
+        self.rect_x[slot], self.rect_y[slot] = int(x), int(y)
+
+    def set_size(self, slot: int, w: int, h: int) -> None:
+        """Atualiza o tamanho do rect de um slot (ex.: moeda que virou uma pilha maior)."""
+        self.w[slot], self.h[slot] = w, h
+
+    def set_velocity(self, slot: int, vx: float, vy: float) -> None:
+        self.vx[slot], self.vy[slot] = vx, vy
+
+    def set_floor(self, slot: int, floor_y: float) -> None:
+        """Define a altura onde o slot para de cair (chão ou topo de plataforma)."""
+        self.floor[slot] = floor_y
+
+    @property
+    def live(self) -> int:
+        """Quantidade de slots em uso."""
+        return self.capacity - len(self._free)
+
+    def step(self, bounds: pygame.Rect | None = None) -> None:
+        """
+        Avança um passo de simulação para todos os slots ativos e copia as novas
+        posições para os rects dos sprites que de fato se moveram.
+        Args:
+            bounds (pygame.Rect | None): Área fora da qual projéteis são desativados (padrão: a tela).
+        """
+        if bounds is None:
+            bounds = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        active = (self.flags & self.FLAG_ACTIVE) != 0
+        self.vy += self.gravity * active
+        self.x += self.vx * active
+        self.y += self.vy * active
+
+        landed = active & ((self.flags & self.FLAG_LANDS) != 0) & (self.y + self.h >= self.floor)
+        self.y[landed] = self.floor[landed] - self.h[landed]
+        self.vy[landed] = 0.0
+
+        culled = active & ((self.flags & self.FLAG_CULLED) != 0) & (
+            (self.x + self.w <= bounds.left) | (self.x >= bounds.right) |
+            (self.y + self.h <= bounds.top) | (self.y >= bounds.bottom))
+        self.flags[culled] &= ~np.uint8(self.FLAG_ACTIVE)
+
+        new_x = self.x.astype(np.int64)
+        new_y = self.y.astype(np.int64)
+        moved = np.flatnonzero(active & ((new_x != self.rect_x) | (new_y != self.rect_y)))
+        self.rect_x[moved] = new_x[moved]
+        self.rect_y[moved] = new_y[moved]
+
+        # Só os sprites que mudaram de pixel são tocados em Python
+        sprites = self.sprites
+        for slot, x, y in zip(moved.tolist(), new_x[moved].tolist(), new_y[moved].tolist()):
+            sprites[slot].rect.topleft = (x, y)
+        for slot in np.flatnonzero(culled).tolist():
+            sprites[slot].is_active = False
+
+
+# Armazenamento único; None quando o NumPy não está disponível ou a opção está desligada
+physics_store: PhysicsStore | None = PhysicsStore() if np is not None and USE_NUMPY_PHYSICS else None
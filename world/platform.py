@@ -1,5 +1,6 @@
 import pygame
 from core.settings import ASSETS_DIR #
+from core.asset_manager import asset_manager
 
 class Platform(pygame.sprite.Sprite):
     """
@@ -11,20 +12,23 @@ class Platform(pygame.sprite.Sprite):
         """
         super().__init__()
         
-        try:
-            self.image = pygame.image.load(ASSETS_DIR + "images/platform.png").convert_alpha() #
-            self.image = pygame.transform.scale(self.image, (width, height)) #
-        except pygame.error:
-            print("Erro: Imagem da plataforma (platform.png) não encontrada. Usando um retângulo cinza como placeholder.")
-            self.image = pygame.Surface((width, height), pygame.SRCALPHA) #
-            self.image.fill((100, 100, 100)) 
-            pygame.draw.rect(self.image, (150, 150, 150), (0, 0, width, height), 2) 
+        self.image = asset_manager.get_image(ASSETS_DIR + "images/platform.png", (width, height),
+                                             placeholder=lambda: self._create_placeholder(width, height))
 
         self.rect = self.image.get_rect(topleft=(x, y)) #
 
         if initial_data:
             self.from_dict(initial_data)
 
+    @staticmethod
+    def _create_placeholder(width: int, height: int) -> pygame.Surface:
+        """Cria a imagem substituta usada quando platform.png não pode ser carregada."""
+        print("Erro: Imagem da plataforma (platform.png) não encontrada. Usando um retângulo cinza como placeholder.")
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        image.fill((100, 100, 100)) 
+        pygame.draw.rect(image, (150, 150, 150), (0, 0, width, height), 2) 
+        return image
+
     def to_dict(self) -> dict:
         """Converte o estado da plataforma em um dicionário para salvamento."""
         return {
@@ -36,5 +40,9 @@ class Platform(pygame.sprite.Sprite):
 
     def from_dict(self, data: dict) -> None:
         """Restaura o estado da plataforma a partir de um dicionário."""
-        self.rect.x = data.get("x", self.rect.x)
-        self.rect.y = data.get("y", self.rect.y)
\ No newline at end of file
+        width = data.get("width", self.rect.width)
+        height = data.get("height", self.rect.height)
+        if (width, height) != self.rect.size:
+            self.image = asset_manager.get_image(ASSETS_DIR + "images/platform.png", (width, height),
+                                                 placeholder=lambda: self._create_placeholder(width, height))
+        self.rect = self.image.get_rect(topleft=(data.get("x", self.rect.x), data.get("y", self.rect.y)))
\ No newline at end of file
@@ -0,0 +1,51 @@
+import bisect
+import pygame
+from typing import Iterable, Iterator
+
+
+class PlatformIndex:
+    """
+    Índice estático das plataformas, ordenado pela borda esquerda (varredura em x).
+    Uma consulta só olha as plataformas cuja borda esquerda cai na faixa
+    [x0 - maior largura, x1), encontrada por busca binária, então o custo não
+    cresce com o total de plataformas do nível. Reconstruído só quando a
+    geometria estática muda (Environment.static_version).
+    """
+    def __init__(self, platforms: Iterable[pygame.sprite.Sprite] = ()) -> None:
+        self._rects: list[pygame.Rect] = []
+        self._lefts: list[int] = []
+        self._max_width: int = 0
+        self.rebuild(platforms)
+
+    def rebuild(self, platforms: Iterable[pygame.sprite.Sprite]) -> None:
+        """Reconstrói o índice a partir dos sprites de plataforma."""
+        self._rects = sorted((pygame.Rect(platform.rect) for platform in platforms), key=lambda rect: rect.left)
+        self._lefts = [rect.left for rect in self._rects]
+        self._max_width = max((rect.width for rect in self._rects), default=0)
+
+    def _spanning(self, left: int, right: int) -> list[pygame.Rect]:
+        """Plataformas que se sobrepõem horizontalmente ao intervalo [left, right)."""
+        start = bisect.bisect_right(self._lefts, left - self._max_width)
+        end = bisect.bisect_left(self._lefts, right)
+        return [rect for rect in self._rects[start:end] if rect.right > left]
+
+    def query(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        """Retângulos das plataformas que colidem com `rect`."""
+        return [platform for platform in self._spanning(rect.left, rect.right) if platform.colliderect(rect)]
+
+    def landing_y(self, left: int, right: int, from_y: float, ground_y: float) -> float:
+        """
+        Altura onde um corpo que ocupa [left, right) na horizontal e cujos pés estão
+        em `from_y` vai parar ao cair: o topo da primeira plataforma abaixo dele ou o chão.
+        """
+        floor = ground_y
+        for platform in self._spanning(left, right):
+            if from_y <= platform.top < floor:
+                floor = platform.top
+        return floor
+
+    def __iter__(self) -> Iterator[pygame.Rect]:
+        return iter(self._rects)
+
+    def __len__(self) -> int:
+        return len(self._rects)
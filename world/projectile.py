@@ -1,13 +1,20 @@
 import pygame
 import math
-from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SFX_VOLUME #
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SFX_VOLUME, PROJECTILE_ROTATION_STEP_DEG #
+from core.asset_manager import asset_manager
+from core.rotation_cache import RotationCache
+from world.physics_store import physics_store, PhysicsStore
 
 class Projectile(pygame.sprite.Sprite):
     """
     Representa um projétil genérico (como uma bola de fogo).
     Gerencia seu movimento, dano e se pode ser repelido.
+    Instâncias podem ser reaproveitadas com reset() (ver world.projectile_pool).
     """
-    def __init__(self, x: int, y: int, target_pos: tuple[int, int], speed: int = 5, damage: int = 10) -> None:
+    _rotation_cache: RotationCache | None = None # Quadros rotacionados compartilhados por todos os projéteis
+    cull_bounds: pygame.Rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT) # Atualizada pelo Environment a partir da câmera
+
+    def __init__(self, x: int, y: int, target_pos: tuple[int, int], speed: int = 5, damage: int = 10, owner: pygame.sprite.Sprite | None = None) -> None:
         """
         Inicializa um projétil.
         Args:
@@ -16,22 +23,64 @@ class Projectile(pygame.sprite.Sprite):
             target_pos (tuple[int, int]): Posição (x, y) do alvo para onde o projétil se moverá.
             speed (int): Velocidade do projétil.
             damage (int): Dano que o projétil causa ao colidir.
+            owner (pygame.sprite.Sprite | None): Quem disparou o projétil.
         """
         super().__init__() 
+        self.in_pool: bool = False
+        self._slot: int | None = None # Slot no PhysicsStore, quando a física é em lote
+        self._speed: float = 0
+        self._direction_x: float = 0.0
+        self._direction_y: float = 0.0
+        self.reset(x, y, target_pos, speed, damage, owner)
+
+    # Velocidade e direção são propriedades para manter o PhysicsStore em dia
+    # (ex.: quando a espada repele o projétil).
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        self._speed = value
+        self._push_velocity()
+
+    @property
+    def direction_x(self) -> float:
+        return self._direction_x
+
+    @direction_x.setter
+    def direction_x(self, value: float) -> None:
+        self._direction_x = value
+        self._push_velocity()
+
+    @property
+    def direction_y(self) -> float:
+        return self._direction_y
+
+    @direction_y.setter
+    def direction_y(self, value: float) -> None:
+        self._direction_y = value
+        self._push_velocity()
 
-        try:
-            self.image = pygame.image.load("assets/images/fireball.png").convert_alpha() #
-            self.image = pygame.transform.scale(self.image, (40, 40)) #
-        except pygame.error:
-            print("Erro: Imagem da bola de fogo (fireball.png) não encontrada. Usando um círculo laranja como placeholder.")
-            self.image = pygame.Surface((40, 40), pygame.SRCALPHA) #
-            pygame.draw.circle(self.image, (255, 120, 0), (20, 20), 20) #
-        
-        self.rect = self.image.get_rect(center=(x, y)) #
-        
-        self.speed: int = speed
+    def _push_velocity(self) -> None:
+        if self._slot is not None:
+            physics_store.set_velocity(self._slot, self._direction_x * self._speed, self._direction_y * self._speed)
+
+    def kill(self) -> None:
+        """Remove o projétil de todos os grupos e libera seu slot no PhysicsStore."""
+        if self._slot is not None:
+            physics_store.release(self._slot)
+            self._slot = None
+        super().kill()
+
+    def reset(self, x: int, y: int, target_pos: tuple[int, int], speed: int = 5, damage: int = 10, owner: pygame.sprite.Sprite | None = None) -> None:
+        """
+        (Re)inicia o estado do projétil. Usado no construtor e ao reaproveitar uma instância do pool.
+        """
+        self.speed = speed
         self.damage: int = damage 
         self.is_active: bool = True 
+        self.owner: pygame.sprite.Sprite | None = owner
 
         # Atributos para repulsão
         self.repelled: bool = False #
@@ -40,6 +89,26 @@ class Projectile(pygame.sprite.Sprite):
         # NOVO: Chamar método privado para calcular direção e rotação
         self._calculate_direction_and_rotation(x, y, target_pos)
 
+        if physics_store is not None:
+            if self._slot is not None:
+                physics_store.release(self._slot)
+            self._slot = physics_store.bind(self, PhysicsStore.FLAG_CULLED,
+                                            vx=self._direction_x * self._speed, vy=self._direction_y * self._speed)
+
+    @classmethod
+    def _get_rotation_cache(cls) -> RotationCache:
+        if cls._rotation_cache is None:
+            base_image = asset_manager.get_image("assets/images/fireball.png", (40, 40), placeholder=cls._create_placeholder)
+            cls._rotation_cache = RotationCache(base_image, PROJECTILE_ROTATION_STEP_DEG)
+        return cls._rotation_cache
+
+    @staticmethod
+    def _create_placeholder() -> pygame.Surface:
+        """Cria a imagem substituta usada quando fireball.png não pode ser carregada."""
+        print("Erro: Imagem da bola de fogo (fireball.png) não encontrada. Usando um círculo laranja como placeholder.")
+        image = pygame.Surface((40, 40), pygame.SRCALPHA)
+        pygame.draw.circle(image, (255, 120, 0), (20, 20), 20)
+        return image
 
     def _calculate_direction_and_rotation(self, x: int, y: int, target_pos: tuple[int, int]) -> None: # NOVO MÉTODO PRIVADO
         """
@@ -57,7 +126,7 @@ class Projectile(pygame.sprite.Sprite):
             self.direction_y = dy / distance
 
         angle = math.degrees(math.atan2(-dy, dx)) 
-        self.image = pygame.transform.rotate(self.image, angle) #
+        self.image, _ = self._get_rotation_cache().get(angle)
         self.rect = self.image.get_rect(center=(x,y)) #
 
 
@@ -65,7 +134,7 @@ class Projectile(pygame.sprite.Sprite):
         """
         Atualiza a posição do projétil a cada frame.
         """
-        if not self.is_active: 
+        if not self.is_active or self._slot is not None: # Em lote, quem move o projétil é o PhysicsStore
             return
 
         self.rect.x += self.direction_x * self.speed
@@ -75,10 +144,9 @@ class Projectile(pygame.sprite.Sprite):
 
     def _check_boundary(self) -> None: # NOVO MÉTODO PRIVADO
         """
-        Verifica se o projétil saiu dos limites da tela e o desativa se sim.
+        Verifica se o projétil saiu da área ao redor da câmera e o desativa se sim.
         """
-        screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT) #
-        if not screen_rect.colliderect(self.rect): 
+        if not Projectile.cull_bounds.colliderect(self.rect): 
             self.is_active = False 
 
     def draw(self, screen: pygame.Surface) -> None:
@@ -0,0 +1,67 @@
+import pygame
+from world.projectile import Projectile
+from core.settings import PROJECTILE_POOL_MAX_SIZE
+
+
+class ProjectilePool:
+    """
+    Pool de projéteis: instâncias inativas são guardadas e reaproveitadas
+    em vez de criar um Projectile novo a cada disparo.
+    """
+    def __init__(self, max_size: int = PROJECTILE_POOL_MAX_SIZE) -> None:
+        """
+        Inicializa o pool.
+        Args:
+            max_size (int): Quantidade máxima de projéteis inativos guardados.
+        """
+        self.max_size: int = max_size
+        self._free: list[Projectile] = []
+        self.live: int = 0            # Projéteis em jogo
+        self.total_allocated: int = 0 # Projéteis já criados desde o início
+
+    @property
+    def pooled(self) -> int:
+        """Projéteis inativos à espera de reuso."""
+        return len(self._free)
+
+    def acquire(self, x: int, y: int, target_pos: tuple[int, int], speed: int = 5, damage: int = 10,
+                owner: pygame.sprite.Sprite | None = None) -> Projectile:
+        """
+        Retorna um projétil pronto para uso, reaproveitando um inativo quando houver.
+        """
+        if self._free:
+            projectile = self._free.pop()
+            projectile.in_pool = False
+            projectile.reset(x, y, target_pos, speed, damage, owner)
+        else:
+            projectile = Projectile(x, y, target_pos, speed, damage, owner)
+            self.total_allocated += 1
+        self.live += 1
+        return projectile
+
+    def release(self, projectile: Projectile) -> None:
+        """
+        Tira o projétil de todos os grupos e o devolve ao pool.
+        Chamar mais de uma vez para o mesmo projétil não tem efeito.
+        """
+        if projectile.in_pool:
+            return
+        projectile.kill()
+        projectile.is_active = False
+        projectile.owner = None
+        projectile.in_pool = True
+        self.live = max(0, self.live - 1)
+        if len(self._free) < self.max_size:
+            self._free.append(projectile)
+
+    def stats(self) -> dict:
+        """Retorna os contadores do pool."""
+        return {
+            "live": self.live,
+            "pooled": self.pooled,
+            "total_allocated": self.total_allocated
+        }
+
+
+# Pool compartilhado por todos os dragões
+projectile_pool = ProjectilePool()
@@ -0,0 +1,102 @@
+import pygame
+from typing import Iterable
+from core.settings import SPATIAL_HASH_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Grade uniforme que indexa sprites pelas células cobertas por seus retângulos.
+    Consultas por área só olham as células próximas, em vez de todos os sprites.
+    A ordem dos resultados é determinística (ordem de inserção nas células).
+    """
+    def __init__(self, cell_size: int = SPATIAL_HASH_CELL_SIZE) -> None:
+        """
+        Inicializa a grade.
+        Args:
+            cell_size (int): Tamanho, em pixels, do lado de cada célula.
+        """
+        self.cell_size: int = cell_size
+        self._cells: dict[tuple[int, int], dict[pygame.sprite.Sprite, None]] = {}
+        self._sprite_ranges: dict[pygame.sprite.Sprite, tuple[int, int, int, int]] = {}
+
+    def _cell_range(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _add_to_cells(self, sprite: pygame.sprite.Sprite, cell_range: tuple[int, int, int, int]) -> None:
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._cells.setdefault((cx, cy), {})[sprite] = None
+
+    def _remove_from_cells(self, sprite: pygame.sprite.Sprite, cell_range: tuple[int, int, int, int]) -> None:
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(sprite, None)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        """Adiciona o sprite (ou atualiza sua posição, se já estiver na grade)."""
+        self.update(sprite)
+
+    def update(self, sprite: pygame.sprite.Sprite) -> None:
+        """Move o sprite para as células atuais, só mexendo na grade se elas mudaram."""
+        new_range = self._cell_range(sprite.rect)
+        old_range = self._sprite_ranges.get(sprite)
+        if old_range == new_range:
+            return
+        if old_range is not None:
+            self._remove_from_cells(sprite, old_range)
+        self._add_to_cells(sprite, new_range)
+        self._sprite_ranges[sprite] = new_range
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        """Retira o sprite da grade (não faz nada se ele não estiver nela)."""
+        old_range = self._sprite_ranges.pop(sprite, None)
+        if old_range is not None:
+            self._remove_from_cells(sprite, old_range)
+
+    def sync(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """
+        Deixa a grade igual à coleção informada: atualiza quem se moveu,
+        insere os novos e remove os que não fazem mais parte dela.
+        """
+        present = set()
+        for sprite in sprites:
+            present.add(sprite)
+            self.update(sprite)
+        for sprite in [s for s in self._sprite_ranges if s not in present]:
+            self.remove(sprite)
+
+    def query(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """
+        Retorna os sprites cujo retângulo colide com `rect`.
+        Args:
+            rect (pygame.Rect): Área de busca.
+        Returns:
+            list[pygame.sprite.Sprite]: Sprites encontrados, sem repetição.
+        """
+        x0, y0, x1, y1 = self._cell_range(rect)
+        found: dict[pygame.sprite.Sprite, None] = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return [sprite for sprite in found if rect.colliderect(sprite.rect)]
+
+    def clear(self) -> None:
+        """Esvazia a grade."""
+        self._cells.clear()
+        self._sprite_ranges.clear()
+
+    def __contains__(self, sprite: pygame.sprite.Sprite) -> bool:
+        return sprite in self._sprite_ranges
+
+    def __len__(self) -> int:
+        return len(self._sprite_ranges)
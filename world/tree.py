@@ -1,5 +1,7 @@
 import pygame
 from core.settings import COINS_PER_TREE_CUT # [cite: 9a]
+from core.asset_manager import asset_manager
+from core.log import game_log
 
 class Tree(pygame.sprite.Sprite):
     """
@@ -14,14 +16,7 @@ class Tree(pygame.sprite.Sprite):
             initial_data (dict | None): Dados para restaurar o estado da árvore.
         """
         super().__init__()
-        try:
-            self.image = pygame.image.load("assets/images/tree.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (120, 180)) # Tamanho da árvore [cite: 9a]
-        except pygame.error:
-            print("Erro: Imagem da árvore (tree.png) não encontrada. Usando um retângulo verde como placeholder.")
-            self.image = pygame.Surface((120, 180), pygame.SRCALPHA) # Placeholder [cite: 9a]
-            self.image.fill((0, 100, 0)) # Verde escuro
-            pygame.draw.rect(self.image, (139, 69, 19), (40, 150, 40, 30)) # Tronco marrom no placeholder [cite: 9a]
+        self.image = asset_manager.get_image("assets/images/tree.png", (120, 180), placeholder=self._create_placeholder)
 
         self.rect = self.image.get_rect(topleft=(x, y))
         self.health: int = 3 # Quantos "hits" para cortar a árvore
@@ -31,6 +26,15 @@ class Tree(pygame.sprite.Sprite):
         if initial_data: # Restaura o estado da árvore se dados forem fornecidos
             self.from_dict(initial_data)
 
+    @staticmethod
+    def _create_placeholder() -> pygame.Surface:
+        """Cria a imagem substituta usada quando tree.png não pode ser carregada."""
+        print("Erro: Imagem da árvore (tree.png) não encontrada. Usando um retângulo verde como placeholder.")
+        image = pygame.Surface((120, 180), pygame.SRCALPHA)
+        image.fill((0, 100, 0)) # Verde escuro
+        pygame.draw.rect(image, (139, 69, 19), (40, 150, 40, 30)) # Tronco marrom no placeholder
+        return image
+
     def take_hit(self, damage: int) -> int:
         """
         Recebe dano. Reduz a saúde da árvore e retorna moedas se for cortada.
@@ -46,7 +50,7 @@ class Tree(pygame.sprite.Sprite):
         # print(f"Árvore atingida! Vida restante: {self.health}") # Debug removido
         if self.health <= 0:
             self.is_cut = True
-            print("Árvore cortada!")
+            game_log.info("Árvore cortada!")
             # TODO: Tocar som de árvore caindo/cortando
             return self.coins_on_cut
         return 0
@@ -77,6 +81,7 @@ class Tree(pygame.sprite.Sprite):
         self.is_cut = data.get("is_cut", self.is_cut)
 import pygame
 from core.settings import COINS_PER_TREE_CUT #
+from core.asset_manager import asset_manager
 
 class Tree(pygame.sprite.Sprite):
     """
@@ -91,14 +96,7 @@ class Tree(pygame.sprite.Sprite):
             initial_data (dict | None): Dados para restaurar o estado da árvore.
         """
         super().__init__()
-        try:
-            self.image = pygame.image.load("assets/images/tree.png").convert_alpha() #
-            self.image = pygame.transform.scale(self.image, (120, 180)) #
-        except pygame.error:
-            print("Erro: Imagem da árvore (tree.png) não encontrada. Usando um retângulo verde como placeholder.")
-            self.image = pygame.Surface((120, 180), pygame.SRCALPHA) #
-            self.image.fill((0, 100, 0)) # Verde escuro
-            pygame.draw.rect(self.image, (139, 69, 19), (40, 150, 40, 30)) #
+        self.image = asset_manager.get_image("assets/images/tree.png", (120, 180), placeholder=self._create_placeholder)
 
         self.rect = self.image.get_rect(topleft=(x, y))
         self.health: int = 3 
@@ -108,6 +106,15 @@ class Tree(pygame.sprite.Sprite):
         if initial_data: 
             self.from_dict(initial_data)
 
+    @staticmethod
+    def _create_placeholder() -> pygame.Surface:
+        """Cria a imagem substituta usada quando tree.png não pode ser carregada."""
+        print("Erro: Imagem da árvore (tree.png) não encontrada. Usando um retângulo verde como placeholder.")
+        image = pygame.Surface((120, 180), pygame.SRCALPHA)
+        image.fill((0, 100, 0)) # Verde escuro
+        pygame.draw.rect(image, (139, 69, 19), (40, 150, 40, 30)) # Tronco marrom no placeholder
+        return image
+
     def take_hit(self, damage: int) -> int:
         """
         Recebe dano. Reduz a saúde da árvore e retorna moedas se for cortada.
@@ -122,7 +129,7 @@ class Tree(pygame.sprite.Sprite):
         self.health -= damage
         if self.health <= 0:
             self.is_cut = True
-            print("Árvore cortada!")
+            game_log.info("Árvore cortada!")
             return self.coins_on_cut
         return 0
 
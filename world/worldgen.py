@@ -0,0 +1,137 @@
+"""
+Geração procedural e determinística dos chunks do mundo.
+
+generate_chunk(world_seed, chunk_x) sempre devolve o mesmo layout para os mesmos
+argumentos e não depende do pygame nem do RNG global, então pode rodar em outro
+processo. O resultado é um dicionário simples no formato de Environment.to_dict.
+"""
+import multiprocessing
+import random
+from concurrent.futures import Future, ProcessPoolExecutor
+from core.settings import (CHUNK_WIDTH, SCREEN_HEIGHT, WORLDGEN_WORKERS, WORLDGEN_LOOKAHEAD_CHUNKS,
+                           WORLDGEN_DRAGON_CHANCE)
+
+
+def generate_chunk(world_seed: int, chunk_x: int) -> dict:
+    """
+    Gera o layout de um chunk (árvores, monstros, dragões e plataformas).
+    Args:
+        world_seed (int): Semente do mundo.
+        chunk_x (int): Índice do chunk.
+    Returns:
+        dict: Listas "trees", "monsters", "coins" e "platforms" com os dados de cada elemento.
+    """
+    rng = random.Random(f"{world_seed}:{chunk_x}") # Semente em texto: estável entre processos e execuções
+    origin_x = chunk_x * CHUNK_WIDTH
+    ground_y_top = SCREEN_HEIGHT - 50
+
+    trees = []
+    for _ in range(rng.randint(2, 4)):
+        trees.append({"x": origin_x + rng.randint(100, CHUNK_WIDTH - 200), "y": ground_y_top - 180})
+
+    monsters = []
+    for _ in range(rng.randint(1, 3)):
+        x = origin_x + rng.randint(150, CHUNK_WIDTH - 150)
+        monsters.append({"type": "Monster", "x": x, "y": ground_y_top - 90, "patrol_start_x": x})
+
+    if chunk_x == 0 or rng.random() < WORLDGEN_DRAGON_CHANCE: # O chunk inicial sempre tem o seu dragão
+        x = origin_x + rng.randint(CHUNK_WIDTH // 8, CHUNK_WIDTH // 2)
+        monsters.append({"type": "Dragon", "x": x, "y": 150, "patrol_start_x": x})
+
+    # Plataformas em degraus, uma em cada terço do chunk
+    platforms = []
+    third = CHUNK_WIDTH // 3
+    for i in range(3):
+        width = rng.choice((100, 150, 200))
+        x = origin_x + i * third + rng.randint(0, third - width)
+        y = ground_y_top - 150 - 100 * rng.randint(0, 2)
+        platforms.append({"x": x, "y": y, "width": width, "height": 30})
+
+    return {"trees": trees, "monsters": monsters, "coins": [], "platforms": platforms}
+
+
+_pool: ProcessPoolExecutor | None = None # Pool único do jogo, reaproveitado entre cenas e partidas
+_pool_failed: bool = False
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor | None:
+    """
+    Retorna o pool de geração, criando-o no primeiro uso. Os processos são iniciados
+    com "spawn": um fork copiaria o processo com as threads de fundo (log, saves,
+    chunks) no meio do que estavam fazendo.
+    """
+    global _pool, _pool_failed
+    if _pool is None and not _pool_failed and workers > 0:
+        try:
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        except (OSError, NotImplementedError, ImportError, ValueError) as e:
+            print(f"Erro ao criar o pool de geração do mundo ({e}). Gerando chunks na thread principal.")
+            _pool_failed = True
+    return _pool
+
+
+def shutdown_pool() -> None:
+    """Encerra o pool de geração compartilhado. Chamado uma vez, na saída do jogo."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+class WorldGenerator:
+    """
+    Pré-gera chunks no pool de processos do jogo, à frente do jogador.
+    Nada aqui bloqueia: se um chunk for pedido antes de o processo terminar,
+    ele é gerado na hora (é barato e o resultado é o mesmo, por ser determinístico).
+    """
+    def __init__(self, world_seed: int, workers: int = WORLDGEN_WORKERS,
+                 lookahead: int = WORLDGEN_LOOKAHEAD_CHUNKS) -> None:
+        """
+        Inicializa o gerador.
+        Args:
+            world_seed (int): Semente do mundo.
+            workers (int): Processos do pool (usado por quem o cria primeiro); 0 desativa a pré-geração.
+            lookahead (int): Chunks pré-gerados além dos pedidos em prefetch.
+        """
+        self.world_seed: int = world_seed
+        self.workers: int = workers
+        self.lookahead: int = lookahead
+        self._pending: dict[int, Future] = {}
+        self.generated_inline: int = 0 # Chunks que não estavam prontos a tempo
+        self.generated_in_pool: int = 0
+
+    def prefetch(self, chunk_xs) -> None:
+        """Agenda a geração dos chunks informados, se ainda não estiverem agendados."""
+        executor = _get_pool(self.workers)
+        if executor is None:
+            return
+        for chunk_x in chunk_xs:
+            if chunk_x not in self._pending:
+                try:
+                    self._pending[chunk_x] = executor.submit(generate_chunk, self.world_seed, chunk_x)
+                except RuntimeError: # Pool já encerrado (saída do jogo) ou quebrado
+                    return
+
+    def take(self, chunk_x: int) -> dict:
+        """
+        Retorna o layout do chunk: o pré-gerado, se já estiver pronto, ou um gerado agora.
+        """
+        future = self._pending.pop(chunk_x, None)
+        if future is not None and future.done() and not future.cancelled() and future.exception() is None:
+            self.generated_in_pool += 1
+            return future.result()
+        if future is not None:
+            future.cancel()
+        self.generated_inline += 1
+        return generate_chunk(self.world_seed, chunk_x)
+
+    def discard(self, keep) -> None:
+        """Esquece pré-gerações de chunks fora de `keep` (o jogador mudou de direção)."""
+        for chunk_x in [c for c in self._pending if c not in keep]:
+            self._pending.pop(chunk_x).cancel()
+
+    def shutdown(self) -> None:
+        """Cancela as pré-gerações deste gerador. O pool continua vivo para a próxima partida."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()